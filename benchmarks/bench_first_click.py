@@ -0,0 +1,53 @@
+"""Замер задержки первого клика и пропускной способности этапов подготовки поля"""
+
+__author__ = 'Шеряков Д.И.'
+
+from statistics import median
+from time import perf_counter
+
+from src.enums import ActionType
+from src.model import MinesweeperModel
+
+
+def bench_first_click(size: int, budget_ms: float | None, density: float = 0.2, games: int = 5) -> None:
+    """
+    Делает первый клик в центр поля и печатает медиану времени ответа, время досчёта остальных чисел
+        и пропускную способность каждого этапа подготовки поля
+
+    Args:
+        size: сторона квадратного поля
+        budget_ms: бюджет первого клика, None - досчитывать все числа сразу
+        density: доля мин на поле
+        games: кол-во партий
+    """
+    first_clicks: list[float] = []
+    preparations: list[float] = []
+    model: MinesweeperModel | None = None
+    for game in range(games):
+        model = MinesweeperModel(size, size, int(size * size * density), seed=game)
+        model.first_click_budget_ms = budget_ms
+
+        start: float = perf_counter()
+        model(size // 2, size // 2, ActionType.OPEN)
+        first_clicks.append(perf_counter() - start)
+
+        start = perf_counter()
+        model.finish_preparation()
+        preparations.append(perf_counter() - start)
+
+    stages: str = ', '.join(
+        f'{phase} {throughput.cells_per_second / 1e6:.2f} M/s' for phase, throughput in model.throughput.items()
+    )
+    print(f'{size:>5}x{size:<5} budget {budget_ms!s:>5} ms: first click {median(first_clicks) * 1000:8.2f} ms, '
+          f'rest {median(preparations) * 1000:8.2f} ms; {stages}')
+
+
+def main() -> None:
+    """Запуск замера для полей 100x100, 300x300 и 1000x1000 без бюджета и с бюджетом по умолчанию"""
+    for size in (100, 300, 1000):
+        for budget_ms in (None, MinesweeperModel.first_click_budget_ms):
+            bench_first_click(size, budget_ms, games=5 if size < 1000 else 2)
+
+
+if __name__ == '__main__':
+    main()
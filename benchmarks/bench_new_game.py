@@ -0,0 +1,83 @@
+"""
+Замер времени новой игры и кол-ва объектов Tk при пересоздании игровой доски. Нужен дисплей. Для сравнения
+    с исходной версией без пула клеток скрипт запускается из корня её рабочей копии:
+    PYTHONPATH=. python <путь к этому репозиторию>/benchmarks/bench_new_game.py
+"""
+
+__author__ = 'Шеряков Д.И.'
+
+from itertools import cycle
+from time import perf_counter
+
+from src.enums import Difficulty
+from src.view import MinesweeperView
+
+
+def count_tk_objects(view: MinesweeperView) -> tuple[int, int]:
+    """
+    Считает объекты Tk
+
+    Args:
+        view: представление игры
+
+    Returns:
+        Кол-во виджетов и кол-во команд Tcl (виджеты и зарегистрированные python-обработчики)
+    """
+    widgets: int = 0
+    stack: list = [view]
+    while stack:
+        widget = stack.pop()
+        widgets += 1
+        stack.extend(widget.winfo_children())
+
+    return widgets, len(view.tk.call('info', 'commands'))
+
+
+def bind_click_handlers(view: MinesweeperView) -> None:
+    """
+    Привязывает обработчики кликов так же, как контроллер: один обработчик на кнопку мыши для всех клеток,
+        а в версии без MinesweeperView.bind_cells - два обработчика на каждую клетку после каждой новой игры
+
+    Args:
+        view: представление игры
+    """
+    if hasattr(view, 'bind_cells'):
+        return
+
+    for list_of_cells in view.board_view:
+        for cell in list_of_cells:
+            cell.bind('<ButtonPress-1>', lambda e, r=cell.row, c=cell.col: None)
+            cell.bind('<ButtonPress-3>', lambda e, r=cell.row, c=cell.col: None)
+
+
+def bench_new_game(iterations: int = 50) -> None:
+    """
+    Пересоздаёт доску по кругу для всех уровней сложности и печатает среднее время и кол-во объектов Tk
+
+    Args:
+        iterations: кол-во пересозданий доски
+    """
+    view = MinesweeperView()
+    if hasattr(view, 'bind_cells'):
+        view.bind_cells('<ButtonPress-1>', lambda e, r, c: None)
+        view.bind_cells('<ButtonPress-3>', lambda e, r, c: None)
+    bind_click_handlers(view)
+    view.update()
+
+    difficulties = cycle([Difficulty.HARD, Difficulty.EASY, Difficulty.NORMAL])
+
+    start: float = perf_counter()
+    for _ in range(iterations):
+        view.difficulty_radio.set(next(difficulties))  # Вызывает relating_board
+        bind_click_handlers(view)
+        view.update()
+    elapsed: float = perf_counter() - start
+
+    widgets, tcl_commands = count_tk_objects(view)
+    print(f'new game: {elapsed / iterations * 1000:.2f} ms, widgets: {widgets}, tcl commands: {tcl_commands}')
+
+    view.destroy()
+
+
+if __name__ == '__main__':
+    bench_new_game()
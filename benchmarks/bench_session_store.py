@@ -0,0 +1,69 @@
+"""Замер времени восстановления хранилища сессий с ленивым и немедленным повтором хвостов журнала"""
+
+__author__ = 'Шеряков Д.И.'
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.enums import ActionType
+from src.session_store import SessionStore
+
+ACTIONS: list[tuple[int, int, ActionType]] = [
+    (8, 8, ActionType.OPEN), (0, 0, ActionType.MARK), (15, 15, ActionType.OPEN), (3, 12, ActionType.OPEN),
+]
+
+
+def fill_store(directory: Path, sessions: int) -> None:
+    """
+    Создаёт сессии 16x16 с 40 минами: все сессии попадают в снимок после первого действия, у половины сессий
+        остаётся хвост журнала из трёх действий после снимка
+
+    Args:
+        directory: каталог хранилища
+        sessions: кол-во сессий
+    """
+    with SessionStore(directory, snapshot_every=0) as store:
+        for index in range(sessions):
+            store.create(f's{index}', 16, 16, 40, seed=index)
+            store.apply(f's{index}', *ACTIONS[0])
+        store.checkpoint()
+
+        for index in range(0, sessions, 2):
+            for action in ACTIONS[1:]:
+                store.apply(f's{index}', *action)
+
+
+def bench_recover(sessions: int) -> None:
+    """
+    Восстанавливает хранилище лениво и с немедленным повтором хвостов в одном процессе и печатает время открытия
+        и время первого обращения к сессии с хвостом
+
+    Args:
+        sessions: кол-во сессий
+    """
+    with TemporaryDirectory(prefix='minesweeper-sessions-') as directory:
+        fill_store(Path(directory), sessions)
+
+        for name, workers in (('lazy', 0), ('eager', 1)):
+            start: float = perf_counter()
+            store = SessionStore.recover(Path(directory), workers=workers)
+            recover_seconds: float = perf_counter() - start
+
+            start = perf_counter()
+            store.get('s0')
+            get_seconds: float = perf_counter() - start
+            store.close()
+
+            print(f'{sessions:>7} sessions, {name:>5}: recover {recover_seconds:7.2f} s, '
+                  f'first get {get_seconds * 1000:6.2f} ms')
+
+
+def main() -> None:
+    """Запуск замера для 10 тысяч, 30 тысяч и 100 тысяч сессий"""
+    for sessions in (10_000, 30_000, 100_000):
+        bench_recover(sessions)
+
+
+if __name__ == '__main__':
+    main()
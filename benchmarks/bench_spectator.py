@@ -0,0 +1,69 @@
+"""Замер задержки трансляции действий игрока разному кол-ву зрителей"""
+
+__author__ = 'Шеряков Д.И.'
+
+from random import Random
+from statistics import mean, quantiles
+from time import perf_counter
+
+from src.dataclasses_ import MinesweeperResponse
+from src.enums import OverflowPolicy, VisibleCell
+from src.model import MinesweeperModel
+from src.solver import SinglePointPolicy
+from src.spectator import SpectatorHub
+
+
+def bench_spectators(subscribers: int, games: int = 20, drain_every: int = 4, slow_share: float = 0.1) -> None:
+    """
+    Играет партии политикой SinglePointPolicy через SpectatorHub и печатает время действия игрока вместе
+        с рассылкой. Зрители забирают кадры раз в drain_every решений политики, а доля slow_share зрителей
+        не забирает их никогда и раз за разом переполняет очередь
+
+    Args:
+        subscribers: кол-во зрителей
+        games: кол-во партий
+        drain_every: через сколько решений политики зрители забирают кадры
+        slow_share: доля зрителей, которые не забирают кадры
+    """
+    rng = Random(0)
+    policy = SinglePointPolicy()
+    latencies: list[float] = []
+    resyncs: int = 0
+    for game in range(games):
+        model = MinesweeperModel(30, 16, 99, seed=game)
+        hub = SpectatorHub(model, queue_size=16, overflow=OverflowPolicy.RESYNC)
+        fast = [hub.subscribe() for _ in range(int(subscribers * (1 - slow_share)))]
+        slow = [hub.subscribe() for _ in range(subscribers - len(fast))]
+
+        step: int = 0
+        while not model.is_gameover:
+            for row, col, action_type in policy(model.get_visible_board(), rng):
+                if model.get_visible_cell(row, col) != VisibleCell.HIDDEN:
+                    continue
+
+                start: float = perf_counter()
+                response: MinesweeperResponse = hub(row, col, action_type)
+                latencies.append(perf_counter() - start)
+                if response.is_gameover:
+                    break
+
+            step += 1
+            if step % drain_every == 0:
+                for subscriber in fast:
+                    subscriber.drain()
+
+        resyncs += sum(subscriber.resyncs for subscriber in slow)
+
+    p99: float = quantiles(latencies, n=100)[98] if len(latencies) > 1 else latencies[0]
+    print(f'{subscribers:>6} subscribers: mean {mean(latencies) * 1000:7.3f} ms, p99 {p99 * 1000:7.3f} ms, '
+          f'{len(latencies)} actions, {resyncs} resyncs')
+
+
+def main() -> None:
+    """Запуск замера для 10, 1000 и 10000 зрителей"""
+    for subscribers in (10, 1_000, 10_000):
+        bench_spectators(subscribers)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Сравнение скорости игры на разных топологиях поля"""
+
+__author__ = 'Шеряков Д.И.'
+
+from random import Random
+from time import perf_counter
+
+from src.enums import ActionType
+from src.model import MinesweeperModel
+from src.solver import RandomPolicy, iter_positions
+from src.topology import HexTopology, RectangleTopology, Topology, TorusTopology
+
+
+def bench_topology(name: str, topology: Topology, mines: int, games: int = 20) -> None:
+    """
+    Играет партии случайными ходами и печатает среднее время партии и время подготовки поля: первый клик в центр
+        и досчёт всех чисел
+
+    Args:
+        name: название топологии
+        topology: топология
+        mines: кол-во мин
+        games: кол-во партий
+    """
+    rng = Random(0)
+    game_seconds: float = 0.0
+    preparing_seconds: float = 0.0
+    for game in range(games):
+        model = MinesweeperModel(topology.rows, topology.cols, mines, seed=game, topology=topology)
+
+        start: float = perf_counter()
+        model(topology.rows // 2, topology.cols // 2, ActionType.OPEN)
+        model.finish_preparation(None)
+        preparing_seconds += perf_counter() - start
+
+        model = MinesweeperModel(topology.rows, topology.cols, mines, seed=game, topology=topology)
+        start = perf_counter()
+        for _ in iter_positions(model, RandomPolicy(), rng):
+            pass
+        game_seconds += perf_counter() - start
+
+    print(f'{name:>10}: preparing {preparing_seconds / games * 1000:7.2f} ms, '
+          f'game {game_seconds / games * 1000:8.2f} ms')
+
+
+def main(rows: int = 100, cols: int = 100, mines: int = 1000) -> None:
+    """Запуск сравнения для всех топологий одного размера"""
+    topologies: dict[str, Topology] = {}
+    for name, topology_class in (('rectangle', RectangleTopology), ('torus', TorusTopology), ('hex', HexTopology)):
+        start: float = perf_counter()
+        topologies[name] = topology_class(rows, cols)
+        print(f'{name:>10}: topology for {rows}x{cols} {(perf_counter() - start) * 1000:.2f} ms')
+
+    for name, topology in topologies.items():
+        bench_topology(name, topology, mines)
+
+
+if __name__ == '__main__':
+    main()
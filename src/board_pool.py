@@ -0,0 +1,112 @@
+"""Модуль с пулом заранее сгенерированных игровых полей"""
+
+__author__ = 'Шеряков Д.И.'
+
+from collections import deque
+from threading import Condition, Thread
+from time import perf_counter
+from typing import Iterable
+
+from .dataclasses_ import BoardLayout, BoardPoolMetrics
+from .model import MinesweeperModel
+
+
+class BoardPool:
+    """
+    Класс-фабрика полей. Фоновый поток держит ограниченный запас заранее сгенерированных полей для каждой
+        конфигурации (строки, столбцы, мины), чтобы новая игра не тратила время на расстановку мин и подсчёт чисел
+    """
+
+    def __init__(self, configurations: Iterable[tuple[int, int, int]], size: int = 2) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            configurations: конфигурации (строки, столбцы, мины), для которых держим запас полей
+            size: максимальное кол-во полей в запасе для одной конфигурации
+        """
+        self.size: int = size
+        self.metrics: BoardPoolMetrics = BoardPoolMetrics()
+
+        self._layouts: dict[tuple[int, int, int], deque[BoardLayout]] = {
+            tuple(configuration): deque() for configuration in configurations
+        }
+
+        self._condition: Condition = Condition()
+        self._is_running: bool = False
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        """Запускает фоновое пополнение пула"""
+        with self._condition:
+            if self._is_running:
+                return
+            self._is_running = True
+
+        self._thread = Thread(target=self._refill_loop, name='board-pool', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Останавливает фоновое пополнение пула"""
+        with self._condition:
+            self._is_running = False
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def take(self, rows: int, cols: int, mines: int) -> BoardLayout | None:
+        """
+        Забирает готовое поле из пула не дожидаясь генерации
+
+        Args:
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+            mines: Кол-во мин на игровом поле
+
+        Returns:
+            Заранее сгенерированное поле или None, если запас для конфигурации пуст
+        """
+        configuration: tuple[int, int, int] = (rows, cols, mines)
+        with self._condition:
+            layouts: deque[BoardLayout] = self._layouts.setdefault(configuration, deque())
+            if not layouts:
+                self.metrics.misses += 1
+                self._condition.notify_all()
+                return None
+
+            self.metrics.hits += 1
+            layout: BoardLayout = layouts.popleft()
+            self._condition.notify_all()
+
+        return layout
+
+    def _refill_loop(self) -> None:
+        """Цикл фонового потока: генерирует поля, пока в пуле есть место"""
+        while True:
+            with self._condition:
+                configuration: tuple[int, int, int] | None = self._get_configuration_to_refill()
+                while self._is_running and configuration is None:
+                    self._condition.wait()
+                    configuration = self._get_configuration_to_refill()
+
+                if not self._is_running:
+                    return
+
+            start: float = perf_counter()
+            layout: BoardLayout = MinesweeperModel.pregenerate_layout(*configuration)
+            elapsed: float = perf_counter() - start
+
+            with self._condition:
+                self._layouts[configuration].append(layout)
+                self.metrics.refills += 1
+                self.metrics.refill_seconds += elapsed
+                self.metrics.last_refill_seconds = elapsed
+                self._condition.notify_all()
+
+    def _get_configuration_to_refill(self) -> tuple[int, int, int] | None:
+        """Возвращает конфигурацию с наименьшим запасом полей или None, если пул заполнен"""
+        configuration, layouts = min(self._layouts.items(), key=lambda item: len(item[1]), default=(None, ()))
+
+        return configuration if len(layouts) < self.size else None
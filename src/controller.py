@@ -4,39 +4,50 @@ __author__ = 'Шеряков Д.И.'
 
 from tkinter import Event, messagebox
 
+from .board_pool import BoardPool
 from .model import MinesweeperModel
 from .view import DIFFICULTY_MAPPING, MinesweeperView
-from .enums import ActionType
-from .dataclasses_ import CellView, Cell, MinesweeperResponse
+from .enums import ActionType, Tile, VisibleCell
+from .dataclasses_ import MinesweeperResponse
+from .render_scheduler import RenderScheduler
 
 
 class MinesweeperController:
     """Класс-контроллер игры сапёр"""
 
+    preparation_budget_ms: float = 8.0   # Время одной части досчёта поля между событиями gui
+
     def __init__(self) -> None:
         """Инициализация параметров"""
         self.view: MinesweeperView = MinesweeperView()
-        self.model: MinesweeperModel = MinesweeperModel(*DIFFICULTY_MAPPING[self.view.difficulty_radio.get()])
+
+        self.board_pool: BoardPool = BoardPool(DIFFICULTY_MAPPING.values())
+        self.board_pool.start()
+
+        self.model: MinesweeperModel = self._create_model()
+        self._preparing_model: MinesweeperModel | None = None   # Модель, для которой уже запланирован досчёт
+
+        self._game_over_cells: dict[tuple[int, int], Tile] = {}
+        self.render_scheduler: RenderScheduler = RenderScheduler(
+            self.view,
+            lambda row, col: self.view.board_view[row][col],
+            self._get_gui_cell_state,
+            lambda tile: self.view.tiles[tile],
+        )
 
     def __call__(self) -> None:
         self._add_commands_for_cells()
         self._add_commands_for_file_menu()
+        self._add_commands_for_difficulty_menu()
+        self._add_commands_for_zoom_menu()
         self._add_commands_for_help_menu()
 
         self.view()
 
     def _add_commands_for_cells(self):
-        """Добавляет команды для клеток(кнопок)"""
-        for list_cells in self.view.board_view:
-            for cell in list_cells:
-                cell.bind(
-                    '<ButtonPress-1>',
-                    lambda e, r=cell.row, c=cell.col, action=ActionType.OPEN: self._cell_click(e, r, c, action)
-                )
-                cell.bind(
-                    '<ButtonPress-3>',
-                    lambda e, r=cell.row, c=cell.col, action=ActionType.MARK: self._cell_click(e, r, c, action)
-                )
+        """Добавляет команды для клеток(кнопок). Обработчик один на все клетки, в том числе переиспользованные"""
+        self.view.bind_cells('<ButtonPress-1>', lambda e, r, c: self._cell_click(e, r, c, ActionType.OPEN))
+        self.view.bind_cells('<ButtonPress-3>', lambda e, r, c: self._cell_click(e, r, c, ActionType.MARK))
 
     def _cell_click(self, _event: Event, clicked_cell_row: int, clicked_cell_col: int, action_type: ActionType) -> None:
         """
@@ -51,27 +62,62 @@ class MinesweeperController:
         self.view.focus()
 
         minesweeper_response: MinesweeperResponse = self.model(clicked_cell_row, clicked_cell_col, action_type)
-
-        self._update_board_gui(minesweeper_response)
+        if not self.model.is_prepared and self._preparing_model is not self.model:
+            self._preparing_model = self.model
+            self.view.after_idle(self._finish_preparation, self.model)
+
+        if minesweeper_response.changed_cells is None:
+            self.render_scheduler.mark_dirty(
+                (row, col) for row in range(self.model.rows) for col in range(self.model.cols)
+            )
+        else:
+            self.render_scheduler.mark_dirty(minesweeper_response.changed_cells)
+
+        if (game_over_reveal := minesweeper_response.game_over_reveal) is not None and not self._game_over_cells:
+            # По окончании игры показываем только мины и ошибочные флаги, остальные клетки не перерисовываются
+            self._game_over_cells = {row_col: Tile.MINE for row_col in game_over_reveal.mines}
+            self._game_over_cells.update({row_col: Tile.WRONG_FLAG for row_col in game_over_reveal.wrong_flags})
+            self.render_scheduler.mark_dirty(self._game_over_cells)
+
+        if minesweeper_response.is_gameover:
+            self.render_scheduler.flush()
 
         if minesweeper_response.is_win:
             messagebox.showinfo(title='Результат игры', message='Вы победили')
         elif minesweeper_response.is_gameover:
             messagebox.showinfo(title='Результат игры', message='Вы проиграли')
 
-    def _update_board_gui(self, minesweeper_response: MinesweeperResponse) -> None:
+    def _finish_preparation(self, model: MinesweeperModel) -> None:
+        """
+        Досчитывает числа поля после первого клика частями между событиями gui, чтобы не задерживать отрисовку.
+            Для каждой модели запланирована только одна цепочка досчёта
+
+        Args:
+            model: модель, для которой запланирован досчёт (после новой игры досчёт старой модели прекращается)
+        """
+        if model is not self.model or model.finish_preparation(self.preparation_budget_ms):
+            if self._preparing_model is model:
+                self._preparing_model = None
+            return
+
+        self.view.after(1, self._finish_preparation, model)
+
+    def _get_gui_cell_state(self, row: int, col: int) -> Tile:
         """
-        Обновляет внешний вид игровой доски
+        Определяем вид gui клетки по текущему состоянию модели
 
         Args:
-            minesweeper_response: ответ от модели
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Изображение клетки
         """
-        for list_gui_cells in self.view.board_view:
-            for gui_cell in list_gui_cells:
-                model_cell: Cell = minesweeper_response.board[gui_cell.row][gui_cell.col]
+        if (row, col) in self._game_over_cells:
+            return self._game_over_cells[(row, col)]
 
-                text, disable = self._get_cell_text(model_cell)
-                self._configurate_cell(gui_cell, text=text, disable=disable)
+        # После конца игры закрытые клетки не раскрываются, мины и ошибочные флаги берутся из _game_over_cells
+        return self._get_cell_tile(self.model.get_played_cell(row, col))
 
     def _add_commands_for_file_menu(self) -> None:
         """Добавляет команды для меню Файл"""
@@ -80,8 +126,36 @@ class MinesweeperController:
     def _command_new_game(self) -> None:
         """Добавляет команду Новая игра"""
         self.view.relating_board()
-        self.model: MinesweeperModel = MinesweeperModel(*DIFFICULTY_MAPPING[self.view.difficulty_radio.get()])
-        self()
+        self._command_change_difficulty()
+
+    def _add_commands_for_difficulty_menu(self) -> None:
+        """Добавляет команды для меню Сложность: доску пересоздаёт представление, модель пересоздаём здесь"""
+        self.view.difficulty_radio.trace_add('write', self._command_change_difficulty)
+
+    def _command_change_difficulty(self, *_args) -> None:
+        """Добавляет команду смены сложности: новая модель и сброс отрисовки под сброшенные gui клетки"""
+        self.model: MinesweeperModel = self._create_model()
+        self.render_scheduler.reset()
+        self._game_over_cells = {}
+
+    def _add_commands_for_zoom_menu(self) -> None:
+        """Добавляет команды для меню Масштаб"""
+        self.view.zoom_radio.trace_add('write', self._command_change_zoom)
+
+    def _command_change_zoom(self, *_args) -> None:
+        """Добавляет команду смены масштаба: клетки закрываются в новом масштабе, открытые перерисовываются сразу"""
+        self.view.set_zoom(self.view.zoom_radio.get())
+        self.render_scheduler.reset()
+        self.render_scheduler.mark_dirty(
+            (row, col) for row in range(self.model.rows) for col in range(self.model.cols)
+        )
+        self.render_scheduler.flush()
+
+    def _create_model(self) -> MinesweeperModel:
+        """Создаёт модель для выбранной сложности, по возможности из заранее сгенерированного поля"""
+        rows, cols, mines = DIFFICULTY_MAPPING[self.view.difficulty_radio.get()]
+
+        return MinesweeperModel(rows, cols, mines, layout=self.board_pool.take(rows, cols, mines))
 
     def _add_commands_for_help_menu(self) -> None:
         """Добавляет команды для меню Справка"""
@@ -104,40 +178,21 @@ class MinesweeperController:
         )
 
     @staticmethod
-    def _configurate_cell(gui_cell: CellView, *, text: str = None, disable: bool = False) -> None:
-        """
-        Настраиваем клетку
-
-        Args:
-            gui_cell: gui клетка
-            text: текст клетки
-            disable: деактивировать ли клетку
-        """
-        gui_cell.config(text=text)
-
-        if disable:
-            gui_cell.config(state='disable')
-
-    @staticmethod
-    def _get_cell_text(model_cell: Cell) -> tuple[str, bool]:
+    def _get_cell_tile(visible_cell: int) -> Tile:
         """
-        Определяем текст для gui клетки
+        Определяем изображение для gui клетки
 
         Args:
-            model_cell: клетка поля
+            visible_cell: видимое состояние клетки (см. MinesweeperModel.get_visible_cell)
 
         Returns:
-            Текст для gui клетки
+            Изображение gui клетки
         """
-        text: str = ' '
-        disable: bool = False
-        if model_cell.is_set_flag:
-            text = '?'
-        elif model_cell.is_revealed:
-            disable = True
-            if model_cell.is_mine:
-                text = 'M'
-            elif num_of_mines_around := model_cell.num_of_mines_around:
-                text = str(num_of_mines_around)
-
-        return text, disable
+        if visible_cell == VisibleCell.HIDDEN:
+            return Tile.HIDDEN
+        if visible_cell == VisibleCell.FLAG:
+            return Tile.FLAG
+        if visible_cell == VisibleCell.MINE:
+            return Tile.MINE
+
+        return Tile(str(visible_cell))
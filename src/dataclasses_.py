@@ -2,35 +2,267 @@
 
 __author__ = 'Шеряков Д.И.'
 
+import tkinter as tk
 from tkinter import ttk
 
-from dataclasses import dataclass, InitVar
+from dataclasses import dataclass, field, InitVar
+
+from .enums import VisibleCell
+
+CELL_BIND_TAG: str = 'MinesweeperCell'  # Общий тег привязки событий для всех клеток поля
 
 
 @dataclass
-class CellView(ttk.Button):
-    """Rласс-представление одной клетки поля"""
+class CellView(ttk.Label):
+    """Rласс-представление одной клетки поля. Клетка только показывает общее изображение своего вида (см. TileCache)"""
     master: InitVar[ttk.Frame]
     row: int
     col: int
+    image: InitVar[tk.PhotoImage]
 
-    def __post_init__(self, master):
-        super().__init__(master=master, text=' ', width=2)
+    def __post_init__(self, master, image):
+        super().__init__(master=master, image=image, borderwidth=0, padding=0)
         self.grid(row=self.row, column=self.col)
 
+        widget_tag, *other_tags = self.bindtags()
+        self.bindtags((widget_tag, CELL_BIND_TAG, *other_tags))
+
+    def reset(self, image: tk.PhotoImage) -> None:
+        """
+        Возвращает клетку в исходное (закрытое) состояние для повторного использования
+
+        Args:
+            image: изображение закрытой клетки
+        """
+        self.config(image=image)
+
 
-@dataclass
 class Cell:
-    """Класс клетки поля"""
-    is_mine: bool = False
-    is_revealed: bool = False
-    is_set_flag: bool = False
-    num_of_mines_around: int | None = None
+    """
+    Класс клетки поля. Всё состояние упаковано в одно целое число в единственном слоте, поэтому у клетки нет
+        __dict__, а одинаковые состояния разных клеток ссылаются на одно кешированное малое целое. Атрибуты доступны
+        через свойства, конструктор, сравнение и repr совпадают с датаклассом
+    """
+    __slots__ = ('_state',)
+
+    _MINE: int = 1
+    _REVEALED: int = 2
+    _FLAG: int = 4
+    _COUNT_SHIFT: int = 3   # Выше флагов хранится кол-во мин вокруг + 1, 0 - ещё не посчитано (None)
+
+    def __init__(
+            self,
+            is_mine: bool = False,
+            is_revealed: bool = False,
+            is_set_flag: bool = False,
+            num_of_mines_around: int | None = None,
+    ) -> None:
+        self._state: int = (
+            (self._MINE if is_mine else 0)
+            | (self._REVEALED if is_revealed else 0)
+            | (self._FLAG if is_set_flag else 0)
+            | (0 if num_of_mines_around is None else num_of_mines_around + 1) << self._COUNT_SHIFT
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._state == other._state
+
+    __hash__ = None   # Клетка изменяемая, как и датакласс с eq
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__qualname__}(is_mine={self.is_mine}, is_revealed={self.is_revealed}, '
+                f'is_set_flag={self.is_set_flag}, num_of_mines_around={self.num_of_mines_around})')
+
+    def get_visible(self, is_gameover: bool) -> int | None:
+        """
+        Видимое игроку состояние клетки за одно чтение упакованного состояния (см. MinesweeperModel.get_visible_cell)
+
+        Args:
+            is_gameover: окончена ли игра, тогда все клетки считаются открытыми
+
+        Returns:
+            Число мин вокруг открытой клетки или значение VisibleCell
+        """
+        state: int = self._state
+        if not is_gameover and not state & self._REVEALED:
+            return VisibleCell.FLAG if state & self._FLAG else VisibleCell.HIDDEN
+        if state & self._MINE:
+            return VisibleCell.MINE
+
+        count: int = state >> self._COUNT_SHIFT
+        return count - 1 if count else None
+
+    @property
+    def is_mine(self) -> bool:
+        """Мина в клетке"""
+        return bool(self._state & self._MINE)
+
+    @is_mine.setter
+    def is_mine(self, value: bool) -> None:
+        self._state = self._state | self._MINE if value else self._state & ~self._MINE
+
+    @property
+    def is_revealed(self) -> bool:
+        """Клетка открыта"""
+        return bool(self._state & self._REVEALED)
+
+    @is_revealed.setter
+    def is_revealed(self, value: bool) -> None:
+        self._state = self._state | self._REVEALED if value else self._state & ~self._REVEALED
+
+    @property
+    def is_set_flag(self) -> bool:
+        """На клетке флаг"""
+        return bool(self._state & self._FLAG)
+
+    @is_set_flag.setter
+    def is_set_flag(self, value: bool) -> None:
+        self._state = self._state | self._FLAG if value else self._state & ~self._FLAG
+
+    @property
+    def num_of_mines_around(self) -> int | None:
+        """Кол-во мин вокруг, None - ещё не посчитано"""
+        count: int = self._state >> self._COUNT_SHIFT
+        return count - 1 if count else None
+
+    @num_of_mines_around.setter
+    def num_of_mines_around(self, value: int | None) -> None:
+        count: int = 0 if value is None else value + 1
+        self._state = self._state & ((1 << self._COUNT_SHIFT) - 1) | count << self._COUNT_SHIFT
 
 
 @dataclass
+class GameOverReveal:
+    """Класс клеток, которые нужно показать по окончании игры"""
+    mines: list[tuple[int, int]]
+    wrong_flags: list[tuple[int, int]]
+
+
+@dataclass(slots=True)
 class MinesweeperResponse:
-    """Класс ответа после клика на клетку"""
+    """Класс ответа после клика на клетку. Создаётся на каждый клик, поэтому без __dict__"""
     is_win: bool
     is_gameover: bool
     board: list[list[Cell]]
+    game_over_reveal: GameOverReveal | None = None
+    changed_cells: list[tuple[int, int]] | None = None   # None - модель не отслеживает изменённые клетки
+
+
+@dataclass
+class BoardLayout:
+    """Класс заранее сгенерированного игрового поля: расставленные мины и посчитанные числа"""
+    rows: int
+    cols: int
+    board: list[list[Cell]]
+    mine_positions: list[tuple[int, int]]
+
+
+@dataclass
+class BoardPoolMetrics:
+    """Класс метрик пула заранее сгенерированных полей"""
+    hits: int = 0
+    misses: int = 0
+    refills: int = 0
+    refill_seconds: float = 0.0
+    last_refill_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля запросов, обслуженных из пула"""
+        requests: int = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    @property
+    def mean_refill_seconds(self) -> float:
+        """Среднее время генерации одного поля"""
+        return self.refill_seconds / self.refills if self.refills else 0.0
+
+
+@dataclass
+class WinRateEstimate:
+    """Класс оценки вероятности победы политики методом Монте-Карло"""
+    rows: int
+    cols: int
+    mines: int
+    policy: str
+    games: int
+    wins: int
+    low: float
+    high: float
+
+    @property
+    def win_rate(self) -> float:
+        """Доля побед"""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def half_width(self) -> float:
+        """Половина ширины доверительного интервала"""
+        return (self.high - self.low) / 2
+
+
+@dataclass
+class PhaseThroughput:
+    """Класс замера пропускной способности одного этапа обработки поля"""
+    cells: int = 0
+    seconds: float = 0.0
+
+    @property
+    def cells_per_second(self) -> float:
+        """Кол-во обработанных клеток в секунду"""
+        return self.cells / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class TrainingSample:
+    """Класс обучающего примера: видимое состояние поля и метки клеток, по байту на клетку построчно"""
+    visible: bytes   # Значения MinesweeperModel.get_visible_cell как знаковые байты
+    labels: bytes    # Значения SampleLabel
+
+
+@dataclass
+class StoredSession:
+    """Класс сессии в хранилище событий: параметры партии и её последний снимок (см. MinesweeperModel.to_snapshot)"""
+    rows: int
+    cols: int
+    mines: int
+    seed: int
+    snapshot: dict | None = None     # None - партия ещё не начата
+    actions: list[list] = field(default_factory=list)   # Действия после снимка: [строка, столбец, тип действия]
+
+
+@dataclass
+class SpectatorFrame:
+    """Класс разобранного кадра трансляции зрителям (см. spectator.encode_delta, spectator.encode_snapshot)"""
+    frame_type: int     # Значение FrameType
+    sequence: int       # Номер действия, после которого снят кадр
+    is_win: bool
+    is_gameover: bool
+    rows: int
+    cols: int
+    cells: list[tuple[int, int]]   # Пары (строка * кол-во столбцов + столбец, видимое значение клетки)
+
+
+@dataclass
+class PhaseMemory:
+    """Класс замера памяти одного этапа игры"""
+    phase: str
+    seconds: float
+    traced_bytes: int           # Память python-объектов после этапа по tracemalloc
+    traced_peak_bytes: int      # Пик памяти python-объектов во время этапа
+    bytes_per_cell: float       # traced_bytes на одну клетку поля
+    rss_bytes: int | None       # Резидентная память процесса после этапа, None если её нельзя узнать
+    peak_rss_bytes: int | None  # Пик резидентной памяти процесса с момента запуска, None если его нельзя узнать
+    top_allocations: list[tuple[str, int, int]] = field(default_factory=list)   # (файл:строка, байт, блоков)
+
+
+@dataclass
+class BoardMemoryReport:
+    """Класс отчёта о памяти поля одного размера на одном способе хранения"""
+    backend: str
+    rows: int
+    cols: int
+    mines: int
+    phases: list[PhaseMemory] = field(default_factory=list)
@@ -0,0 +1,254 @@
+"""Модуль выгрузки обучающих данных (позиция, безопасные ходы) из симулированных партий"""
+
+__author__ = 'Шеряков Д.И.'
+
+import gzip
+import struct
+from argparse import ArgumentParser
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from os import cpu_count
+from pathlib import Path
+from random import Random
+from typing import Iterable, Iterator
+
+from .dataclasses_ import TrainingSample
+from .enums import SampleLabel, VisibleCell
+from .model import MinesweeperModel
+from .solver import POLICIES, Policy, iter_positions
+from .view import DIFFICULTY_MAPPING
+
+SHARD_MAGIC: bytes = b'MSDS'
+SHARD_VERSION: int = 1
+SHARD_HEADER: struct.Struct = struct.Struct('<4sHIII')   # Магия, версия, строки, столбцы, кол-во примеров
+
+
+def iter_samples(
+        rows: int,
+        cols: int,
+        mines: int,
+        policy_name: str,
+        games: int,
+        stream: str,
+) -> Iterator[TrainingSample]:
+    """
+    Играет партии и выдаёт пример перед каждым решением политики. Позиция до первого клика пропускается:
+        мины ещё не расставлены и разметить её нельзя
+
+    Args:
+        rows: Кол-во строк игрового поля
+        cols: Кол-во столбцов игрового поля
+        mines: Кол-во мин на игровом поле
+        policy_name: имя политики из POLICIES
+        games: кол-во партий
+        stream: зерно потока случайных чисел
+
+    Returns:
+        Итератор по примерам
+    """
+    rng: Random = Random(stream)
+    policy: Policy = POLICIES[policy_name]()
+
+    for _ in range(games):
+        model = MinesweeperModel(rows, cols, mines, seed=rng.getrandbits(64))
+        for step, visible_board in enumerate(iter_positions(model, policy, rng)):
+            if step == 0:
+                continue
+
+            visible: array = array('b')
+            labels: bytearray = bytearray()
+            for row, list_of_cells in enumerate(visible_board):
+                visible.extend(list_of_cells)
+                for col, value in enumerate(list_of_cells):
+                    if value != VisibleCell.HIDDEN:
+                        labels.append(SampleLabel.KNOWN)
+                    else:
+                        labels.append(SampleLabel.MINE if model.is_mine(row, col) else SampleLabel.SAFE)
+
+            yield TrainingSample(visible=visible.tobytes(), labels=bytes(labels))
+
+
+def _export_batch(rows: int, cols: int, mines: int, policy_name: str, stream: str, games: int) -> bytes:
+    """Играет серию партий в рабочем процессе и возвращает примеры одним блоком байтов"""
+    return b''.join(sample.visible + sample.labels for sample in iter_samples(
+        rows, cols, mines, policy_name, games, stream
+    ))
+
+
+class ShardWriter:
+    """
+    Класс записи примеров в сжатые gzip шарды. Шард записывается, как только в нём набирается samples_per_shard
+        примеров, поэтому в памяти хранится не больше одного шарда
+    """
+
+    def __init__(self, directory: Path, rows: int, cols: int, samples_per_shard: int = 10_000) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            directory: каталог шардов
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+            samples_per_shard: кол-во примеров в шарде
+        """
+        self.rows: int = rows
+        self.cols: int = cols
+        self.samples_per_shard: int = samples_per_shard
+        self.shards: list[Path] = []
+        self.samples: int = 0
+
+        self._directory: Path = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._buffer: bytearray = bytearray()
+        self._buffered_samples: int = 0
+
+    def __enter__(self) -> 'ShardWriter':
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def write(self, samples: Iterable[TrainingSample]) -> None:
+        """Добавляет примеры"""
+        self.write_encoded(b''.join(sample.visible + sample.labels for sample in samples))
+
+    def write_encoded(self, data: bytes) -> None:
+        """
+        Добавляет примеры, уже склеенные в байты (видимое состояние и метки каждого примера подряд)
+
+        Args:
+            data: байты примеров
+        """
+        sample_size: int = 2 * self.rows * self.cols
+        for offset in range(0, len(data), sample_size):
+            self._buffer += data[offset:offset + sample_size]
+            self._buffered_samples += 1
+            if self._buffered_samples == self.samples_per_shard:
+                self._flush()
+
+    def close(self) -> None:
+        """Записывает неполный последний шард"""
+        if self._buffered_samples:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Записывает шард: сначала во временный файл, затем переименовывает, чтобы не оставить битый шард"""
+        path: Path = self._directory / f'shard-{len(self.shards):05d}.bin.gz'
+        temporary_path: Path = path.with_suffix('.tmp')
+        with gzip.open(temporary_path, 'wb', compresslevel=6) as file:
+            file.write(SHARD_HEADER.pack(SHARD_MAGIC, SHARD_VERSION, self.rows, self.cols, self._buffered_samples))
+            file.write(self._buffer)
+        temporary_path.replace(path)
+
+        self.shards.append(path)
+        self.samples += self._buffered_samples
+        self._buffer = bytearray()
+        self._buffered_samples = 0
+
+
+def read_shard(path: Path) -> Iterator[TrainingSample]:
+    """
+    Читает примеры из шарда
+
+    Args:
+        path: путь к шарду
+
+    Returns:
+        Итератор по примерам
+    """
+    with gzip.open(path, 'rb') as file:
+        magic, version, rows, cols, samples = SHARD_HEADER.unpack(file.read(SHARD_HEADER.size))
+        if magic != SHARD_MAGIC or version != SHARD_VERSION:
+            raise ValueError(f'{path} не является шардом версии {SHARD_VERSION}')
+
+        cells: int = rows * cols
+        for _ in range(samples):
+            visible: bytes = file.read(cells)
+            yield TrainingSample(visible=visible, labels=file.read(cells))
+
+
+def export_dataset(
+        directory: Path,
+        rows: int,
+        cols: int,
+        mines: int,
+        policy_name: str = 'single_point',
+        *,
+        games: int = 1000,
+        games_per_batch: int = 20,
+        samples_per_shard: int = 10_000,
+        workers: int | None = None,
+        seed: int = 0,
+) -> ShardWriter:
+    """
+    Выгружает примеры из партий, сыгранных на пуле процессов. Одновременно в работе не больше двух серий партий
+        на процесс, а шарды пишутся по мере заполнения, поэтому память ограничена независимо от кол-ва партий
+
+    Args:
+        directory: каталог шардов
+        rows: Кол-во строк игрового поля
+        cols: Кол-во столбцов игрового поля
+        mines: Кол-во мин на игровом поле
+        policy_name: имя политики из POLICIES
+        games: кол-во партий
+        games_per_batch: кол-во партий в одной серии
+        samples_per_shard: кол-во примеров в шарде
+        workers: кол-во рабочих процессов, по умолчанию кол-во процессоров
+        seed: базовое зерно, из которого получаются независимые потоки серий
+
+    Returns:
+        Закрытый ShardWriter со списком записанных шардов
+    """
+    workers = workers or cpu_count() or 1
+
+    with ShardWriter(directory, rows, cols, samples_per_shard) as writer, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: set[Future] = set()
+        scheduled, batch = 0, 0
+        while scheduled < games or pending:
+            while len(pending) < 2 * workers and scheduled < games:
+                size: int = min(games_per_batch, games - scheduled)
+                pending.add(executor.submit(
+                    _export_batch, rows, cols, mines, policy_name, f'{seed}:{batch}', size
+                ))
+                scheduled += size
+                batch += 1
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                writer.write_encoded(future.result())
+
+    return writer
+
+
+def main() -> None:
+    """Запуск выгрузки из командной строки"""
+    parser = ArgumentParser(description='Выгрузка обучающих примеров (позиция, безопасные ходы)')
+    parser.add_argument('board', help=f'уровень сложности ({", ".join(DIFFICULTY_MAPPING)}) или СТРОКИxСТОЛБЦЫxМИНЫ')
+    parser.add_argument('directory', type=Path)
+    parser.add_argument('--policy', default='single_point', choices=POLICIES)
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--games-per-batch', type=int, default=20)
+    parser.add_argument('--samples-per-shard', type=int, default=10_000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.board in DIFFICULTY_MAPPING:
+        rows, cols, mines = DIFFICULTY_MAPPING[args.board]
+    else:
+        rows, cols, mines = map(int, args.board.split('x'))
+
+    writer: ShardWriter = export_dataset(
+        args.directory, rows, cols, mines, args.policy,
+        games=args.games,
+        games_per_batch=args.games_per_batch,
+        samples_per_shard=args.samples_per_shard,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    print(f'{writer.samples} samples in {len(writer.shards)} shards')
+
+
+if __name__ == '__main__':
+    main()
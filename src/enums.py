@@ -2,7 +2,7 @@
 
 __author__ = 'Шеряков Д.И.'
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class ActionType(StrEnum):
@@ -16,3 +16,47 @@ class Difficulty(StrEnum):
     EASY = 'easy'
     NORMAL = 'normal'
     HARD = 'hard'
+
+
+class VisibleCell(IntEnum):
+    """Видимые игроку состояния клетки. Открытая клетка без мины видна как число мин вокруг (0..8)"""
+    HIDDEN = -1     # Закрытая клетка
+    FLAG = -2       # Клетка с флагом
+    MINE = -3       # Открытая мина
+    WRONG_FLAG = -4     # Флаг не на мине, показывается зрителям в конце игры (см. spectator)
+
+
+class SampleLabel(IntEnum):
+    """Метки клеток обучающего примера"""
+    KNOWN = 0   # Клетка открыта или помечена флагом, ход в неё не нужен
+    SAFE = 1    # Закрытая клетка без мины
+    MINE = 2    # Закрытая клетка с миной
+
+
+class FrameType(IntEnum):
+    """Типы кадров трансляции зрителям"""
+    DELTA = 1      # Изменённые клетки после действия
+    SNAPSHOT = 2   # Всё видимое поле
+
+
+class OverflowPolicy(StrEnum):
+    """Что делать с зрителем, очередь которого переполнена"""
+    DROP = 'drop'       # Отключить зрителя
+    RESYNC = 'resync'   # Очистить очередь и отправить снимок поля
+
+
+class Tile(StrEnum):
+    """Изображения клеток поля. Открытая клетка без мины изображается числом мин вокруг"""
+    HIDDEN = 'hidden'           # Закрытая клетка
+    FLAG = 'flag'               # Клетка с флагом
+    MINE = 'mine'               # Мина
+    WRONG_FLAG = 'wrong_flag'   # Флаг не на мине, показывается в конце игры
+    ZERO = '0'
+    ONE = '1'
+    TWO = '2'
+    THREE = '3'
+    FOUR = '4'
+    FIVE = '5'
+    SIX = '6'
+    SEVEN = '7'
+    EIGHT = '8'
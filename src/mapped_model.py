@@ -0,0 +1,701 @@
+"""Модуль с моделью игры, поле которой хранится в отображаемых в память файлах"""
+
+__author__ = 'Шеряков Д.И.'
+
+import mmap
+from argparse import ArgumentParser
+from array import array
+from pathlib import Path
+from math import exp, log
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Iterator
+
+from .dataclasses_ import Cell, MinesweeperResponse, PhaseThroughput
+from .enums import ActionType, VisibleCell
+
+try:
+    from resource import RUSAGE_SELF, getrusage
+except ImportError:   # Модуль resource есть только в Unix
+    getrusage = None
+
+
+class BitPlane:
+    """
+    Класс битовой плоскости поля: один бит на клетку в отображаемом в память файле.
+        Каждая строка выровнена по байтам, поэтому полоса строк - непрерывный участок файла
+    """
+
+    def __init__(self, path: Path, rows: int, cols: int) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            path: путь к файлу плоскости
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+        """
+        self.stride: int = (cols + 7) // 8
+
+        size: int = rows * self.stride
+        with open(path, 'w+b') as file:
+            file.truncate(size)  # Разреженный файл: нулевые страницы не занимают место, пока в них не пишут
+            self.buffer: mmap.mmap = mmap.mmap(file.fileno(), size)
+
+    def get(self, row: int, col: int) -> int:
+        """Возвращает бит клетки"""
+        return self.buffer[row * self.stride + (col >> 3)] >> (col & 7) & 1
+
+    def set(self, row: int, col: int, value: bool = True) -> None:
+        """Устанавливает или сбрасывает бит клетки"""
+        offset: int = row * self.stride + (col >> 3)
+        if value:
+            self.buffer[offset] |= 1 << (col & 7)
+        else:
+            self.buffer[offset] &= ~(1 << (col & 7)) & 0xFF
+
+    def read_row(self, row: int) -> int:
+        """Возвращает строку как целое число, в котором бит с номером col - бит клетки"""
+        return int.from_bytes(self.buffer[row * self.stride:(row + 1) * self.stride], 'little')
+
+    def write_row(self, row: int, value: int) -> None:
+        """Записывает строку из целого числа (см. read_row)"""
+        self.buffer[row * self.stride:(row + 1) * self.stride] = value.to_bytes(self.stride, 'little')
+
+    def release(self, start_row: int, stop_row: int) -> None:
+        """
+        Отдаёт ядру страницы полосы строк, чтобы они не оставались в резидентной памяти процесса.
+            Данные не теряются: страницы отображения файла записываются в файл
+
+        Args:
+            start_row: первая строка полосы
+            stop_row: строка после последней строки полосы
+        """
+        if not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+
+        start: int = start_row * self.stride // mmap.PAGESIZE * mmap.PAGESIZE
+        stop: int = min(stop_row * self.stride, len(self.buffer)) // mmap.PAGESIZE * mmap.PAGESIZE
+        if stop > start:
+            self.buffer.flush(start, stop - start)
+            self.buffer.madvise(mmap.MADV_DONTNEED, start, stop - start)
+
+    def close(self) -> None:
+        """Закрывает отображение файла"""
+        self.buffer.close()
+
+
+class SpillQueue:
+    """
+    Класс очереди клеток для заливки, разложенной по полосам строк. Если в памяти накапливается больше limit клеток,
+        самая большая очередь полосы дописывается в файл на диске. Из файла клетки читаются частями не больше limit
+    """
+
+    def __init__(self, directory: Path, limit: int = 1 << 20) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            directory: каталог для файлов очереди
+            limit: максимальное кол-во клеток в памяти
+        """
+        self.limit: int = limit
+
+        self._directory: Path = directory
+        self._in_memory: dict[int, array] = {}
+        self._spilled: dict[int, int] = {}   # Полоса -> смещение непрочитанной части файла
+        self._size: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._in_memory or self._spilled)
+
+    def push(self, band: int, index: int) -> None:
+        """
+        Добавляет клетку в очередь полосы
+
+        Args:
+            band: номер полосы
+            index: индекс клетки (строка * кол-во столбцов + столбец)
+        """
+        self._in_memory.setdefault(band, array('q')).append(index)
+        self._size += 1
+
+        if self._size > self.limit:
+            largest_band: int = max(self._in_memory, key=lambda band_: len(self._in_memory[band_]))
+            indexes: array = self._in_memory.pop(largest_band)
+            with open(self._get_path(largest_band), 'ab') as file:
+                indexes.tofile(file)
+
+            self._spilled.setdefault(largest_band, 0)
+            self._size -= len(indexes)
+
+    def pop_band(self) -> tuple[int, array]:
+        """
+        Забирает клетки полосы с наименьшим номером, не больше limit за раз. Непрочитанная часть файла полосы
+            остаётся в очереди до следующего вызова
+        """
+        band: int = min(self._in_memory.keys() | self._spilled.keys())
+
+        indexes: array = self._in_memory.pop(band, array('q'))
+        self._size -= len(indexes)
+        if band in self._spilled:
+            path: Path = self._get_path(band)
+            with open(path, 'rb') as file:
+                file.seek(self._spilled[band])
+                data: bytes = file.read(max(self.limit - len(indexes), 1) * indexes.itemsize)
+                is_read: bool = not file.read(1)
+            indexes.frombytes(data)
+
+            if is_read:
+                del self._spilled[band]
+                path.unlink()
+            else:
+                self._spilled[band] += len(data)
+
+        return band, indexes
+
+    def _get_path(self, band: int) -> Path:
+        """Путь к файлу очереди полосы"""
+        return self._directory / f'spill-{band}.bin'
+
+
+class MappedBoardView:
+    """Класс доступа к клеткам поля по board[row][col], клетки собираются из плоскостей при обращении"""
+
+    def __init__(self, model: 'MappedMinesweeperModel') -> None:
+        self._model: MappedMinesweeperModel = model
+
+    def __len__(self) -> int:
+        return self._model.rows
+
+    def __getitem__(self, row: int) -> '_MappedRowView':
+        return _MappedRowView(self._model, row)
+
+
+class _MappedRowView:
+    """Класс доступа к клеткам одной строки поля"""
+
+    def __init__(self, model: 'MappedMinesweeperModel', row: int) -> None:
+        self._model: MappedMinesweeperModel = model
+        self._row: int = row
+
+    def __len__(self) -> int:
+        return self._model.cols
+
+    def __getitem__(self, col: int) -> Cell:
+        return self._model.get_cell(self._row, col)
+
+
+class MappedMinesweeperModel:
+    """
+    Класс игры сапёр для полей, не помещающихся в память. Мины, открытые клетки, флаги и 4 бита числа мин вокруг
+        хранятся битовыми плоскостями в файлах, отображаемых в память. Расстановка мин, подсчёт чисел и заливка
+        идут полосами строк, обработанные полосы отдаются ядру, поэтому резидентная память не зависит от размера поля.
+        В памяти одновременно находятся страницы одной полосы (7 бит на клетку), стек заливки полосы и очередь
+        заливки (по 8 байт на клетку, не больше spill_limit клеток каждый, остальное выгружается на диск)
+    """
+    spill_limit: int = 1 << 20  # Максимальное кол-во клеток очереди заливки и стека полосы в памяти
+    band_cells: int = 1 << 22   # Кол-во клеток полосы, из него считается кол-во строк полосы
+
+    def __init__(
+            self,
+            rows: int = 10,
+            cols: int = 10,
+            mines: int = 10,
+            directory: Path | None = None,
+            band_rows: int | None = None,
+            seed: int | str | None = None,
+    ) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+            mines: Кол-во мин на игровом поле
+            directory: каталог для файлов поля, по умолчанию временный, он удаляется в close
+            band_rows: кол-во строк в одной полосе обработки, по умолчанию band_cells // cols, но не меньше одной
+            seed: Зерно генератора случайных чисел для воспроизводимой расстановки мин
+        """
+        self.rows: int = rows
+        self.cols: int = cols
+        self.mines: int = mines
+        self.band_rows: int = band_rows if band_rows is not None else max(1, self.band_cells // max(cols, 1))
+
+        self._random: Random = Random(seed)
+
+        self._temporary_directory: TemporaryDirectory | None = (
+            TemporaryDirectory(prefix='minesweeper-') if directory is None else None
+        )
+        self._directory: Path = (
+            Path(directory) if self._temporary_directory is None else Path(self._temporary_directory.name)
+        )
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        self._mines: BitPlane = BitPlane(self._directory / 'mines.bits', rows, cols)
+        self._revealed: BitPlane = BitPlane(self._directory / 'revealed.bits', rows, cols)
+        self._flags: BitPlane = BitPlane(self._directory / 'flags.bits', rows, cols)
+        self._counts: list[BitPlane] = [
+            BitPlane(self._directory / f'counts-{bit}.bits', rows, cols) for bit in range(4)
+        ]
+
+        self._from_action_type_to_action: dict[str, Callable[[int, int], bool]] = {
+            ActionType.OPEN: self._open_cell,
+            ActionType.MARK: self._mark_cell,
+        }
+
+        self._is_win: bool = False
+        self._is_gameover: bool = False
+        self._is_first_click: bool = True
+
+        self._revealed_cells: int = 0
+        self._is_mine_revealed_after_click: bool = False
+
+        self.throughput: dict[str, PhaseThroughput] = {
+            'placement': PhaseThroughput(),
+            'counts': PhaseThroughput(),
+            'flood_fill': PhaseThroughput(),
+        }
+
+    def __enter__(self) -> 'MappedMinesweeperModel':
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает отображения файлов поля и удаляет временный каталог, если модель создала его сама"""
+        for plane in (self._mines, self._revealed, self._flags, *self._counts):
+            plane.close()
+
+        if self._temporary_directory is not None:
+            self._temporary_directory.cleanup()
+
+    def __call__(self, clicked_cell_row: int, clicked_cell_col: int, action_type: ActionType) -> MinesweeperResponse:
+        """
+        Игровой цикл, правила совпадают с MinesweeperModel
+
+        Args:
+            clicked_cell_row: строка нажатой клетки
+            clicked_cell_col: столбец нажатой клетки
+            action_type: тип события
+
+        Returns:
+            Ответ содержащий данные о текущем состоянии игры(победа?, поражение?, игровое поле)
+        """
+        if not self._is_gameover:
+            self._is_mine_revealed_after_click = False
+
+            is_revealed_now: bool = self._from_action_type_to_action[action_type](clicked_cell_row, clicked_cell_col)
+
+            if self._is_first_click and action_type == ActionType.OPEN:
+                self._preparing_board_after_first_click(clicked_cell_row, clicked_cell_col)
+
+            if action_type == ActionType.OPEN:
+                self._reveal_neighbours(clicked_cell_row, clicked_cell_col, is_revealed_now)
+                self._check_game_result(clicked_cell_row, clicked_cell_col)
+
+        return MinesweeperResponse(
+            is_win=self._is_win,
+            is_gameover=self._is_gameover,
+            board=MappedBoardView(self),
+        )
+
+    def get_cell(self, row: int, col: int) -> Cell:
+        """
+        Собирает клетку из плоскостей
+
+        Args:
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Копия клетки, её изменение не меняет поле
+        """
+        is_mine: bool = bool(self._mines.get(row, col))
+
+        return Cell(
+            is_mine=is_mine,
+            is_revealed=bool(self._revealed.get(row, col)),
+            is_set_flag=bool(self._flags.get(row, col)),
+            num_of_mines_around=None if is_mine or self._is_first_click else self._get_num_of_mines(row, col),
+        )
+
+    def is_cell_revealed(self, row: int, col: int) -> bool:
+        """Открыта ли клетка. По окончании игры все клетки считаются открытыми"""
+        return self._is_gameover or bool(self._revealed.get(row, col))
+
+    def get_visible_cell(self, row: int, col: int) -> int:
+        """Возвращает состояние клетки, видимое игроку (см. MinesweeperModel.get_visible_cell)"""
+        if not self.is_cell_revealed(row, col):
+            return VisibleCell.FLAG if self._flags.get(row, col) else VisibleCell.HIDDEN
+        if self._mines.get(row, col):
+            return VisibleCell.MINE
+
+        return self._get_num_of_mines(row, col)
+
+    def get_visible_board(self) -> list[list[int]]:
+        """Возвращает видимое игроку состояние всех клеток поля. Только для небольших полей"""
+        return [[self.get_visible_cell(row, col) for col in range(self.cols)] for row in range(self.rows)]
+
+    def _open_cell(self, clicked_cell_row: int, clicked_cell_col: int) -> bool:
+        """Открываем клетку, возвращаем открылась ли она сейчас"""
+        if self._flags.get(clicked_cell_row, clicked_cell_col):
+            return False
+        if self._revealed.get(clicked_cell_row, clicked_cell_col):
+            return False
+
+        self._reveal_cell(clicked_cell_row, clicked_cell_col)
+        return True
+
+    def _mark_cell(self, clicked_cell_row: int, clicked_cell_col: int) -> bool:
+        """Ставим или снимаем флаг с клетки"""
+        if not self._revealed.get(clicked_cell_row, clicked_cell_col) and not self._is_first_click:
+            self._flags.set(clicked_cell_row, clicked_cell_col, not self._flags.get(clicked_cell_row, clicked_cell_col))
+
+        return False
+
+    def _reveal_cell(self, row: int, col: int) -> None:
+        """Раскрытие клетки"""
+        self._revealed.set(row, col)
+        self._revealed_cells += 1
+        if self._mines.get(row, col):
+            self._is_mine_revealed_after_click = True
+
+    def _check_game_result(self, clicked_cell_row: int, clicked_cell_col: int) -> None:
+        """Проверяем результат игры: поражение при открытой мине, победа если закрытых клеток столько же, сколько мин"""
+        if self._is_mine_revealed_after_click or self._mines.get(clicked_cell_row, clicked_cell_col):
+            self._reveal_all_cells()
+        elif self.rows * self.cols - self._revealed_cells == self.mines:
+            self._is_win = True
+            self._reveal_all_cells()
+
+    def _reveal_all_cells(self) -> None:
+        """Переводит игру в конечное состояние, в котором все клетки считаются открытыми (см. is_cell_revealed)"""
+        self._is_gameover = True
+
+    def _get_num_of_mines(self, row: int, col: int) -> int:
+        """Читаем кол-во мин вокруг клетки из 4 битовых плоскостей"""
+        return sum(plane.get(row, col) << bit for bit, plane in enumerate(self._counts))
+
+    def _get_neighbours(self, row: int, col: int) -> Iterator[tuple[int, int]]:
+        """Возвращаем координаты соседних клеток"""
+        for row_ in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for col_ in range(max(col - 1, 0), min(col + 2, self.cols)):
+                if row_ != row or col_ != col:
+                    yield row_, col_
+
+    def _reveal_neighbours(self, clicked_cell_row: int, clicked_cell_col: int, is_revealed_now: bool) -> None:
+        """
+        Открываем соседние клетки по схеме MinesweeperModel._reveal_neighbours: после открытия клетки заливаем
+            соседей без мин, при повторном нажатии открываем соседей, если флагов вокруг столько же, сколько мин
+
+        Args:
+            clicked_cell_row: строка нажатой клетки
+            clicked_cell_col: столбец нажатой клетки
+            is_revealed_now: открылась ли клетка этим нажатием
+        """
+        neighbours: list[tuple[int, int]] = list(self._get_neighbours(clicked_cell_row, clicked_cell_col))
+
+        if is_revealed_now:
+            self._flood_fill(neighbours)
+        elif not self._mines.get(clicked_cell_row, clicked_cell_col):
+            marks_around: int = sum(self._flags.get(n_row, n_col) for n_row, n_col in neighbours)
+            if marks_around == self._get_num_of_mines(clicked_cell_row, clicked_cell_col):
+                self._flood_fill(neighbours, True)
+
+    def _flood_fill(self, start_cells: list[tuple[int, int]], reveal_mines: bool = False) -> None:
+        """
+        Заливка по полосам строк. Клетки своей полосы обрабатываются сразу, клетки других полос уходят в очередь
+            с выгрузкой на диск и обрабатываются, когда до их полосы дойдёт очередь
+
+        Args:
+            start_cells: клетки, с которых начинается заливка
+            reveal_mines: раскрывать ли мины
+        """
+        start: float = perf_counter()
+        revealed_before: int = self._revealed_cells
+
+        spill_queue: SpillQueue = SpillQueue(self._directory, self.spill_limit)
+        for row, col in start_cells:
+            spill_queue.push(row // self.band_rows, row * self.cols + col)
+
+        while spill_queue:
+            band, stack = spill_queue.pop_band()
+            band_start, band_stop = band * self.band_rows, min((band + 1) * self.band_rows, self.rows)
+
+            self._flood_fill_band(stack, spill_queue, band, band_start, band_stop, reveal_mines)
+            self._release_band(band_start, band_stop)
+
+        self._add_throughput('flood_fill', self._revealed_cells - revealed_before, perf_counter() - start)
+
+    def _flood_fill_band(
+            self,
+            stack: array,
+            spill_queue: SpillQueue,
+            band: int,
+            band_start: int,
+            band_stop: int,
+            reveal_mines: bool,
+    ) -> None:
+        """
+        Заливка внутри одной полосы. Самый горячий цикл модели, поэтому байты плоскостей читаются напрямую,
+            без вызовов BitPlane.get. Стек не растёт больше spill_limit клеток: лишние клетки своей полосы уходят
+            в очередь и обрабатываются следующим проходом полосы
+
+        Args:
+            stack: клетки полосы, которые нужно обработать
+            spill_queue: очередь для клеток других полос и переполнения стека
+            band: номер полосы
+            band_start: первая строка полосы
+            band_stop: строка после последней строки полосы
+            reveal_mines: раскрывать ли мины
+        """
+        rows, cols, band_rows, stride = self.rows, self.cols, self.band_rows, self._revealed.stride
+        stack_limit: int = self.spill_limit
+        revealed, flags, mines = self._revealed.buffer, self._flags.buffer, self._mines.buffer
+        count_0, count_1, count_2, count_3 = (plane.buffer for plane in self._counts)
+
+        revealed_cells: int = 0
+        while stack:
+            index: int = stack.pop()
+            row, col = divmod(index, cols)
+            offset: int = row * stride + (col >> 3)
+            bit: int = 1 << (col & 7)
+
+            if (revealed[offset] | flags[offset]) & bit:
+                continue
+            is_mine: int = mines[offset] & bit
+            if is_mine and not reveal_mines:
+                continue
+
+            revealed[offset] |= bit
+            revealed_cells += 1
+            if is_mine:
+                self._is_mine_revealed_after_click = True
+                continue
+            if (count_0[offset] | count_1[offset] | count_2[offset] | count_3[offset]) & bit:
+                continue
+
+            for n_row in range(max(row - 1, 0), min(row + 2, rows)):
+                for n_col in range(max(col - 1, 0), min(col + 2, cols)):
+                    n_offset: int = n_row * stride + (n_col >> 3)
+                    if (revealed[n_offset] | flags[n_offset]) >> (n_col & 7) & 1:
+                        continue
+                    if band_start <= n_row < band_stop:
+                        if len(stack) < stack_limit:
+                            stack.append(n_row * cols + n_col)
+                        else:
+                            spill_queue.push(band, n_row * cols + n_col)
+                    else:
+                        spill_queue.push(n_row // band_rows, n_row * cols + n_col)
+
+        self._revealed_cells += revealed_cells
+
+    def _preparing_board_after_first_click(self, clicked_cell_row: int, clicked_cell_col: int) -> None:
+        """Подготавливаем игровое поле после первого клика"""
+        self._is_first_click = False
+        self._place_mines(clicked_cell_row * self.cols + clicked_cell_col)
+        self._set_num_of_mines_around()
+
+    def _place_mines(self, excluded_index: int) -> None:
+        """
+        Размещает мины полосами строк: позиции мин выбираются последовательной выборкой в порядке возрастания,
+            поэтому запись в файл идёт подряд и обработанные полосы сразу отдаются ядру
+
+        Args:
+            excluded_index: индекс первой нажатой клетки, в ней мины быть не может
+        """
+        start: float = perf_counter()
+
+        band_start: int = 0
+        for position in sequential_sample(self.rows * self.cols - 1, self.mines, self._random):
+            index: int = position + (position >= excluded_index)
+            row, col = divmod(index, self.cols)
+
+            if row >= band_start + self.band_rows:
+                self._release_band(band_start, row // self.band_rows * self.band_rows)
+                band_start = row // self.band_rows * self.band_rows
+
+            self._mines.set(row, col)
+        self._release_band(band_start, self.rows)
+
+        self._add_throughput('placement', self.rows * self.cols, perf_counter() - start)
+
+    def _set_num_of_mines_around(self) -> None:
+        """
+        Считает числа полосами строк. Строка читается как целое число, восемь сдвинутых соседних строк
+            складываются побитовым сумматором сразу для всех клеток строки в 4 битовые плоскости
+        """
+        start: float = perf_counter()
+        mask: int = (1 << self.cols) - 1
+
+        previous_row: int = 0
+        current_row: int = self._mines.read_row(0) if self.rows else 0
+        for row in range(self.rows):
+            next_row: int = self._mines.read_row(row + 1) if row + 1 < self.rows else 0
+
+            bits: list[int] = [0, 0, 0, 0]
+            for neighbours in (
+                    (previous_row << 1) & mask, previous_row, previous_row >> 1,
+                    (current_row << 1) & mask, current_row >> 1,
+                    (next_row << 1) & mask, next_row, next_row >> 1,
+            ):
+                carry: int = neighbours
+                for bit in range(4):
+                    bits[bit], carry = bits[bit] ^ carry, bits[bit] & carry
+
+            for bit, plane in enumerate(self._counts):
+                plane.write_row(row, bits[bit])
+
+            previous_row, current_row = current_row, next_row
+
+            if (row + 1) % self.band_rows == 0 or row + 1 == self.rows:
+                self._release_band(row // self.band_rows * self.band_rows, row + 1)
+
+        self._add_throughput('counts', self.rows * self.cols, perf_counter() - start)
+
+    def _release_band(self, start_row: int, stop_row: int) -> None:
+        """Отдаёт ядру страницы полосы строк всех плоскостей"""
+        for plane in (self._mines, self._revealed, self._flags, *self._counts):
+            plane.release(start_row, stop_row)
+
+    def _add_throughput(self, phase: str, cells: int, seconds: float) -> None:
+        """Добавляет замер к этапу"""
+        self.throughput[phase].cells += cells
+        self.throughput[phase].seconds += seconds
+
+
+_NEGATIVE_ALPHA_INVERSE: int = -13   # Алгоритм D переходит на алгоритм A, когда выборка больше 1/13 остатка
+
+
+def sequential_sample(population: int, size: int, rng: Random) -> Iterator[int]:
+    """
+    Равновероятная выборка size различных чисел из range(population) в порядке возрастания
+        без хранения выборки в памяти. Алгоритм D Виттера: длина пропуска до следующего числа выбирается сразу,
+        поэтому время O(size), а не O(population). Когда выборка становится плотной, остаток выбирается
+        алгоритмом A
+
+    Args:
+        population: размер генеральной совокупности
+        size: размер выборки
+        rng: генератор случайных чисел
+
+    Returns:
+        Итератор по выбранным числам
+    """
+    position: int = -1
+    if size <= 0:
+        return
+
+    def random_open() -> float:
+        """Случайное число из (0, 1], от него берётся логарифм"""
+        return 1.0 - rng.random()
+
+    size_inverse: float = 1.0 / size
+    v_prime: float = exp(log(random_open()) * size_inverse)
+    qu1: int = population - size + 1
+    threshold: int = -_NEGATIVE_ALPHA_INVERSE * size
+
+    while size > 1 and threshold < population:
+        size_minus_1_inverse: float = 1.0 / (size - 1)
+        while True:
+            while True:   # Шаг D2: длина пропуска skip из непрерывного приближения
+                x: float = population * (1.0 - v_prime)
+                skip: int = int(x)
+                if skip < qu1:
+                    break
+                v_prime = exp(log(random_open()) * size_inverse)
+
+            y1: float = exp(log(random_open() * population / qu1) * size_minus_1_inverse)
+            v_prime = y1 * (1.0 - x / population) * (qu1 / (qu1 - skip))
+            if v_prime <= 1.0:   # Шаг D3: быстрая проверка принятия
+                break
+
+            y2: float = 1.0   # Шаг D4: точная проверка, O(min(skip, size)) умножений
+            top: float = population - 1.0
+            if size - 1 > skip:
+                bottom: float = population - size
+                limit: int = population - skip
+            else:
+                bottom = population - skip - 1.0
+                limit = qu1
+            for _ in range(population - 1, limit - 1, -1):
+                y2 = y2 * top / bottom
+                top -= 1.0
+                bottom -= 1.0
+
+            if population / (population - x) >= y1 * exp(log(y2) * size_minus_1_inverse):
+                v_prime = exp(log(random_open()) * size_minus_1_inverse)
+                break
+            v_prime = exp(log(random_open()) * size_inverse)
+
+        position += skip + 1
+        yield position
+
+        population -= skip + 1
+        size -= 1
+        size_inverse = size_minus_1_inverse
+        qu1 -= skip
+        threshold += _NEGATIVE_ALPHA_INVERSE
+
+    if size == 1:
+        yield position + int(population * v_prime) + 1
+    else:
+        for offset in _sequential_sample_a(population, size, rng):
+            yield position + 1 + offset
+
+
+def _sequential_sample_a(population: int, size: int, rng: Random) -> Iterator[int]:
+    """Алгоритм A Виттера: O(population), используется для плотного остатка выборки (см. sequential_sample)"""
+    position: int = -1
+    top: int = population - size
+    remaining: int = population
+
+    while size >= 2:
+        value: float = rng.random()
+        quot: float = top / remaining
+        while quot > value:
+            position += 1
+            top -= 1
+            remaining -= 1
+            quot = quot * top / remaining
+
+        position += 1
+        yield position
+
+        remaining -= 1
+        size -= 1
+
+    if size == 1:
+        position += int(remaining * rng.random()) + 1
+        yield position
+
+
+def main() -> None:
+    """Замер пропускной способности и резидентной памяти на большом поле"""
+    parser = ArgumentParser(description='Игра на поле в отображаемых в память файлах')
+    parser.add_argument('rows', type=int)
+    parser.add_argument('cols', type=int)
+    parser.add_argument('mines', type=int)
+    parser.add_argument('--directory', type=Path, default=None)
+    parser.add_argument('--band-rows', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    with MappedMinesweeperModel(
+            args.rows, args.cols, args.mines, args.directory, args.band_rows, args.seed
+    ) as model:
+        response: MinesweeperResponse = model(args.rows // 2, args.cols // 2, ActionType.OPEN)
+
+        for phase, throughput in model.throughput.items():
+            print(f'{phase}: {throughput.cells} cells, {throughput.seconds:.2f} s, '
+                  f'{throughput.cells_per_second:,.0f} cells/s')
+        print(f'gameover: {response.is_gameover}, win: {response.is_win}')
+        if getrusage is not None:
+            print(f'peak RSS: {getrusage(RUSAGE_SELF).ru_maxrss} KiB')
+
+
+if __name__ == '__main__':
+    main()
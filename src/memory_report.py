@@ -0,0 +1,253 @@
+"""Модуль отчёта о потреблении памяти полями разного размера и способа хранения"""
+
+__author__ = 'Шеряков Д.И.'
+
+import json
+import os
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Iterator
+
+from .dataclasses_ import BoardMemoryReport, PhaseMemory
+from .enums import ActionType
+from .mapped_model import MappedMinesweeperModel
+from .model import MinesweeperModel
+
+try:
+    from resource import RUSAGE_SELF, getrusage
+except ImportError:   # Модуль resource есть только в Unix
+    getrusage = None
+
+PHASES: tuple[str, ...] = ('construction', 'first_click', 'full_reveal')
+
+_PACKAGE_ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+def _create_list_model(rows: int, cols: int, mines: int, seed: int, _directory: Path) -> MinesweeperModel:
+    """Поле list[list[Cell]]"""
+    return MinesweeperModel(rows, cols, mines, seed=seed)
+
+
+def _create_mapped_model(rows: int, cols: int, mines: int, seed: int, directory: Path) -> MappedMinesweeperModel:
+    """Поле из битовых плоскостей в отображаемых в память файлах"""
+    return MappedMinesweeperModel(rows, cols, mines, directory, seed=seed)
+
+
+BACKENDS: dict[str, Callable[[int, int, int, int, Path], MinesweeperModel | MappedMinesweeperModel]] = {
+    'list': _create_list_model,
+    'mapped': _create_mapped_model,
+}
+
+
+def get_rss_bytes() -> int | None:
+    """Текущая резидентная память процесса, None если /proc недоступен"""
+    try:
+        with open('/proc/self/statm', encoding='ascii') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return None
+
+
+def get_peak_rss_bytes() -> int | None:
+    """Пик резидентной памяти процесса с момента запуска, None если модуль resource недоступен"""
+    if getrusage is None:
+        return None
+
+    peak: int = getrusage(RUSAGE_SELF).ru_maxrss
+
+    return peak if sys.platform == 'darwin' else peak * 1024   # На macOS в байтах, на Linux в килобайтах
+
+
+def _format_frame(frame: tracemalloc.Frame) -> str:
+    """Место выделения памяти, файлы пакета - относительно его корня"""
+    path: Path = Path(frame.filename)
+    if path.is_relative_to(_PACKAGE_ROOT):
+        path = path.relative_to(_PACKAGE_ROOT)
+
+    return f'{path}:{frame.lineno}'
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Снимок выделенной памяти без выделений самого замера, tracemalloc и импорта модулей"""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    ))
+
+
+def _measure_phase(phase: str, cells: int, action: Callable[[], object], top: int) -> tuple[object, PhaseMemory]:
+    """
+    Выполняет этап и замеряет память
+
+    Args:
+        phase: название этапа
+        cells: кол-во клеток поля
+        action: этап
+        top: кол-во мест с наибольшим приростом памяти
+
+    Returns:
+        Результат этапа и замер
+    """
+    before: tracemalloc.Snapshot = _take_snapshot()
+    tracemalloc.reset_peak()
+
+    start: float = perf_counter()
+    result: object = action()
+    seconds: float = perf_counter() - start
+
+    current, peak = tracemalloc.get_traced_memory()
+    statistics: list[tracemalloc.StatisticDiff] = _take_snapshot().compare_to(before, 'lineno')
+
+    return result, PhaseMemory(
+        phase=phase,
+        seconds=seconds,
+        traced_bytes=current,
+        traced_peak_bytes=peak,
+        bytes_per_cell=current / cells,
+        rss_bytes=get_rss_bytes(),
+        peak_rss_bytes=get_peak_rss_bytes(),
+        top_allocations=[
+            (_format_frame(statistic.traceback[0]), statistic.size_diff, statistic.count_diff)
+            for statistic in statistics[:top]
+        ],
+    )
+
+
+def _read_visible_board(model: MinesweeperModel | MappedMinesweeperModel) -> None:
+    """Читает все видимые клетки построчно, как при отрисовке итогового поля"""
+    for row in range(model.rows):
+        [model.get_visible_cell(row, col) for col in range(model.cols)]
+
+
+def measure_board(backend: str, rows: int, cols: int, mines: int, seed: int = 0, top: int = 5) -> BoardMemoryReport:
+    """
+    Замеряет память поля по этапам: создание модели, первый клик в центр поля (расстановка мин, числа, заливка),
+        полное раскрытие (переход в конец игры и чтение всех видимых клеток). Память python-объектов считается
+        с начала замера, память отображаемых файлов tracemalloc не видит, она входит только в резидентную память
+
+    Args:
+        backend: способ хранения поля из BACKENDS
+        rows: Кол-во строк игрового поля
+        cols: Кол-во столбцов игрового поля
+        mines: Кол-во мин на игровом поле
+        seed: Зерно генератора случайных чисел
+        top: кол-во мест с наибольшим приростом памяти на каждом этапе
+
+    Returns:
+        Отчёт
+    """
+    report = BoardMemoryReport(backend, rows, cols, mines)
+    cells: int = rows * cols
+
+    with TemporaryDirectory(prefix='minesweeper-memory-') as directory:
+        tracemalloc.start()
+        try:
+            model, phase_memory = _measure_phase(
+                'construction', cells, lambda: BACKENDS[backend](rows, cols, mines, seed, Path(directory)), top
+            )
+            report.phases.append(phase_memory)
+
+            _, phase_memory = _measure_phase(
+                'first_click', cells, lambda: model(rows // 2, cols // 2, ActionType.OPEN), top
+            )
+            report.phases.append(phase_memory)
+
+            def full_reveal() -> None:
+                model._reveal_all_cells()
+                _read_visible_board(model)
+
+            _, phase_memory = _measure_phase('full_reveal', cells, full_reveal, top)
+            report.phases.append(phase_memory)
+        finally:
+            tracemalloc.stop()
+
+        if isinstance(model, MappedMinesweeperModel):
+            model.close()
+
+    return report
+
+
+def report_memory(
+        backends: list[str],
+        sizes: list[tuple[int, int]],
+        density: float = 0.15,
+        seed: int = 0,
+        top: int = 5,
+        isolate: bool = True,
+) -> Iterator[BoardMemoryReport]:
+    """
+    Замеряет память полей всех размеров на всех способах хранения, отчёты выдаются по мере готовности
+
+    Args:
+        backends: способы хранения поля из BACKENDS
+        sizes: размеры полей (строки, столбцы)
+        density: доля мин на поле
+        seed: Зерно генератора случайных чисел
+        top: кол-во мест с наибольшим приростом памяти на каждом этапе
+        isolate: выполнять каждый замер в новом процессе, иначе пик резидентной памяти общий для всех замеров
+
+    Returns:
+        Итератор по отчётам в порядке способов хранения и размеров
+    """
+    tasks: list[tuple] = [
+        (backend, rows, cols, max(1, int(rows * cols * density)), seed, top)
+        for backend in backends
+        for rows, cols in sizes
+    ]
+    if not isolate:
+        for task in tasks:
+            yield measure_board(*task)
+        return
+
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for task in tasks:
+            yield executor.submit(measure_board, *task).result()
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    """Размер поля вида 1000 или 500x2000"""
+    rows, _, cols = value.partition('x')
+
+    return int(rows), int(cols or rows)
+
+
+def main() -> None:
+    """Запуск отчёта из командной строки"""
+    parser = ArgumentParser(description='Отчёт о потреблении памяти полями разного размера и способа хранения')
+    parser.add_argument('--sizes', type=_parse_size, nargs='+', default=[(100, 100), (300, 300), (1000, 1000)],
+                        help='размеры полей вида 1000 или 500x2000')
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument('--density', type=float, default=0.15)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--top', type=int, default=5)
+    parser.add_argument('--json', type=Path, default=None, help='файл для выгрузки отчёта')
+    args = parser.parse_args()
+
+    reports: list[BoardMemoryReport] = []
+    for report in report_memory(args.backends, args.sizes, args.density, args.seed, args.top):
+        reports.append(report)
+        print(f'{report.backend} {report.rows}x{report.cols}, {report.mines} mines')
+        for phase in report.phases:
+            rss: str = f'{phase.rss_bytes / 2 ** 20:9.1f}' if phase.rss_bytes is not None else '        -'
+            peak_rss: str = (
+                f'{phase.peak_rss_bytes / 2 ** 20:9.1f}' if phase.peak_rss_bytes is not None else '        -'
+            )
+            print(f'  {phase.phase:>12}: {phase.seconds:8.3f} s, traced {phase.traced_bytes / 2 ** 20:9.1f} MiB '
+                  f'(peak {phase.traced_peak_bytes / 2 ** 20:9.1f}), {phase.bytes_per_cell:8.1f} B/cell, '
+                  f'RSS {rss} MiB (peak {peak_rss})')
+            for place, size, count in phase.top_allocations:
+                print(f'      {size / 2 ** 20:+9.2f} MiB {count:+10d} blocks  {place}')
+
+    if args.json is not None:
+        args.json.write_text(json.dumps([asdict(report) for report in reports], indent=2), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
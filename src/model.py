@@ -2,17 +2,60 @@
 
 __author__ = 'Шеряков Д.И.'
 
-from typing import Callable
-from random import randint
+from base64 import b64decode, b64encode
+from time import perf_counter
+from typing import Callable, Iterable, Sequence
+from random import Random
 
-from .dataclasses_ import Cell, MinesweeperResponse
+from .dataclasses_ import BoardLayout, Cell, GameOverReveal, MinesweeperResponse, PhaseThroughput
 from .enums import ActionType
+from .topology import RectangleTopology, Topology, determine_area_of_neighbors, get_rectangle_topology
 
+_MASK_64: int = (1 << 64) - 1
 
-class MinesweeperModel:
-    """Класс игры сапёр"""
+_ZOBRIST_REVEALED: int = 0  # Слой ключей для открытых клеток
+_ZOBRIST_FLAG: int = 1      # Слой ключей для флагов
+_ZOBRIST_GAMEOVER: int = 2  # Слой ключа конца игры, берётся по размеру поля (строка rows, столбец cols)
+
+
+def _zobrist_key(row: int, col: int, layer: int) -> int:
+    """
+    Возвращает 64-битный ключ Зобриста для состояния клетки.
+    Ключи не хранятся в таблице, а вычисляются перемешиванием splitmix64, поэтому одинаковы для всех досок
+
+    Args:
+        row: индекс строки
+        col: индекс столбца
+        layer: слой состояния (_ZOBRIST_REVEALED, _ZOBRIST_FLAG или _ZOBRIST_GAMEOVER)
+
+    Returns:
+        Ключ клетки
+    """
+    value: int = ((((row << 32) | col) << 2 | layer) + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
 
-    def __init__(self, rows: int = 10, cols: int = 10, mines: int = 10) -> None:
+    return value ^ (value >> 31)
+
+
+class MinesweeperModel:
+    """
+    Класс игры сапёр. Первый клик готовит поле по этапам: расстановка мин, заливка (числа считаются только у
+        открываемых клеток), затем досчёт остальных чисел, пока не исчерпан бюджет first_click_budget_ms. Остаток
+        досчитывается вызовами finish_preparation или лениво при чтении видимого состояния клетки
+    """
+    first_click_budget_ms: float | None = 16.0   # None - досчитывать все числа сразу
+    count_chunk: int = 1024                      # Кол-во клеток между проверками бюджета при досчёте чисел
+
+    def __init__(
+            self,
+            rows: int = 10,
+            cols: int = 10,
+            mines: int = 10,
+            layout: BoardLayout | None = None,
+            seed: int | str | None = None,
+            topology: Topology | None = None,
+    ) -> None:
         """
         Инициализация параметров
 
@@ -20,12 +63,33 @@ class MinesweeperModel:
             rows: Кол-во строк игрового поля
             cols: Кол-во столбцов игрового поля
             mines: Кол-во мин на игровом поле
+            layout: Заранее сгенерированное поле (см. pregenerate_layout). Если передано, то после первого клика
+                мины только переносятся из открытой клетки, а не расставляются заново
+            seed: Зерно генератора случайных чисел для воспроизводимой расстановки мин
+            topology: Топология поля (прямоугольник, тор, шестиугольники, граф), по умолчанию прямоугольник
         """
         self.rows: int = rows
         self.cols: int = cols
         self.mines: int = mines
 
-        self._board: list[list[Cell]] = [[Cell() for _ in range(cols)] for _ in range(rows)]
+        if topology is not None and (topology.rows, topology.cols) != (rows, cols):
+            raise ValueError('Размеры топологии не совпадают с параметрами игры')
+
+        self._topology: Topology = topology if topology is not None else get_rectangle_topology(rows, cols)
+
+        self._random: Random = Random(seed)
+
+        if layout is not None and (layout.rows, layout.cols, len(layout.mine_positions)) != (rows, cols, mines):
+            raise ValueError('Размеры заранее сгенерированного поля не совпадают с параметрами игры')
+
+        self._layout: BoardLayout | None = layout
+        self._board: list[list[Cell]] = (
+            layout.board if layout is not None else [[Cell() for _ in range(cols)] for _ in range(rows)]
+        )
+        # Те же клетки по индексу строка * кол-во столбцов + столбец, для горячих циклов по индексам соседей
+        self._cells: list[Cell] = [cell for list_of_cells in self._board for cell in list_of_cells]
+        self._mine_positions: list[tuple[int, int]] = list(layout.mine_positions) if layout is not None else []
+        self._flag_positions: set[tuple[int, int]] = set()
 
         self._from_action_type_to_action: dict[str, Callable] = {
             ActionType.OPEN: self._open_cell,
@@ -35,10 +99,238 @@ class MinesweeperModel:
         self._is_win: bool = False
         self._is_gameover: bool = False
         self._installed_markers: int = 0
+        self._revealed_cells: int = 0
 
         self._is_first_click: bool = True
 
         self._revealed_cells_after_click: list[Cell] = []
+        self._changed_cells_after_click: list[tuple[int, int]] = []
+
+        self._uncounted_index: int = rows * cols   # Досчёт чисел идёт с этой клетки, rows * cols - досчитывать нечего
+        self.throughput: dict[str, PhaseThroughput] = {
+            'placement': PhaseThroughput(),
+            'flood_fill': PhaseThroughput(),   # Включает подсчёт чисел открываемых клеток
+            'counts': PhaseThroughput(),
+            'game_result': PhaseThroughput(),   # Проверка мин среди открытых клеток и победы
+        }
+
+        self._state_hash: int = 0
+
+        self._game_over_reveal: GameOverReveal | None = None
+
+    @classmethod
+    def pregenerate_layout(
+            cls,
+            rows: int,
+            cols: int,
+            mines: int,
+            seed: int | str | None = None,
+            topology: Topology | None = None,
+    ) -> BoardLayout:
+        """
+        Заранее генерирует поле с минами и посчитанными числами без учёта первого клика
+
+        Args:
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+            mines: Кол-во мин на игровом поле
+            seed: Зерно генератора случайных чисел
+            topology: Топология поля, с ней же нужно создавать модель
+
+        Returns:
+            Поле, которое можно передать в конструктор модели
+        """
+        model = cls(rows, cols, mines, seed=seed, topology=topology)
+        model._place_mines()
+        model._set_num_of_mines_around()
+
+        return BoardLayout(rows=rows, cols=cols, board=model._board, mine_positions=model._mine_positions)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, seed: int | str | None = None) -> 'MinesweeperModel':
+        """
+        Восстанавливает модель из снимка (см. to_snapshot)
+
+        Args:
+            snapshot: снимок
+            seed: Зерно генератора случайных чисел, нужно только если первого клика ещё не было
+
+        Returns:
+            Модель в состоянии на момент снимка
+        """
+        model = cls(snapshot['rows'], snapshot['cols'], snapshot['mines'], seed=seed)
+        if snapshot['is_first_click']:
+            return model
+
+        model._is_first_click = False
+        for index in snapshot['mine_positions']:
+            row, col = divmod(index, model.cols)
+            model._board[row][col].is_mine = True
+            model._mine_positions.append((row, col))
+        model._set_num_of_mines_around()
+
+        revealed: bytes = b64decode(snapshot['revealed'])
+        for index in range(model.rows * model.cols):
+            if revealed[index >> 3] >> (index & 7) & 1:
+                model._reveal_cell(*divmod(index, model.cols))
+        for index in snapshot['flag_positions']:
+            model._mark_cell(*divmod(index, model.cols))
+
+        model._revealed_cells_after_click = []
+        model._changed_cells_after_click = []
+
+        if snapshot['is_gameover']:
+            model._is_win = snapshot['is_win']
+            model._reveal_all_cells()
+
+        return model
+
+    def to_snapshot(self) -> dict:
+        """
+        Компактный снимок состояния для сохранения: мины и флаги списками индексов клеток, открытые клетки битовой
+            маской в base64. Числа вокруг клеток не сохраняются, они пересчитываются при восстановлении. Снимок
+            восстанавливается на прямоугольном поле, поэтому модели других топологий сохранять нельзя
+
+        Returns:
+            Снимок, который можно сериализовать в JSON
+        """
+        if not isinstance(self._topology, RectangleTopology):
+            raise ValueError(f'Снимок поддерживает только прямоугольное поле, а не {type(self._topology).__name__}')
+
+        revealed: bytearray = bytearray((self.rows * self.cols + 7) // 8)
+        mine_positions: list[int] = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cell: Cell = self._board[row][col]
+                index: int = row * self.cols + col
+                if cell.is_revealed:
+                    revealed[index >> 3] |= 1 << (index & 7)
+                if cell.is_mine:
+                    mine_positions.append(index)
+
+        return {
+            'rows': self.rows,
+            'cols': self.cols,
+            'mines': self.mines,
+            'is_first_click': self._is_first_click,
+            'is_win': self._is_win,
+            'is_gameover': self._is_gameover,
+            'mine_positions': mine_positions,
+            'revealed': b64encode(revealed).decode('ascii'),
+            'flag_positions': sorted(row * self.cols + col for row, col in self._flag_positions),
+        }
+
+    @property
+    def state_hash(self) -> int:
+        """
+        Хеш видимого состояния доски (открытые клетки и флаги), обновляется за O(1) на каждое изменение клетки.
+            В конце игры видны все клетки, поэтому хеш заменяется одним ключом конца игры для размера поля
+        """
+        return self._state_hash
+
+    def get_visible_cell(self, row: int, col: int) -> int:
+        """
+        Возвращает состояние клетки, видимое игроку
+
+        Args:
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Число мин вокруг открытой клетки или значение VisibleCell
+        """
+        return self._get_cell_state(row, col, self._is_gameover)
+
+    def get_played_cell(self, row: int, col: int) -> int:
+        """
+        Возвращает состояние клетки на момент последнего хода: в отличие от get_visible_cell, в конце игры закрытые
+            клетки остаются закрытыми. Нужно для перерисовки поля gui, которое после конца игры показывает только
+            открытые клетки, мины и ошибочные флаги
+
+        Args:
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Число мин вокруг открытой клетки или значение VisibleCell
+        """
+        return self._get_cell_state(row, col, False)
+
+    def _get_cell_state(self, row: int, col: int, is_gameover: bool) -> int:
+        """Состояние клетки, видимое игроку, с досчётом числа, если оно ещё не посчитано (см. finish_preparation)"""
+        visible: int | None = self._board[row][col].get_visible(is_gameover)
+        if visible is None and not self._is_first_click:
+            visible = self._count_mines_around(row, col)
+
+        return visible
+
+    @property
+    def is_prepared(self) -> bool:
+        """Все числа мин вокруг клеток посчитаны (до первого клика считать нечего)"""
+        return self._uncounted_index >= self.rows * self.cols
+
+    @property
+    def is_win(self) -> bool:
+        """Победа"""
+        return self._is_win
+
+    @property
+    def is_gameover(self) -> bool:
+        """Игра окончена"""
+        return self._is_gameover
+
+    def is_mine(self, row: int, col: int) -> bool:
+        """
+        Есть ли в клетке мина. Скрытое от игрока состояние, нужно для симуляций и разметки данных
+
+        Args:
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Есть ли в клетке мина (до первого клика мин на поле нет)
+        """
+        return self._board[row][col].is_mine
+
+    def is_cell_revealed(self, row: int, col: int) -> bool:
+        """
+        Открыта ли клетка. По окончании игры все клетки считаются открытыми
+
+        Args:
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Открыта ли клетка
+        """
+        return self._is_gameover or self._board[row][col].is_revealed
+
+    @property
+    def game_over_reveal(self) -> GameOverReveal | None:
+        """Мины и ошибочные флаги, которые показываются по окончании игры, None - игра не окончена"""
+        return self._game_over_reveal
+
+    def get_visible_board(self) -> list[list[int]]:
+        """Возвращает видимое игроку состояние всех клеток поля (см. get_visible_cell)"""
+        return self._get_board_state(self._is_gameover)
+
+    def get_played_board(self) -> list[list[int]]:
+        """Возвращает состояние всех клеток поля на момент последнего хода (см. get_played_cell)"""
+        return self._get_board_state(False)
+
+    def _get_board_state(self, is_gameover: bool) -> list[list[int]]:
+        """Состояние всех клеток поля, видимое игроку, с досчётом ещё не посчитанных чисел"""
+        visible_board: list[list[int | None]] = [
+            [cell.get_visible(is_gameover) for cell in list_of_cells] for list_of_cells in self._board
+        ]
+
+        if not self.is_prepared:
+            for row, list_of_values in enumerate(visible_board):
+                for col, value in enumerate(list_of_values):
+                    if value is None:
+                        list_of_values[col] = self._count_mines_around(row, col)
+
+        return visible_board
 
     def __call__(self, clicked_cell_row: int, clicked_cell_col: int, action_type: ActionType) -> MinesweeperResponse:
         """
@@ -52,22 +344,46 @@ class MinesweeperModel:
         Returns:
             Ответ содержащий данные о текущем состоянии игры(победа?, поражение?, игровое поле)
         """
-        action: Callable[[dict], None] = self._from_action_type_to_action[action_type]
-        action(clicked_cell_row, clicked_cell_col)
-
-        if self._is_first_click and action_type == ActionType.OPEN:
-            self._preparing_board_after_first_click()
-
-        if action_type == ActionType.OPEN:
-            self._reveal_neighbours(clicked_cell_row, clicked_cell_col)
-            self._check_game_result(clicked_cell_row, clicked_cell_col)
-
-        self._revealed_cells_after_click = []
+        if not self._is_gameover:
+            start: float = perf_counter()
+            action: Callable[[dict], None] = self._from_action_type_to_action[action_type]
+            action(clicked_cell_row, clicked_cell_col)
+
+            is_first_open: bool = self._is_first_click and action_type == ActionType.OPEN
+            if is_first_open:
+                self._preparing_board_after_first_click()
+
+            if action_type == ActionType.OPEN:
+                flood_fill_start: float = perf_counter()
+                self._reveal_neighbours(clicked_cell_row, clicked_cell_col)
+                if is_first_open:
+                    self._add_throughput(
+                        'flood_fill', len(self._changed_cells_after_click), perf_counter() - flood_fill_start
+                    )
+                game_result_start: float = perf_counter()
+                self._check_game_result(clicked_cell_row, clicked_cell_col)
+                if is_first_open:
+                    self._add_throughput(
+                        'game_result', len(self._revealed_cells_after_click), perf_counter() - game_result_start
+                    )
+
+            if is_first_open and not self.is_prepared:
+                budget_ms: float | None = self.first_click_budget_ms
+                self.finish_preparation(
+                    None if budget_ms is None else max(0.0, budget_ms - (perf_counter() - start) * 1000)
+                )
+
+            self._revealed_cells_after_click = []
+
+        changed_cells: list[tuple[int, int]] = self._changed_cells_after_click
+        self._changed_cells_after_click = []
 
         return MinesweeperResponse(
             is_win=self._is_win,
             is_gameover=self._is_gameover,
             board=self._board,
+            game_over_reveal=self._game_over_reveal,
+            changed_cells=changed_cells,
         )
 
     def _check_game_result(self, clicked_cell_row: int, clicked_cell_col: int) -> None:
@@ -90,27 +406,26 @@ class MinesweeperModel:
             self._reveal_all_cells()
 
     def _check_win(self) -> bool:
-        """Проверка условия победы: кол-во закрытых клеток == кол-во мин"""
-        unrevealed_cells: int = 0
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if not self._board[row][col].is_revealed:
-                    unrevealed_cells += 1
-
-        return unrevealed_cells == self.mines
+        """Проверка условия победы: кол-во закрытых клеток == кол-во мин, открытые клетки считает _reveal_cell"""
+        return self.rows * self.cols - self._revealed_cells == self.mines
 
     def _open_cell(self, clicked_cell_row: int, clicked_cell_col: int) -> None:
         """Открываем клетку"""
         current_cell: Cell = self._board[clicked_cell_row][clicked_cell_col]
         if not current_cell.is_set_flag and not current_cell.is_revealed:
-            self._reveal_cell(current_cell)
+            self._reveal_cell(clicked_cell_row, clicked_cell_col)
 
     def _reveal_all_cells(self) -> None:
-        """Помечает все клетки открытыми"""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                self._board[row][col].is_revealed = True
-                self._board[row][col].is_set_flag = False
+        """
+        Переводит игру в конечное состояние, в котором все клетки считаются открытыми (см. is_cell_revealed).
+            Сами клетки не изменяются: показать нужно только мины и ошибочные флаги, их список собирается за O(мин)
+        """
+        self._is_gameover = True
+        self._state_hash = _zobrist_key(self.rows, self.cols, _ZOBRIST_GAMEOVER)   # Все клетки открыты, флагов нет
+        self._game_over_reveal = GameOverReveal(
+            mines=list(self._mine_positions),
+            wrong_flags=[(row, col) for row, col in self._flag_positions if not self._board[row][col].is_mine],
+        )
 
     def _mark_cell(self, clicked_cell_row: int, clicked_cell_col: int) -> None:
         """
@@ -124,6 +439,9 @@ class MinesweeperModel:
 
         if not current_cell.is_revealed and not self._is_first_click:
             current_cell.is_set_flag = not current_cell.is_set_flag
+            self._state_hash ^= _zobrist_key(clicked_cell_row, clicked_cell_col, _ZOBRIST_FLAG)
+            self._flag_positions ^= {(clicked_cell_row, clicked_cell_col)}
+            self._changed_cells_after_click.append((clicked_cell_row, clicked_cell_col))
 
     def _reveal_neighbours(self, clicked_cell_row: int, clicked_cell_col: int) -> None:
         """
@@ -137,48 +455,63 @@ class MinesweeperModel:
             clicked_cell_row: строка нажатой клетки
             clicked_cell_col: столбец нажатой клетки
         """
-        neighbours: list[tuple[int, int]] = self._get_neighbours(clicked_cell_row, clicked_cell_col)
-        stack: set[tuple[int, int]] = set(neighbours)
+        stack: set[int] = set(self._topology.neighbour_indexes(clicked_cell_row * self.cols + clicked_cell_col))
 
         if not self._revealed_cells_after_click:
+            self._count_mines_around(clicked_cell_row, clicked_cell_col)   # Число могло ещё не быть досчитано
             if self._check_marks_around_equal_mines_around(
                     self._board[clicked_cell_row][clicked_cell_col],
-                    neighbours
+                    self._get_neighbours(clicked_cell_row, clicked_cell_col)
             ):
                 self._reveal_neighbours_impl(stack, True)
         else:
             self._reveal_neighbours_impl(stack)
 
-    def _reveal_neighbours_impl(self, stack: set[tuple[int, int]], reveal_mines: bool = False) -> None:
+    def _reveal_neighbours_impl(self, stack: set[int], reveal_mines: bool = False) -> None:
         """
         В цикле обрабатываем каждого соседа. По условию раскрываем его. Если у соседа 0 мин вокруг, то добавляем его
-            соседей в очередь на раскрытие.
+            соседей в очередь на раскрытие. Клетки хранятся плоскими индексами, координаты нужны только открываемым
 
         Args:
-            stack: Множество с соседями
+            stack: Множество с индексами соседей (строка * кол-во столбцов + столбец)
             reveal_mines: Раскрывать ли мины
         """
+        cells: list[Cell] = self._cells
+        neighbour_indexes: Callable[[int], Sequence[int]] = self._topology.neighbour_indexes
         while stack:
-            current_row, current_col = stack.pop()
-            current_cell: Cell = self._board[current_row][current_col]
+            index: int = stack.pop()
+            current_cell: Cell = cells[index]
 
             if (not current_cell.is_mine or reveal_mines) and not current_cell.is_revealed and not current_cell.is_set_flag:
-                self._reveal_cell(current_cell)
+                self._reveal_cell(*divmod(index, self.cols))
 
-                if current_cell.num_of_mines_around is not None and current_cell.num_of_mines_around == 0:
-                    stack.update(self._get_neighbours(current_row, current_col))
+                if current_cell.num_of_mines_around == 0:
+                    stack.update(neighbour_indexes(index))
 
-    def _reveal_cell(self, cell: Cell) -> None:
+    def _reveal_cell(self, row: int, col: int) -> None:
         """
         Раскрытие клетки
 
         Args:
-            cell: клетка
+            row: индекс строки
+            col: индекс столбца
         """
+        cell: Cell = self._board[row][col]
+        if not cell.is_revealed:
+            self._state_hash ^= _zobrist_key(row, col, _ZOBRIST_REVEALED)
+            self._revealed_cells += 1
+
         cell.is_revealed = True
+        if not self._is_first_click:   # До расстановки мин считать числа рано (см. _preparing_board_after_first_click)
+            self._count_mines_around(row, col)
         self._revealed_cells_after_click.append(cell)
+        self._changed_cells_after_click.append((row, col))
 
-    def _check_marks_around_equal_mines_around(self, clicked_cell: Cell, neighbours: list[tuple[int, int]]) -> bool:
+    def _check_marks_around_equal_mines_around(
+            self,
+            clicked_cell: Cell,
+            neighbours: Iterable[tuple[int, int]],
+    ) -> bool:
         """
         Проверяет кол-во флагов и мин вокруг нажатой клетки
 
@@ -196,28 +529,135 @@ class MinesweeperModel:
 
         return num_of_marks_around == clicked_cell.num_of_mines_around
 
+    def finish_preparation(self, budget_ms: float | None = None) -> bool:
+        """
+        Досчитывает числа мин вокруг клеток, которые не понадобились при первом клике. Вызывается частями,
+            например из цикла событий gui, пока не вернёт True
+
+        Args:
+            budget_ms: максимальное время досчёта, None - досчитать всё
+
+        Returns:
+            Все ли числа посчитаны
+        """
+        start: float = perf_counter()
+        deadline: float = start + budget_ms / 1000 if budget_ms is not None else float('inf')
+        cells: int = self.rows * self.cols
+        counted: int = 0
+
+        while self._uncounted_index < cells and perf_counter() < deadline:
+            stop: int = min(self._uncounted_index + self.count_chunk, cells)
+            for index in range(self._uncounted_index, stop):
+                cell: Cell = self._cells[index]
+                if cell.num_of_mines_around is None and not cell.is_mine:
+                    cell.num_of_mines_around = self._get_num_of_mines(*divmod(index, self.cols))
+                    counted += 1
+            self._uncounted_index = stop
+
+        self._add_throughput('counts', counted, perf_counter() - start)
+
+        return self.is_prepared
+
     def _preparing_board_after_first_click(self):
-        """Подготавливаем игровое поле после первого клика"""
+        """
+        Подготавливаем игровое поле после первого клика. Числа мин вокруг клеток здесь не считаются: открываемые
+            клетки считают их сами (см. _reveal_cell), остальные досчитывает finish_preparation
+        """
         self._is_first_click = False
+        if self._layout is not None:
+            self._relocate_mines_from_revealed_cells()
+            return
+
+        start: float = perf_counter()
         self._place_mines()
-        self._set_num_of_mines_around()
+        self._add_throughput('placement', self.mines, perf_counter() - start)
+
+        self._uncounted_index = 0
+        for row, col in self._changed_cells_after_click:   # Нажатая клетка открылась до расстановки мин
+            self._count_mines_around(row, col)
+
+    def _count_mines_around(self, row: int, col: int) -> int | None:
+        """Считает и запоминает число мин вокруг клетки, если оно ещё не посчитано. У мины числа нет"""
+        cell: Cell = self._board[row][col]
+        if cell.num_of_mines_around is None and not cell.is_mine:
+            cell.num_of_mines_around = self._get_num_of_mines(row, col)
+
+        return cell.num_of_mines_around
+
+    def _add_throughput(self, phase: str, cells: int, seconds: float) -> None:
+        """Добавляет замер этапа подготовки поля"""
+        throughput: PhaseThroughput = self.throughput[phase]
+        throughput.cells += cells
+        throughput.seconds += seconds
 
     def _place_mines(self) -> None:
-        """Метод размещает мины на поле случайным образом исключая первую нажатую клетку"""
+        """
+        Метод размещает мины на поле случайным образом исключая открытые клетки (первую нажатую клетку). Клетки
+            выбираются одной выборкой без повторений с запасом на открытые клетки, а не по одной с отбраковкой
+        """
+        cells: int = self.rows * self.cols
+        candidates: list[int] = self._random.sample(
+            range(cells), min(cells, self.mines + len(self._revealed_cells_after_click))
+        )
         placed_mines: int = 0
-        while placed_mines < self.mines:
-            current_cell: Cell = self._board[randint(0, self.rows - 1)][randint(0, self.cols - 1)]
+        for index in candidates:
+            if placed_mines == self.mines:
+                break
 
-            if not current_cell.is_mine and not current_cell.is_revealed:
+            row, col = divmod(index, self.cols)
+            current_cell: Cell = self._board[row][col]
+            if not current_cell.is_revealed:
                 current_cell.is_mine = True
+                self._mine_positions.append((row, col))
                 placed_mines += 1
 
+    def _relocate_mines_from_revealed_cells(self) -> None:
+        """
+        Переносит мины заранее сгенерированного поля из открытых клеток в случайные свободные клетки и
+            пересчитывает числа только вокруг старой и новой позиции мины
+        """
+        for index, (row, col) in enumerate(self._mine_positions):
+            current_cell: Cell = self._board[row][col]
+            if not current_cell.is_revealed:
+                continue
+
+            while True:
+                new_row, new_col = self._random.randint(0, self.rows - 1), self._random.randint(0, self.cols - 1)
+                new_cell: Cell = self._board[new_row][new_col]
+                if not new_cell.is_mine and not new_cell.is_revealed:
+                    break
+
+            current_cell.is_mine = False
+            new_cell.is_mine = True
+            new_cell.num_of_mines_around = None
+            self._mine_positions[index] = (new_row, new_col)
+
+            affected_cells: set[tuple[int, int]] = {(row, col)}
+            affected_cells.update(self._get_neighbours(row, col))
+            affected_cells.update(self._get_neighbours(new_row, new_col))
+            for affected_row, affected_col in affected_cells:
+                if not self._board[affected_row][affected_col].is_mine:
+                    self._board[affected_row][affected_col].num_of_mines_around = self._get_num_of_mines(
+                        affected_row, affected_col
+                    )
+
     def _set_num_of_mines_around(self) -> None:
-        """Устанавливаем кол-во мин вокруг клетки в num_of_mines_around"""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if not self._board[row][col].is_mine:
-                    self._board[row][col].num_of_mines_around = self._get_num_of_mines(row, col)
+        """
+        Устанавливаем кол-во мин вокруг клетки в num_of_mines_around. Каждая мина добавляет единицу своим соседям,
+            поэтому соседей перебираем только у мин, а не у всех клеток
+        """
+        neighbour_indexes: Callable[[int], Sequence[int]] = self._topology.neighbour_indexes
+        counts: list[int] = [0] * len(self._cells)
+        for index, cell in enumerate(self._cells):
+            if cell.is_mine:
+                for neighbour in neighbour_indexes(index):
+                    counts[neighbour] += 1
+
+        for cell, count in zip(self._cells, counts):
+            if not cell.is_mine:
+                cell.num_of_mines_around = count
+
+        self._uncounted_index = self.rows * self.cols
 
     def _get_num_of_mines(self, row: int, col: int) -> int:
         """
@@ -231,38 +671,29 @@ class MinesweeperModel:
             Кол-во мин
         """
         mines: int = 0
-        neighbours: list[tuple[int, int]] = self._get_neighbours(row, col)
-        for n_row, n_col in neighbours:
-            if self._board[n_row][n_col].is_mine:
+        cells: list[Cell] = self._cells
+        for neighbour in self._topology.neighbour_indexes(row * self.cols + col):
+            if cells[neighbour].is_mine:
                 mines += 1
 
         return mines
 
-    def _get_neighbours(self, row: int, col: int) -> list[tuple[int, int]]:
+    def _get_neighbours(self, row: int, col: int) -> tuple[tuple[int, int], ...]:
         """
-        Возвращаем список кортежей координат соседних клеток по указанной клетке
+        Возвращаем кортежи координат соседних клеток по указанной клетке из топологии
 
         Args:
             row: индекс строки
             col: индекс столбца
 
         Returns:
-            Список из кортежей (индекс_строки, индекс_столбца)
+            Кортеж из кортежей (индекс_строки, индекс_столбца)
         """
-        min_row, max_row, min_col, max_col = self._determine_area_of_neighbors(row, col)
-
-        neighbours: list[tuple[int, int]] = []
-        for row_ in range(min_row, max_row + 1):
-            for col_ in range(min_col, max_col + 1):
-                neighbour_row_col = (row_, col_)
-                if neighbour_row_col != (row, col):
-                    neighbours.append(neighbour_row_col)
-
-        return neighbours
+        return self._topology.neighbours(row, col)
 
     def _determine_area_of_neighbors(self, row: int, col: int) -> tuple[int, int, int, int]:
         """
-        Определяем область поиска соседей вокруг клетки
+        Определяем область поиска соседей вокруг клетки прямоугольного поля
 
         Args:
             row: индекс строки
@@ -271,9 +702,4 @@ class MinesweeperModel:
         Returns:
             Кортеж из значений: начальная строка, конечная строка, начальный столбец, конечный столбец
         """
-        min_row = row - 1 if row > 0 else 0
-        max_row = row + 1 if row < self.rows - 1 else self.rows - 1
-        min_col = col - 1 if col > 0 else 0
-        max_col = col + 1 if col < self.cols - 1 else self.cols - 1
-
-        return min_row, max_row, min_col, max_col
+        return determine_area_of_neighbors(self.rows, self.cols, row, col)
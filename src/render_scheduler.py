@@ -0,0 +1,117 @@
+"""Модуль с планировщиком отрисовки игровой доски"""
+
+__author__ = 'Шеряков Д.И.'
+
+import tkinter as tk
+from time import perf_counter
+from typing import Callable, Iterable
+
+from .dataclasses_ import CellView
+from .enums import Tile
+
+
+class RenderScheduler:
+    """
+    Класс-планировщик отрисовки. Изменённые клетки из нескольких ответов модели накапливаются и перерисовываются
+        не чаще одного раза за кадр. Клетке одним вызовом configure передаётся ссылка на общее изображение её вида
+        (см. TileCache), клетка пропускается, если её вид не изменился. Если за кадр не успели перерисовать все
+        клетки, остаток переносится на следующий кадр
+    """
+
+    def __init__(
+            self,
+            root: tk.Misc,
+            get_gui_cell: Callable[[int, int], CellView],
+            get_cell_state: Callable[[int, int], Tile],
+            get_image: Callable[[Tile], tk.PhotoImage],
+            frame_ms: int = 16,
+            frame_budget_ms: float = 8.0,
+    ) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            root: виджет, через который планируются after/after_idle
+            get_gui_cell: возвращает gui клетку по строке и столбцу
+            get_cell_state: возвращает нужный вид клетки по строке и столбцу
+            get_image: возвращает изображение вида клетки
+            frame_ms: минимальный интервал между перерисовками
+            frame_budget_ms: максимальное время одной перерисовки
+        """
+        self.frame_ms: int = frame_ms
+        self.frame_budget_ms: float = frame_budget_ms
+
+        self._root: tk.Misc = root
+        self._get_gui_cell: Callable[[int, int], CellView] = get_gui_cell
+        self._get_cell_state: Callable[[int, int], Tile] = get_cell_state
+        self._get_image: Callable[[Tile], tk.PhotoImage] = get_image
+
+        self._dirty_cells: dict[tuple[int, int], None] = {}   # Упорядоченное множество
+        self._rendered: dict[tuple[int, int], Tile] = {}
+        self._after_id: str | None = None
+        self._last_flush: float = 0.0
+
+    def mark_dirty(self, cells: Iterable[tuple[int, int]]) -> None:
+        """
+        Добавляет клетки в очередь на перерисовку и планирует кадр
+
+        Args:
+            cells: координаты клеток (строка, столбец)
+        """
+        self._dirty_cells.update(dict.fromkeys(cells))
+        self._schedule()
+
+    def reset(self) -> None:
+        """Сбрасывает очередь и запомненный вид клеток, например после сброса gui клеток для новой игры или масштаба"""
+        self._cancel()
+        self._dirty_cells.clear()
+        self._rendered.clear()
+
+    def flush(self, budget_ms: float | None = None) -> None:
+        """
+        Перерисовывает клетки из очереди
+
+        Args:
+            budget_ms: максимальное время перерисовки, None - перерисовать всю очередь
+        """
+        self._cancel()
+        deadline: float = perf_counter() + budget_ms / 1000 if budget_ms is not None else float('inf')
+
+        while self._dirty_cells and perf_counter() < deadline:
+            for _ in range(64):   # Время проверяется пачками, чтобы не вызывать perf_counter на каждую клетку
+                if not self._dirty_cells:
+                    break
+                row_col: tuple[int, int] = next(iter(self._dirty_cells))
+                del self._dirty_cells[row_col]
+                self._render_cell(*row_col)
+
+        self._last_flush = perf_counter()
+        if self._dirty_cells:
+            self._schedule()
+
+    def _render_cell(self, row: int, col: int) -> None:
+        """Настраивает gui клетку одним вызовом, если её вид изменился"""
+        tile: Tile = self._get_cell_state(row, col)
+        if self._rendered.get((row, col), Tile.HIDDEN) == tile:
+            return
+
+        self._get_gui_cell(row, col).configure(image=self._get_image(tile))
+        self._rendered[(row, col)] = tile
+
+    def _cancel(self) -> None:
+        """Отменяет запланированную перерисовку"""
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _schedule(self) -> None:
+        """Планирует перерисовку: сразу по простою цикла событий или в начале следующего кадра"""
+        if self._after_id is not None:
+            return
+
+        delay_ms: int = int(self.frame_ms - (perf_counter() - self._last_flush) * 1000)
+        callback: Callable[[], None] = lambda: self.flush(self.frame_budget_ms)
+        if delay_ms > 0:
+            self._after_id = self._root.after(delay_ms, callback)
+        else:
+            self._after_id = self._root.after_idle(callback)
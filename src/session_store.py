@@ -0,0 +1,341 @@
+"""Модуль хранилища игровых сессий на журнале событий со снимками"""
+
+__author__ = 'Шеряков Д.И.'
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from pathlib import Path
+from secrets import randbits
+from time import monotonic
+from typing import IO
+
+from .dataclasses_ import MinesweeperResponse, StoredSession
+from .enums import ActionType
+from .model import MinesweeperModel
+
+
+def _replay(session: StoredSession) -> MinesweeperModel:
+    """Восстанавливает модель сессии: загружает снимок и повторяет действия после него"""
+    if session.snapshot is not None:
+        model = MinesweeperModel.from_snapshot(session.snapshot, seed=session.seed)
+    else:
+        model = MinesweeperModel(session.rows, session.cols, session.mines, seed=session.seed)
+
+    for row, col, action_type in session.actions:
+        model(row, col, ActionType(action_type))
+
+    return model
+
+
+def _replay_to_snapshots(sessions: list[tuple[str, StoredSession]]) -> list[tuple[str, dict]]:
+    """Повторяет хвосты журнала части сессий в рабочем процессе и возвращает компактные снимки"""
+    return [(session_id, _replay(session).to_snapshot()) for session_id, session in sessions]
+
+
+class SessionStore:
+    """
+    Класс хранилища сессий в локальном каталоге. Каждое действие дописывается строкой JSON в текущий сегмент журнала,
+        fsync выполняется пачками: раз в fsync_every действий или не реже раза в fsync_interval секунд на следующем
+        действии, поэтому при сбое питания теряется не больше одной пачки. Партии детерминированы зерном, поэтому
+        журнал хранит только действия игрока.
+        Раз в snapshot_every действий все сессии сохраняются компактным снимком, после чего старые сегменты удаляются.
+        При восстановлении читается последний снимок и только хвост журнала после него, модели сессий по умолчанию
+        восстанавливаются лениво при первом обращении
+    """
+
+    def __init__(
+            self,
+            directory: Path,
+            fsync_every: int = 256,
+            fsync_interval: float = 0.05,
+            snapshot_every: int = 100_000,
+    ) -> None:
+        """
+        Инициализация параметров. Для открытия существующего хранилища используется recover
+
+        Args:
+            directory: каталог хранилища
+            fsync_every: кол-во действий в одной пачке fsync
+            fsync_interval: максимальный интервал между fsync в секундах
+            snapshot_every: кол-во действий между снимками, 0 - снимки только по вызову checkpoint
+        """
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fsync_every: int = fsync_every
+        self.fsync_interval: float = fsync_interval
+        self.snapshot_every: int = snapshot_every
+
+        self._sessions: dict[str, StoredSession] = {}
+        self._models: dict[str, MinesweeperModel] = {}
+        self._dirty: set[str] = set()   # Сессии, изменённые после последнего снимка
+
+        segments: list[int] = self._list_numbers('events-*.log')
+        self._segment: int = segments[-1] + 1 if segments else 0
+        self._log: IO[str] = self._open_segment()
+        self._unsynced: int = 0
+        self._last_sync: float = monotonic()
+        self._actions_since_snapshot: int = 0
+
+    @classmethod
+    def recover(cls, directory: Path, workers: int | None = 0, **kwargs) -> 'SessionStore':
+        """
+        Открывает хранилище: загружает последний снимок и хвост журнала после него. По умолчанию хвост сессии
+            повторяется при первом обращении к ней, поэтому открытие занимает только чтение файлов. Иначе хвосты
+            разных сессий сразу повторяются параллельно на пуле процессов. Недописанный при сбое временный файл
+            снимка удаляется
+
+        Args:
+            directory: каталог хранилища
+            workers: кол-во рабочих процессов, 0 - повторять хвост при обращении, None - кол-во процессоров
+            **kwargs: параметры SessionStore
+
+        Returns:
+            Хранилище с восстановленными сессиями
+        """
+        store = cls(directory, **kwargs)
+        for path in store.directory.glob('snapshot-*.tmp'):
+            path.unlink()
+
+        snapshots: list[int] = store._list_numbers('snapshot-*.jsonl')
+        first_segment: int = 0
+        if snapshots:
+            first_segment = snapshots[-1]
+            store._load_snapshot(store.directory / f'snapshot-{first_segment:08d}.jsonl')
+
+        for number in store._list_numbers('events-*.log'):
+            if first_segment <= number < store._segment:
+                store._load_segment(store.directory / f'events-{number:08d}.log')
+
+        pending: list[tuple[str, StoredSession]] = [
+            (session_id, session) for session_id, session in store._sessions.items() if session.actions
+        ]
+        workers = (cpu_count() or 1) if workers is None else workers
+        if workers and pending:
+            store._dirty.update(session_id for session_id, _ in pending)
+            if workers == 1 or len(pending) < 2 * workers:
+                results: list[tuple[str, dict]] = _replay_to_snapshots(pending)
+            else:
+                chunks: list[list[tuple[str, StoredSession]]] = [pending[i::workers] for i in range(workers)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = [result for chunk in executor.map(_replay_to_snapshots, chunks) for result in chunk]
+
+            for session_id, snapshot in results:
+                session: StoredSession = store._sessions[session_id]
+                session.snapshot = snapshot
+                session.actions = []
+
+        return store
+
+    def __enter__(self) -> 'SessionStore':
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, session_id: str, rows: int, cols: int, mines: int, seed: int | None = None) -> MinesweeperModel:
+        """
+        Создаёт сессию
+
+        Args:
+            session_id: идентификатор сессии
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+            mines: Кол-во мин на игровом поле
+            seed: Зерно генератора случайных чисел, по умолчанию случайное
+
+        Returns:
+            Модель новой сессии
+        """
+        if session_id in self._sessions:
+            raise ValueError(f'Сессия {session_id} уже существует')
+
+        seed = randbits(63) if seed is None else seed
+        self._append({'id': session_id, 'create': [rows, cols, mines, seed]})
+        self._sessions[session_id] = StoredSession(rows, cols, mines, seed)
+        self._models[session_id] = MinesweeperModel(rows, cols, mines, seed=seed)
+        self._dirty.add(session_id)
+        self._after_append()
+
+        return self._models[session_id]
+
+    def get(self, session_id: str) -> MinesweeperModel:
+        """
+        Возвращает модель сессии, при необходимости восстанавливая её из снимка. Модель нельзя менять напрямую,
+            иначе изменения не попадут в журнал, для действий используется apply
+
+        Args:
+            session_id: идентификатор сессии
+
+        Returns:
+            Модель сессии
+        """
+        model: MinesweeperModel | None = self._models.get(session_id)
+        if model is None:
+            session: StoredSession = self._sessions[session_id]
+            model = self._models[session_id] = _replay(session)
+            if session.actions:
+                session.actions = []
+                self._dirty.add(session_id)
+
+        return model
+
+    def apply(self, session_id: str, row: int, col: int, action_type: ActionType) -> MinesweeperResponse:
+        """
+        Проверяет действие, записывает его в журнал и выполняет. Недопустимое действие в журнал не попадает,
+            иначе оно ломало бы восстановление хранилища при каждом запуске
+
+        Args:
+            session_id: идентификатор сессии
+            row: строка клетки
+            col: столбец клетки
+            action_type: тип действия
+
+        Returns:
+            Ответ модели
+        """
+        model: MinesweeperModel = self.get(session_id)
+        action_type = ActionType(action_type)
+        if not (0 <= row < model.rows and 0 <= col < model.cols):
+            raise ValueError(f'Клетка ({row}, {col}) вне поля {model.rows}x{model.cols}')
+
+        self._append({'id': session_id, 'action': [row, col, str(action_type)]})
+        response: MinesweeperResponse = model(row, col, action_type)
+        self._dirty.add(session_id)
+        self._after_append()
+
+        return response
+
+    def delete(self, session_id: str) -> None:
+        """
+        Удаляет сессию
+
+        Args:
+            session_id: идентификатор сессии
+        """
+        del self._sessions[session_id]
+        self._models.pop(session_id, None)
+        self._dirty.discard(session_id)
+        self._append({'id': session_id, 'delete': True})
+        self._after_append()
+
+    def flush(self) -> None:
+        """Сбрасывает журнал на диск"""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._unsynced = 0
+        self._last_sync = monotonic()
+
+    def checkpoint(self) -> None:
+        """
+        Сохраняет снимок всех сессий и удаляет журнал до него. Снимок пишется во временный файл и переименовывается,
+            поэтому при сбое во время записи остаётся предыдущий снимок и полный журнал после него
+        """
+        self.flush()
+        self._log.close()
+        self._segment += 1
+        self._log = self._open_segment()
+
+        for session_id in self._dirty:
+            model: MinesweeperModel | None = self._models.get(session_id)
+            if model is not None:
+                self._sessions[session_id].snapshot = model.to_snapshot()
+        self._dirty.clear()
+
+        path: Path = self.directory / f'snapshot-{self._segment:08d}.jsonl'
+        temporary_path: Path = path.with_suffix('.tmp')
+        with temporary_path.open('w', encoding='utf-8') as file:
+            for session_id, session in self._sessions.items():
+                file.write(json.dumps({
+                    'id': session_id,
+                    'create': [session.rows, session.cols, session.mines, session.seed],
+                    'snapshot': session.snapshot,
+                    'actions': session.actions,
+                }, separators=(',', ':')) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        temporary_path.replace(path)
+        self._fsync_directory()
+
+        for number in self._list_numbers('events-*.log'):
+            if number < self._segment:
+                (self.directory / f'events-{number:08d}.log').unlink()
+        for number in self._list_numbers('snapshot-*.jsonl'):
+            if number < self._segment:
+                (self.directory / f'snapshot-{number:08d}.jsonl').unlink()
+        self._actions_since_snapshot = 0
+
+    def close(self) -> None:
+        """Сбрасывает журнал на диск и закрывает его"""
+        if not self._log.closed:
+            self.flush()
+            self._log.close()
+
+    def _append(self, record: dict) -> None:
+        """Дописывает запись в журнал"""
+        self._log.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._unsynced += 1
+
+    def _after_append(self) -> None:
+        """Выполняет fsync пачки и снимок, когда подошла их очередь"""
+        if self._unsynced >= self.fsync_every or monotonic() - self._last_sync >= self.fsync_interval:
+            self.flush()
+
+        self._actions_since_snapshot += 1
+        if self.snapshot_every and self._actions_since_snapshot >= self.snapshot_every:
+            self.checkpoint()
+
+    def _load_snapshot(self, path: Path) -> None:
+        """Загружает сессии из снимка"""
+        with path.open(encoding='utf-8') as file:
+            for line in file:
+                record: dict = json.loads(line)
+                self._sessions[record['id']] = StoredSession(
+                    *record['create'], snapshot=record['snapshot'], actions=record['actions']
+                )
+
+    def _load_segment(self, path: Path) -> None:
+        """Добавляет действия из сегмента журнала к сессиям"""
+        with path.open(encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record: dict = json.loads(line)
+                except json.JSONDecodeError:   # Строка, недописанная при сбое, всегда последняя в сегменте
+                    break
+
+                session_id: str = record['id']
+                if 'action' in record:
+                    self._sessions[session_id].actions.append(record['action'])
+                elif 'create' in record:
+                    self._sessions[session_id] = StoredSession(*record['create'])
+                else:
+                    del self._sessions[session_id]
+
+    def _open_segment(self) -> IO[str]:
+        """Открывает новый сегмент журнала"""
+        log: IO[str] = (self.directory / f'events-{self._segment:08d}.log').open('a', encoding='utf-8')
+        self._fsync_directory()
+
+        return log
+
+    def _fsync_directory(self) -> None:
+        """Сбрасывает на диск записи каталога, чтобы созданные и переименованные файлы пережили сбой"""
+        if os.name != 'posix':
+            return
+
+        descriptor: int = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _list_numbers(self, pattern: str) -> list[int]:
+        """Возвращает отсортированные номера файлов каталога по шаблону вида 'events-*.log'"""
+        return sorted(int(path.name.split('-')[1].split('.')[0]) for path in self.directory.glob(pattern))
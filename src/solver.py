@@ -0,0 +1,168 @@
+"""Модуль с автоматическими стратегиями(политиками) игры"""
+
+__author__ = 'Шеряков Д.И.'
+
+from abc import ABC, abstractmethod
+from random import Random
+from typing import Iterator
+
+from .enums import ActionType, VisibleCell
+from .model import MinesweeperModel
+
+Move = tuple[int, int, ActionType]
+
+
+class Policy(ABC):
+    """
+    Базовый класс политики. Политика видит только видимое игроку состояние поля и возвращает список ходов.
+        При изменении логики политики нужно увеличивать version, от неё зависят закешированные результаты
+    """
+    name: str = ''
+    version: int = 1
+
+    @abstractmethod
+    def __call__(self, visible_board: list[list[int]], rng: Random) -> list[Move]:
+        """
+        Выбор ходов
+
+        Args:
+            visible_board: видимое состояние поля (см. MinesweeperModel.get_visible_board)
+            rng: генератор случайных чисел для угадывания
+
+        Returns:
+            Непустой список ходов (строка, столбец, тип действия)
+        """
+
+    @staticmethod
+    def _guess(visible_board: list[list[int]], rng: Random) -> list[Move]:
+        """Открывает случайную закрытую клетку"""
+        hidden_cells: list[tuple[int, int]] = [
+            (row, col)
+            for row, list_of_cells in enumerate(visible_board)
+            for col, value in enumerate(list_of_cells)
+            if value == VisibleCell.HIDDEN
+        ]
+        row, col = rng.choice(hidden_cells)
+
+        return [(row, col, ActionType.OPEN)]
+
+
+class RandomPolicy(Policy):
+    """Политика, открывающая случайные закрытые клетки"""
+    name: str = 'random'
+    version: int = 1
+
+    def __call__(self, visible_board: list[list[int]], rng: Random) -> list[Move]:
+        return self._guess(visible_board, rng)
+
+
+class SinglePointPolicy(Policy):
+    """
+    Политика, рассуждающая по одной клетке с числом:
+        - Если флагов вокруг столько же, сколько мин, то остальные закрытые соседи безопасны
+        - Если флагов и закрытых соседей вокруг столько же, сколько мин, то все закрытые соседи - мины
+        Если вывести ничего нельзя, то открывается случайная закрытая клетка
+    """
+    name: str = 'single_point'
+    version: int = 1
+
+    def __call__(self, visible_board: list[list[int]], rng: Random) -> list[Move]:
+        rows: int = len(visible_board)
+        cols: int = len(visible_board[0])
+
+        safe_cells: set[tuple[int, int]] = set()
+        mine_cells: set[tuple[int, int]] = set()
+        for row, list_of_cells in enumerate(visible_board):
+            for col, value in enumerate(list_of_cells):
+                if value <= 0:
+                    continue
+
+                hidden_neighbours: list[tuple[int, int]] = []
+                flags_around: int = 0
+                for n_row, n_col in get_neighbours(rows, cols, row, col):
+                    if visible_board[n_row][n_col] == VisibleCell.HIDDEN:
+                        hidden_neighbours.append((n_row, n_col))
+                    elif visible_board[n_row][n_col] == VisibleCell.FLAG:
+                        flags_around += 1
+
+                if not hidden_neighbours:
+                    continue
+                if value == flags_around:
+                    safe_cells.update(hidden_neighbours)
+                elif value == flags_around + len(hidden_neighbours):
+                    mine_cells.update(hidden_neighbours)
+
+        moves: list[Move] = [(row, col, ActionType.MARK) for row, col in mine_cells]
+        moves.extend((row, col, ActionType.OPEN) for row, col in safe_cells - mine_cells)
+
+        return moves or self._guess(visible_board, rng)
+
+
+POLICIES: dict[str, type[Policy]] = {
+    RandomPolicy.name: RandomPolicy,
+    SinglePointPolicy.name: SinglePointPolicy,
+}
+
+
+def get_neighbours(rows: int, cols: int, row: int, col: int) -> list[tuple[int, int]]:
+    """
+    Возвращаем список координат соседних клеток на прямоугольном поле
+
+    Args:
+        rows: кол-во строк поля
+        cols: кол-во столбцов поля
+        row: индекс строки
+        col: индекс столбца
+
+    Returns:
+        Список из кортежей (индекс_строки, индекс_столбца)
+    """
+    return [
+        (row_, col_)
+        for row_ in range(max(row - 1, 0), min(row + 2, rows))
+        for col_ in range(max(col - 1, 0), min(col + 2, cols))
+        if (row_, col_) != (row, col)
+    ]
+
+
+def iter_positions(model: MinesweeperModel, policy: Policy, rng: Random) -> Iterator[list[list[int]]]:
+    """
+    Играет партию до конца и выдаёт видимое состояние поля перед каждым решением политики
+
+    Args:
+        model: модель игры
+        policy: политика
+        rng: генератор случайных чисел политики
+
+    Returns:
+        Итератор по видимым состояниям поля
+    """
+    while not model.is_gameover:
+        visible_board: list[list[int]] = model.get_visible_board()
+        yield visible_board
+
+        for row, col, action_type in policy(visible_board, rng):
+            # Клетка могла открыться раньше в этой же серии ходов
+            if model.get_visible_cell(row, col) != VisibleCell.HIDDEN:
+                continue
+
+            if model(row, col, action_type).is_gameover:
+                break
+
+
+def play_game(model: MinesweeperModel, policy: Policy, rng: Random) -> bool:
+    """
+    Играет партию до конца
+
+    Args:
+        model: модель игры
+        policy: политика
+        rng: генератор случайных чисел политики
+
+    Returns:
+        Победила ли политика
+    """
+    for _ in iter_positions(model, policy, rng):
+        pass
+
+    return model.is_win
@@ -0,0 +1,298 @@
+"""Модуль трансляции хода игры зрителям"""
+
+__author__ = 'Шеряков Д.И.'
+
+import struct
+import sys
+from array import array
+from collections import deque
+
+from .dataclasses_ import GameOverReveal, MinesweeperResponse, SpectatorFrame
+from .enums import ActionType, FrameType, OverflowPolicy, VisibleCell
+from .model import MinesweeperModel
+
+# Тип кадра, флаги (1 - победа, 2 - игра окончена), номер действия, строки, столбцы, кол-во клеток (все uint32).
+# За заголовком идут индексы клеток (uint32, только у DELTA) и значения клеток (int8), всё little-endian
+FRAME_HEADER: struct.Struct = struct.Struct('<BBIIII')
+_WIN: int = 1
+_GAMEOVER: int = 2
+
+
+def _pack(
+        frame_type: FrameType,
+        model: MinesweeperModel,
+        sequence: int,
+        indexes: array | None,
+        values: array,
+) -> bytes:
+    """Собирает кадр из заголовка и массивов клеток"""
+    if sys.byteorder == 'big':
+        values.byteswap()
+        if indexes is not None:
+            indexes.byteswap()
+
+    flags: int = (_WIN if model.is_win else 0) | (_GAMEOVER if model.is_gameover else 0)
+    header: bytes = FRAME_HEADER.pack(frame_type, flags, sequence, model.rows, model.cols, len(values))
+
+    return header + (indexes.tobytes() if indexes is not None else b'') + values.tobytes()
+
+
+def _get_game_over_cells(game_over_reveal: GameOverReveal | None) -> dict[tuple[int, int], int]:
+    """
+    Значения клеток, которые зрители видят по окончании игры, как и игрок в gui: только мины и ошибочные флаги
+
+    Args:
+        game_over_reveal: клетки, которые нужно показать по окончании игры, None - игра не окончена
+
+    Returns:
+        Значения клеток по их координатам
+    """
+    if game_over_reveal is None:
+        return {}
+
+    game_over_cells: dict[tuple[int, int], int] = dict.fromkeys(game_over_reveal.mines, VisibleCell.MINE)
+    game_over_cells.update(dict.fromkeys(game_over_reveal.wrong_flags, VisibleCell.WRONG_FLAG))
+
+    return game_over_cells
+
+
+def encode_delta(
+        model: MinesweeperModel,
+        sequence: int,
+        changed_cells: list[tuple[int, int]],
+        game_over_reveal: GameOverReveal | None = None,
+) -> bytes:
+    """
+    Кодирует изменённые после действия клетки в кадр. Значения берутся на момент хода, по окончании игры в кадр
+        добавляются только мины и ошибочные флаги, за O(изменённых клеток + мин)
+
+    Args:
+        model: модель игры
+        sequence: номер действия
+        changed_cells: изменённые клетки (см. MinesweeperResponse.changed_cells)
+        game_over_reveal: клетки, которые нужно показать по окончании игры (см. MinesweeperResponse.game_over_reveal)
+
+    Returns:
+        Кадр
+    """
+    cells: dict[tuple[int, int], int] = {(row, col): model.get_played_cell(row, col) for row, col in changed_cells}
+    cells.update(_get_game_over_cells(game_over_reveal))
+
+    cols: int = model.cols
+    indexes: array = array('I', [row * cols + col for row, col in cells])
+    values: array = array('b', cells.values())
+
+    return _pack(FrameType.DELTA, model, sequence, indexes, values)
+
+
+def encode_snapshot(model: MinesweeperModel, sequence: int) -> bytes:
+    """
+    Кодирует всё видимое зрителям поле в кадр (см. encode_delta)
+
+    Args:
+        model: модель игры
+        sequence: номер последнего действия
+
+    Returns:
+        Кадр
+    """
+    values: array = array('b')
+    for list_of_cells in model.get_played_board():
+        values.extend(list_of_cells)
+
+    cols: int = model.cols
+    for (row, col), value in _get_game_over_cells(model.game_over_reveal).items():
+        values[row * cols + col] = value
+
+    return _pack(FrameType.SNAPSHOT, model, sequence, None, values)
+
+
+def decode_frame(frame: bytes) -> SpectatorFrame:
+    """
+    Разбирает кадр
+
+    Args:
+        frame: кадр
+
+    Returns:
+        Разобранный кадр
+    """
+    frame_type, flags, sequence, rows, cols, count = FRAME_HEADER.unpack_from(frame)
+    offset: int = FRAME_HEADER.size
+    if frame_type == FrameType.DELTA:
+        indexes: array = array('I', frame[offset:offset + 4 * count])
+        offset += 4 * count
+    else:
+        indexes = array('I', range(count))
+    values: array = array('b', frame[offset:offset + count])
+    if sys.byteorder == 'big':
+        indexes.byteswap()
+        values.byteswap()
+
+    return SpectatorFrame(
+        frame_type=frame_type,
+        sequence=sequence,
+        is_win=bool(flags & _WIN),
+        is_gameover=bool(flags & _GAMEOVER),
+        rows=rows,
+        cols=cols,
+        cells=list(zip(indexes, values)),
+    )
+
+
+def apply_frame(board: list[list[int]] | None, frame: bytes) -> list[list[int]]:
+    """
+    Применяет кадр к видимому полю зрителя
+
+    Args:
+        board: видимое поле зрителя, None - поле ещё не получено
+        frame: кадр
+
+    Returns:
+        Видимое поле после кадра
+    """
+    decoded: SpectatorFrame = decode_frame(frame)
+    if decoded.frame_type == FrameType.SNAPSHOT or board is None:
+        board = [[0] * decoded.cols for _ in range(decoded.rows)]
+
+    for index, value in decoded.cells:
+        row, col = divmod(index, decoded.cols)
+        board[row][col] = value
+
+    return board
+
+
+class Subscriber:
+    """Класс зрителя с ограниченной очередью кадров. Кадры забирает сам зритель, например из своего потока"""
+
+    def __init__(self, queue_size: int) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            queue_size: максимальное кол-во кадров в очереди
+        """
+        self.queue_size: int = queue_size
+        self.frames: deque[bytes] = deque()
+        self.is_closed: bool = False
+        self.resyncs: int = 0
+
+    def drain(self) -> list[bytes]:
+        """
+        Забирает все накопленные кадры
+
+        Returns:
+            Кадры в порядке отправки
+        """
+        frames: list[bytes] = []
+        while self.frames:
+            frames.append(self.frames.popleft())
+
+        return frames
+
+
+class SpectatorHub:
+    """
+    Класс трансляции одной партии многим зрителям. Изменения после действия кодируются в кадр один раз, и всем
+        зрителям в очередь кладётся один и тот же объект bytes. Очереди ограничены: игрок никогда не ждёт зрителей,
+        а отставший зритель отключается или получает вместо накопленных кадров снимок поля
+    """
+
+    def __init__(
+            self,
+            model: MinesweeperModel,
+            queue_size: int = 256,
+            overflow: OverflowPolicy = OverflowPolicy.RESYNC,
+    ) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            model: модель игры
+            queue_size: максимальное кол-во кадров в очереди зрителя
+            overflow: что делать с зрителем, очередь которого переполнена
+        """
+        self.model: MinesweeperModel = model
+        self.queue_size: int = queue_size
+        self.overflow: OverflowPolicy = overflow
+        self.sequence: int = 0
+
+        self._subscribers: dict[Subscriber, None] = {}   # Упорядоченное множество
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def __call__(self, row: int, col: int, action_type: ActionType) -> MinesweeperResponse:
+        """
+        Выполняет действие игрока и рассылает изменения зрителям
+
+        Args:
+            row: строка клетки
+            col: столбец клетки
+            action_type: тип действия
+
+        Returns:
+            Ответ модели
+        """
+        was_gameover: bool = self.model.is_gameover
+        response: MinesweeperResponse = self.model(row, col, action_type)
+        if response.changed_cells or response.is_gameover and not was_gameover:
+            # В конце игры к изменениям добавляются мины и ошибочные флаги, остальное поле не пересылается
+            game_over_reveal: GameOverReveal | None = None if was_gameover else response.game_over_reveal
+            self.sequence += 1
+            self.publish(encode_delta(self.model, self.sequence, response.changed_cells or [], game_over_reveal))
+
+        return response
+
+    def subscribe(self) -> Subscriber:
+        """
+        Подключает зрителя, первым кадром он получает снимок поля
+
+        Returns:
+            Зритель
+        """
+        subscriber = Subscriber(self.queue_size)
+        subscriber.frames.append(encode_snapshot(self.model, self.sequence))
+        self._subscribers[subscriber] = None
+
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """
+        Отключает зрителя
+
+        Args:
+            subscriber: зритель
+        """
+        subscriber.is_closed = True
+        self._subscribers.pop(subscriber, None)
+
+    def publish(self, frame: bytes) -> None:
+        """
+        Кладёт кадр в очереди всех зрителей
+
+        Args:
+            frame: кадр
+        """
+        queue_size: int = self.queue_size
+        overflowed: list[Subscriber] = []
+        for subscriber in self._subscribers:
+            frames: deque[bytes] = subscriber.frames
+            if len(frames) < queue_size:
+                frames.append(frame)
+            else:
+                overflowed.append(subscriber)
+
+        if not overflowed:
+            return
+
+        if self.overflow == OverflowPolicy.DROP:
+            for subscriber in overflowed:
+                self.unsubscribe(subscriber)
+            return
+
+        snapshot: bytes = encode_snapshot(self.model, self.sequence)   # Один снимок на всех отставших
+        for subscriber in overflowed:
+            subscriber.frames.clear()
+            subscriber.frames.append(snapshot)
+            subscriber.resyncs += 1
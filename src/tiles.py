@@ -0,0 +1,131 @@
+"""Модуль с изображениями клеток поля"""
+
+__author__ = 'Шеряков Д.И.'
+
+import tkinter as tk
+from functools import cache
+
+from .enums import Tile
+
+TILE_SIZE: int = 16                      # Сторона изображения клетки в пикселях при масштабе 1
+ZOOM_LEVELS: tuple[int, ...] = (1, 2, 3)
+
+_FACE: str = '#c0c0c0'
+_REVEALED_FACE: str = '#d6d6d6'
+_LIGHT: str = '#ffffff'
+_SHADOW: str = '#808080'
+_RED: str = '#ff0000'
+
+# Знаки 8x8, рисуются в центре клетки: '#' - цвет знака, 'r' - красный, 'w' - белый, '.' - фон
+_GLYPHS: dict[Tile, tuple[str, ...]] = {
+    Tile.ONE: ('...##...', '..###...', '.####...', '...##...', '...##...', '...##...', '.######.', '........'),
+    Tile.TWO: ('.#####..', '##...##.', '.....##.', '...###..', '.###....', '##......', '#######.', '........'),
+    Tile.THREE: ('#######.', '....##..', '...##...', '....##..', '.....##.', '##...##.', '.#####..', '........'),
+    Tile.FOUR: ('...###..', '..####..', '.##.##..', '##..##..', '#######.', '....##..', '....##..', '........'),
+    Tile.FIVE: ('#######.', '##......', '######..', '.....##.', '.....##.', '##...##.', '.#####..', '........'),
+    Tile.SIX: ('..####..', '.##.....', '##......', '######..', '##...##.', '##...##.', '.#####..', '........'),
+    Tile.SEVEN: ('#######.', '##...##.', '....##..', '...##...', '..##....', '..##....', '..##....', '........'),
+    Tile.EIGHT: ('.#####..', '##...##.', '##...##.', '.#####..', '##...##.', '##...##.', '.#####..', '........'),
+    Tile.FLAG: ('...rr#..', '.rrrr#..', 'rrrrr#..', '.rrrr#..', '...rr#..', '.....#..', '...####.', '.#######'),
+    Tile.MINE: ('...#....', '.#.#.#..', '..###...', '#w#####.', '..###...', '.#.#.#..', '...#....', '........'),
+    Tile.WRONG_FLAG: ('rr....rr', '.rr..rr.', '..rrrr..', '...rr...', '..rrrr..', '.rr..rr.', 'rr....rr', '........'),
+}
+_GLYPH_COLOURS: dict[Tile, str] = {
+    Tile.ONE: '#0000ff',
+    Tile.TWO: '#008000',
+    Tile.THREE: '#ff0000',
+    Tile.FOUR: '#000080',
+    Tile.FIVE: '#800000',
+    Tile.SIX: '#008080',
+    Tile.SEVEN: '#000000',
+    Tile.EIGHT: '#808080',
+    Tile.FLAG: '#000000',
+    Tile.MINE: '#000000',
+}
+
+
+@cache
+def get_tile_pixels(tile: Tile, zoom: int) -> tuple[tuple[str, ...], ...]:
+    """
+    Рисует изображение клетки: закрытые клетки выпуклые, открытые плоские, знак в центре. Изображение рисуется
+        в масштабе 1 и увеличивается целым масштабом, поэтому на всех масштабах клетки выглядят одинаково
+
+    Args:
+        tile: изображение клетки
+        zoom: масштаб
+
+    Returns:
+        Строки пикселей, цвет каждого пикселя в виде '#rrggbb'
+    """
+    pixels: list[list[str]] = []
+    if tile in (Tile.HIDDEN, Tile.FLAG):
+        for y in range(TILE_SIZE):
+            row: list[str] = []
+            for x in range(TILE_SIZE):
+                if (x < 2 or y < 2) and x + y < TILE_SIZE - 1:   # Светлая рамка сверху и слева до диагонали угла
+                    row.append(_LIGHT)
+                elif x >= TILE_SIZE - 2 or y >= TILE_SIZE - 2:
+                    row.append(_SHADOW)
+                else:
+                    row.append(_FACE)
+            pixels.append(row)
+    else:
+        for y in range(TILE_SIZE):
+            pixels.append([_SHADOW if x == 0 or y == 0 else _REVEALED_FACE for x in range(TILE_SIZE)])
+
+    glyph_colours: dict[str, str] = {'#': _GLYPH_COLOURS.get(tile, _RED), 'r': _RED, 'w': _LIGHT}
+    offset: int = (TILE_SIZE - 8) // 2
+    for y, glyph_row in enumerate(_GLYPHS.get(tile, ())):
+        for x, symbol in enumerate(glyph_row):
+            if symbol != '.':
+                pixels[offset + y][offset + x] = glyph_colours[symbol]
+
+    return tuple(
+        tuple(colour for colour in row for _ in range(zoom))
+        for row in pixels
+        for _ in range(zoom)
+    )
+
+
+class TileCache:
+    """
+    Класс кеша изображений клеток. Изображение каждого вида клетки на каждом масштабе создаётся один раз и общее
+        для всех клеток, поэтому перерисовка клетки - это только замена ссылки на изображение
+    """
+
+    def __init__(self, master: tk.Misc, zoom: int = ZOOM_LEVELS[0]) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            master: виджет, интерпретатору Tk которого принадлежат изображения
+            zoom: текущий масштаб
+        """
+        self.zoom: int = zoom
+
+        self._master: tk.Misc = master
+        self._images: dict[tuple[Tile, int], tk.PhotoImage] = {}
+
+    def __getitem__(self, tile: Tile) -> tk.PhotoImage:
+        """Изображение клетки в текущем масштабе"""
+        return self.get(tile, self.zoom)
+
+    def get(self, tile: Tile, zoom: int) -> tk.PhotoImage:
+        """
+        Возвращает изображение клетки, создавая его при первом обращении
+
+        Args:
+            tile: изображение клетки
+            zoom: масштаб
+
+        Returns:
+            Изображение Tk
+        """
+        image: tk.PhotoImage | None = self._images.get((tile, zoom))
+        if image is None:
+            size: int = TILE_SIZE * zoom
+            image = tk.PhotoImage(master=self._master, width=size, height=size)
+            image.put(' '.join('{' + ' '.join(row) + '}' for row in get_tile_pixels(tile, zoom)))
+            self._images[(tile, zoom)] = image
+
+        return image
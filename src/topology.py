@@ -0,0 +1,236 @@
+"""Модуль с топологиями игрового поля"""
+
+__author__ = 'Шеряков Д.И.'
+
+import json
+from array import array
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
+from typing import Sequence
+
+Position = tuple[int, int]
+
+
+class Topology(ABC):
+    """Базовый класс топологии поля"""
+
+    def __init__(self, rows: int, cols: int) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+        """
+        self.rows: int = rows
+        self.cols: int = cols
+
+    @abstractmethod
+    def neighbours(self, row: int, col: int) -> tuple[Position, ...]:
+        """
+        Возвращает соседей клетки
+
+        Args:
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Кортеж из кортежей (индекс_строки, индекс_столбца)
+        """
+
+    @abstractmethod
+    def neighbour_indexes(self, index: int) -> Sequence[int]:
+        """
+        Возвращает соседей клетки плоскими индексами, без создания кортежей координат. Используется в горячих циклах
+
+        Args:
+            index: индекс клетки (строка * кол-во столбцов + столбец)
+
+        Returns:
+            Индексы соседей
+        """
+
+
+class RectangleTopology(Topology):
+    """Класс обычного прямоугольного поля с 8 соседями. Соседи считаются по координатам, таблица не нужна"""
+
+    def neighbours(self, row: int, col: int) -> tuple[Position, ...]:
+        if 0 < row < self.rows - 1 and 0 < col < self.cols - 1:   # Клетка не у края поля, самый частый случай
+            up, down, left, right = row - 1, row + 1, col - 1, col + 1
+            return (
+                (up, left), (up, col), (up, right), (row, left), (row, right), (down, left), (down, col), (down, right)
+            )
+
+        min_row, max_row, min_col, max_col = determine_area_of_neighbors(self.rows, self.cols, row, col)
+
+        return tuple(
+            (row_, col_)
+            for row_ in range(min_row, max_row + 1)
+            for col_ in range(min_col, max_col + 1)
+            if row_ != row or col_ != col
+        )
+
+    def neighbour_indexes(self, index: int) -> Sequence[int]:
+        cols: int = self.cols
+        row, col = divmod(index, cols)
+        if 0 < row < self.rows - 1 and 0 < col < cols - 1:
+            up, down = index - cols, index + cols
+            return up - 1, up, up + 1, index - 1, index + 1, down - 1, down, down + 1
+
+        return tuple(row_ * cols + col_ for row_, col_ in self.neighbours(row, col))
+
+
+class TableTopology(Topology):
+    """
+    Базовый класс топологии с таблицей соседей. Соседи всех клеток считаются один раз при создании и хранятся
+        плоскими индексами строка * кол-во столбцов + столбец в одном массиве, границы соседей клетки - в массиве
+        смещений, поэтому таблица занимает 4 байта на соседа и 4 байта на клетку
+    """
+
+    def __init__(self, rows: int, cols: int) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+        """
+        super().__init__(rows, cols)
+
+        self._indexes: array = array('i')
+        self._offsets: array = array('i', [0])
+        for row in range(rows):
+            for col in range(cols):
+                self._indexes.extend(self._get_neighbour_indexes(row, col))
+                self._offsets.append(len(self._indexes))
+
+    def neighbours(self, row: int, col: int) -> tuple[Position, ...]:
+        """
+        Возвращает соседей клетки из таблицы
+
+        Args:
+            row: индекс строки
+            col: индекс столбца
+
+        Returns:
+            Кортеж из кортежей (индекс_строки, индекс_столбца)
+        """
+        index: int = row * self.cols + col
+        cols: int = self.cols
+        start, stop = self._offsets[index], self._offsets[index + 1]
+
+        return tuple(map(divmod, self._indexes[start:stop], repeat(cols)))
+
+    def neighbour_indexes(self, index: int) -> Sequence[int]:
+        return self._indexes[self._offsets[index]:self._offsets[index + 1]]
+
+    @abstractmethod
+    def _get_neighbour_indexes(self, row: int, col: int) -> list[int]:
+        """Считает индексы соседей клетки, вызывается только при построении таблицы"""
+
+
+class TorusTopology(TableTopology):
+    """Класс поля, замкнутого в тор: края поля соседствуют с противоположными краями"""
+
+    def _get_neighbour_indexes(self, row: int, col: int) -> list[int]:
+        indexes: set[int] = {
+            (row + d_row) % self.rows * self.cols + (col + d_col) % self.cols
+            for d_row in (-1, 0, 1)
+            for d_col in (-1, 0, 1)
+        }
+        indexes.discard(row * self.cols + col)   # На узком торе клетка может оказаться своим соседом
+
+        return sorted(indexes)
+
+
+class HexTopology(TableTopology):
+    """Класс шестиугольного поля: нечётные строки сдвинуты на полклетки вправо, у клетки до 6 соседей"""
+
+    _EVEN_ROW_OFFSETS: tuple[Position, ...] = ((-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0))
+    _ODD_ROW_OFFSETS: tuple[Position, ...] = ((-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1))
+
+    def _get_neighbour_indexes(self, row: int, col: int) -> list[int]:
+        offsets: tuple[Position, ...] = self._ODD_ROW_OFFSETS if row % 2 else self._EVEN_ROW_OFFSETS
+
+        return [
+            (row + d_row) * self.cols + col + d_col
+            for d_row, d_col in offsets
+            if 0 <= row + d_row < self.rows and 0 <= col + d_col < self.cols
+        ]
+
+
+class GraphTopology(TableTopology):
+    """Класс произвольного графа соседства, клетки которого раскладываются по сетке rows x cols"""
+
+    def __init__(self, rows: int, cols: int, adjacency: list[list[int]]) -> None:
+        """
+        Инициализация параметров
+
+        Args:
+            rows: Кол-во строк игрового поля
+            cols: Кол-во столбцов игрового поля
+            adjacency: для каждой клетки список индексов соседей (строка * кол-во столбцов + столбец)
+        """
+        cells: int = rows * cols
+        if len(adjacency) != cells or any(not 0 <= index < cells for indexes in adjacency for index in indexes):
+            raise ValueError('Граф соседства не соответствует размеру поля')
+
+        # Числа считаются и от мин к соседям, и от клетки к её соседям, поэтому граф должен быть неориентированным
+        edges: set[tuple[int, int]] = set()
+        for index, indexes in enumerate(adjacency):
+            if index in indexes or len(set(indexes)) != len(indexes):
+                raise ValueError(f'У клетки {index} есть петля или повторяющийся сосед')
+            edges.update((index, neighbour) for neighbour in indexes)
+        for index, neighbour in edges:
+            if (neighbour, index) not in edges:
+                raise ValueError(f'Ребро {index} -> {neighbour} есть только в одну сторону')
+
+        self._adjacency_indexes: list[list[int]] = adjacency
+        super().__init__(rows, cols)
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'GraphTopology':
+        """
+        Загружает граф из JSON файла вида {"rows": 2, "cols": 2, "adjacency": [[1, 2], [0], [0], []]}
+
+        Args:
+            path: путь к файлу
+
+        Returns:
+            Топология графа
+        """
+        data: dict = json.loads(Path(path).read_text(encoding='utf-8'))
+
+        return cls(data['rows'], data['cols'], data['adjacency'])
+
+    def _get_neighbour_indexes(self, row: int, col: int) -> list[int]:
+        return self._adjacency_indexes[row * self.cols + col]
+
+
+@lru_cache(maxsize=8)
+def get_rectangle_topology(rows: int, cols: int) -> RectangleTopology:
+    """Возвращает прямоугольную топологию, общую для моделей одного размера поля"""
+    return RectangleTopology(rows, cols)
+
+
+def determine_area_of_neighbors(rows: int, cols: int, row: int, col: int) -> tuple[int, int, int, int]:
+    """
+    Определяем область поиска соседей вокруг клетки прямоугольного поля
+
+    Args:
+        rows: Кол-во строк игрового поля
+        cols: Кол-во столбцов игрового поля
+        row: индекс строки
+        col: индекс столбца
+
+    Returns:
+        Кортеж из значений: начальная строка, конечная строка, начальный столбец, конечный столбец
+    """
+    min_row = row - 1 if row > 0 else 0
+    max_row = row + 1 if row < rows - 1 else rows - 1
+    min_col = col - 1 if col > 0 else 0
+    max_col = col + 1 if col < cols - 1 else cols - 1
+
+    return min_row, max_row, min_col, max_col
@@ -4,9 +4,11 @@ __author__ = 'Шеряков Д.И.'
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Callable
 
-from .enums import Difficulty
-from .dataclasses_ import CellView
+from .enums import Difficulty, Tile
+from .dataclasses_ import CELL_BIND_TAG, CellView
+from .tiles import ZOOM_LEVELS, TileCache
 
 DIFFICULTY_MAPPING: dict[str, tuple[int, int, int]] = {
     Difficulty.EASY: (8, 8, 10),
@@ -30,9 +32,14 @@ class MinesweeperView(tk.Tk):
         self.difficulty_radio: tk.StringVar = self._create_difficulty_radio_var()
         self.difficulty_menu: tk.Menu = self._create_difficulty_menu()
 
+        self.zoom_radio: tk.IntVar = self._create_zoom_radio_var()
+        self.zoom_menu: tk.Menu = self._create_zoom_menu()
+
         self.help_menu: tk.Menu = self._create_help_menu()
 
+        self.tiles: TileCache = TileCache(self, self.zoom_radio.get())
         self._board_frame: ttk.Frame = ttk.Frame(borderwidth=1, relief='solid', padding=(8, 10))
+        self._cells_pool: list[list[CellView]] = []
         self.board_view: list[list[CellView]] = self._create_board()
 
         self._setting_up_gui()
@@ -44,12 +51,55 @@ class MinesweeperView(tk.Tk):
         except KeyboardInterrupt:
             pass
 
+    def bind_cells(self, sequence: str, handler: Callable[[tk.Event, int, int], None]) -> None:
+        """
+        Привязывает один обработчик события ко всем клеткам поля, включая созданные позже
+
+        Args:
+            sequence: последовательность события Tk, например '<ButtonPress-1>'
+            handler: обработчик, получающий событие, строку и столбец нажатой клетки
+        """
+        self.bind_class(CELL_BIND_TAG, sequence, lambda e: handler(e, e.widget.row, e.widget.col))
+
+    def set_zoom(self, zoom: int) -> None:
+        """
+        Переключает масштаб изображений клеток и закрывает все клетки поля. Открытые клетки после этого нужно
+            перерисовать заново
+
+        Args:
+            zoom: масштаб из ZOOM_LEVELS
+        """
+        self.tiles.zoom = zoom
+        hidden_image: tk.PhotoImage = self.tiles[Tile.HIDDEN]
+        for list_of_cells in self.board_view:
+            for cell in list_of_cells:
+                cell.reset(hidden_image)
+
     def _create_board(self) -> list[list[CellView]]:
-        """Создание игровой доски"""
+        """
+        Создание игровой доски. Клетки берутся из пула: существующие сбрасываются, недостающие создаются,
+            лишние скрываются
+        """
         rows, cols, mines = DIFFICULTY_MAPPING[self.difficulty_radio.get()]
-
-        board_view: list[list[CellView]] = [[CellView(self._board_frame, row, col) for col in range(cols)
-                                             ] for row in range(rows)]
+        hidden_image: tk.PhotoImage = self.tiles[Tile.HIDDEN]
+
+        pool_cols: int = max(cols, len(self._cells_pool[0])) if self._cells_pool else cols
+        for row, pool_row in enumerate(self._cells_pool):
+            pool_row.extend(
+                CellView(self._board_frame, row, col, hidden_image) for col in range(len(pool_row), pool_cols)
+            )
+        for row in range(len(self._cells_pool), rows):
+            self._cells_pool.append([CellView(self._board_frame, row, col, hidden_image) for col in range(pool_cols)])
+
+        for row, pool_row in enumerate(self._cells_pool):
+            for col, cell in enumerate(pool_row):
+                if row < rows and col < cols:
+                    cell.reset(hidden_image)
+                    cell.grid()
+                else:
+                    cell.grid_remove()
+
+        board_view: list[list[CellView]] = [pool_row[:cols] for pool_row in self._cells_pool[:rows]]
 
         self._board_frame.pack(anchor='center', padx=10, pady=10)
 
@@ -62,6 +112,7 @@ class MinesweeperView(tk.Tk):
 
         self.main_menu.add_cascade(label='Файл', menu=self.file_menu)
         self.main_menu.add_cascade(label='Сложность', menu=self.difficulty_menu)
+        self.main_menu.add_cascade(label='Масштаб', menu=self.zoom_menu)
         self.main_menu.add_cascade(label='Справка', menu=self.help_menu)
 
         self.resizable(False, False)
@@ -86,6 +137,15 @@ class MinesweeperView(tk.Tk):
 
         return difficulty_menu
 
+    def _create_zoom_menu(self) -> tk.Menu:
+        """Создание меню Масштаб"""
+        zoom_menu = tk.Menu(self.main_menu)
+
+        for zoom in ZOOM_LEVELS:
+            zoom_menu.add_radiobutton(label=f'{zoom * 100}%', variable=self.zoom_radio, value=zoom)
+
+        return zoom_menu
+
     def _create_help_menu(self) -> tk.Menu:
         """Создание меню Справка"""
         help_menu = tk.Menu(self.main_menu)
@@ -115,9 +175,13 @@ class MinesweeperView(tk.Tk):
 
         return diff_radio
 
-    def relating_board(self, *_args) -> None:
-        """Пересоздаем игровую доску при смене сложности"""
-        for widget in self._board_frame.winfo_children():
-            widget.destroy()
+    def _create_zoom_radio_var(self) -> tk.IntVar:
+        """Создание радио переменной для меню Масштаб"""
+        zoom_radio: tk.IntVar = tk.IntVar()
+        zoom_radio.set(ZOOM_LEVELS[0])
 
+        return zoom_radio
+
+    def relating_board(self, *_args) -> None:
+        """Пересоздаем игровую доску при смене сложности или новой игре"""
         self.board_view: list[list[CellView]] = self._create_board()
@@ -0,0 +1,195 @@
+"""Модуль оценки вероятности победы политики методом Монте-Карло"""
+
+__author__ = 'Шеряков Д.И.'
+
+import json
+from argparse import ArgumentParser
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from hashlib import sha256
+from math import sqrt
+from os import cpu_count
+from pathlib import Path
+from random import Random
+from statistics import NormalDist
+from typing import Iterator
+
+from .dataclasses_ import WinRateEstimate
+from .model import MinesweeperModel
+from .solver import POLICIES, Policy, play_game
+from .view import DIFFICULTY_MAPPING
+
+
+def wilson_interval(wins: int, games: int, confidence: float = 0.95) -> tuple[float, float]:
+    """
+    Доверительный интервал Уилсона для доли побед
+
+    Args:
+        wins: кол-во побед
+        games: кол-во партий
+        confidence: уровень доверия
+
+    Returns:
+        Нижняя и верхняя граница интервала
+    """
+    if not games:
+        return 0.0, 1.0
+
+    z: float = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate: float = wins / games
+    denominator: float = 1 + z * z / games
+    center: float = (rate + z * z / (2 * games)) / denominator
+    margin: float = z * sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+
+    low: float = 0.0 if wins == 0 else max(center - margin, 0.0)
+    high: float = 1.0 if wins == games else min(center + margin, 1.0)
+
+    return low, high
+
+
+def play_batch(rows: int, cols: int, mines: int, policy_name: str, stream: str, games: int) -> int:
+    """
+    Играет серию партий в рабочем процессе. У каждой серии свой поток случайных чисел
+
+    Args:
+        rows: Кол-во строк игрового поля
+        cols: Кол-во столбцов игрового поля
+        mines: Кол-во мин на игровом поле
+        policy_name: имя политики из POLICIES
+        stream: зерно потока случайных чисел серии
+        games: кол-во партий
+
+    Returns:
+        Кол-во побед
+    """
+    rng: Random = Random(stream)
+    policy: Policy = POLICIES[policy_name]()
+
+    wins: int = 0
+    for _ in range(games):
+        model = MinesweeperModel(rows, cols, mines, seed=rng.getrandbits(64))
+        wins += play_game(model, policy, rng)
+
+    return wins
+
+
+def estimate_win_rate(
+        rows: int,
+        cols: int,
+        mines: int,
+        policy_name: str = 'single_point',
+        *,
+        precision: float = 0.01,
+        confidence: float = 0.95,
+        max_games: int = 100_000,
+        batch_size: int = 100,
+        workers: int | None = None,
+        seed: int = 0,
+        cache_dir: Path | None = None,
+) -> Iterator[WinRateEstimate]:
+    """
+    Оценивает вероятность победы политики на пуле процессов. Оценка выдаётся после каждой завершённой серии,
+        расчёт останавливается, когда половина ширины доверительного интервала не больше precision
+
+    Args:
+        rows: Кол-во строк игрового поля
+        cols: Кол-во столбцов игрового поля
+        mines: Кол-во мин на игровом поле
+        policy_name: имя политики из POLICIES
+        precision: требуемая половина ширины доверительного интервала
+        confidence: уровень доверия
+        max_games: максимальное кол-во партий
+        batch_size: кол-во партий в одной серии
+        workers: кол-во рабочих процессов, по умолчанию кол-во процессоров
+        seed: базовое зерно, из которого получаются независимые потоки серий
+        cache_dir: каталог кеша результатов, ключ - конфигурация поля, политика и её версия
+
+    Returns:
+        Итератор оценок по мере поступления результатов
+    """
+    policy: type[Policy] = POLICIES[policy_name]
+    cache_path: Path | None = None
+    games, wins, batches = 0, 0, 0
+    if cache_dir is not None:
+        key: str = sha256(f'{rows}x{cols}x{mines}:{policy.name}:{policy.version}:{seed}'.encode()).hexdigest()
+        cache_path = cache_dir / f'{key}.json'
+        if cache_path.exists():
+            cached: dict = json.loads(cache_path.read_text())
+            games, wins, batches = cached['games'], cached['wins'], cached['batches']
+
+    def make_estimate() -> WinRateEstimate:
+        low, high = wilson_interval(wins, games, confidence)
+        return WinRateEstimate(rows, cols, mines, policy_name, games, wins, low, high)
+
+    estimate: WinRateEstimate = make_estimate()
+    if games:
+        yield estimate
+
+    workers = workers or cpu_count() or 1
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: dict[Future, int] = {}
+            scheduled: int = games
+            while games < max_games and not (games and estimate.half_width <= precision):
+                while len(pending) < 2 * workers and scheduled < max_games:
+                    size: int = min(batch_size, max_games - scheduled)
+                    future: Future = executor.submit(
+                        play_batch, rows, cols, mines, policy_name, f'{seed}:{batches}', size
+                    )
+                    pending[future] = size
+                    scheduled += size
+                    batches += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    games += pending.pop(future)
+                    wins += future.result()
+
+                estimate = make_estimate()
+                yield estimate
+
+            for future in pending:
+                future.cancel()
+    finally:
+        if cache_path is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({'games': games, 'wins': wins, 'batches': batches}))
+
+
+def main() -> None:
+    """Запуск оценки из командной строки"""
+    parser = ArgumentParser(description='Оценка вероятности победы политики методом Монте-Карло')
+    parser.add_argument('board', help=f'уровень сложности ({", ".join(DIFFICULTY_MAPPING)}) или СТРОКИxСТОЛБЦЫxМИНЫ')
+    parser.add_argument('--policy', default='single_point', choices=POLICIES)
+    parser.add_argument('--precision', type=float, default=0.01)
+    parser.add_argument('--confidence', type=float, default=0.95)
+    parser.add_argument('--max-games', type=int, default=100_000)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache-dir', type=Path, default=Path('.win_rate_cache'))
+    args = parser.parse_args()
+
+    if args.board in DIFFICULTY_MAPPING:
+        rows, cols, mines = DIFFICULTY_MAPPING[args.board]
+    else:
+        rows, cols, mines = map(int, args.board.split('x'))
+
+    for estimate in estimate_win_rate(
+            rows, cols, mines, args.policy,
+            precision=args.precision,
+            confidence=args.confidence,
+            max_games=args.max_games,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            seed=args.seed,
+            cache_dir=args.cache_dir,
+    ):
+        print(
+            f'{estimate.games} games: {estimate.win_rate:.4f} '
+            f'[{estimate.low:.4f}, {estimate.high:.4f}] ±{estimate.half_width:.4f}',
+            flush=True,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Модуль для тестирования пула заранее сгенерированных полей"""
+
+__author__ = 'Шеряков'
+
+from src.board_pool import BoardPool
+from src.model import MinesweeperModel
+
+
+def test_take_from_empty_pool():
+    # Arrange
+    pool = BoardPool([(3, 3, 1)])
+
+    # Act
+    layout = pool.take(3, 3, 1)
+
+    # Assert
+    assert layout is None
+    assert pool.metrics.misses == 1
+    assert pool.metrics.hit_rate == 0.0
+
+
+def test_take_after_refill():
+    # Arrange
+    pool = BoardPool([(3, 3, 1)], size=1)
+    pool.start()
+
+    # Act
+    with pool._condition:
+        pool._condition.wait_for(lambda: pool.metrics.refills >= 1, timeout=5)
+    layout = pool.take(3, 3, 1)
+    pool.stop()
+
+    # Assert
+    assert layout is not None
+    assert (layout.rows, layout.cols, len(layout.mine_positions)) == (3, 3, 1)
+    assert pool.metrics.hits == 1
+    assert pool.metrics.hit_rate == 1.0
+    assert pool.metrics.mean_refill_seconds > 0
+
+
+def test_get_configuration_to_refill():
+    # Arrange
+    pool = BoardPool([(3, 3, 1), (4, 4, 2)], size=1)
+    pool._layouts[(3, 3, 1)].append(MinesweeperModel.pregenerate_layout(3, 3, 1))
+
+    # Act
+    configuration = pool._get_configuration_to_refill()
+
+    # Assert
+    assert configuration == (4, 4, 2)
@@ -0,0 +1,68 @@
+"""Модуль для тестирования датаклассов"""
+
+__author__ = 'Шеряков'
+
+import pytest
+
+from src.dataclasses_ import Cell, MinesweeperResponse
+from src.enums import VisibleCell
+
+
+def test_cell_defaults():
+    # Act
+    cell = Cell()
+
+    # Assert
+    assert (cell.is_mine, cell.is_revealed, cell.is_set_flag, cell.num_of_mines_around) == (False, False, False, None)
+    assert not hasattr(cell, '__dict__')
+
+
+@pytest.mark.parametrize('num_of_mines_around', [None, 0, 8, 12])
+def test_cell_fields_are_independent(num_of_mines_around):
+    # Arrange
+    cell = Cell(num_of_mines_around=num_of_mines_around)
+
+    # Act
+    cell.is_mine = True
+    cell.is_set_flag = True
+    cell.is_revealed = True
+    cell.is_set_flag = False
+
+    # Assert
+    assert cell == Cell(is_mine=True, is_revealed=True, num_of_mines_around=num_of_mines_around)
+    assert cell.num_of_mines_around == num_of_mines_around
+
+
+def test_cell_count_reset_to_none():
+    # Arrange
+    cell = Cell(is_revealed=True, num_of_mines_around=3)
+
+    # Act
+    cell.num_of_mines_around = None
+
+    # Assert
+    assert cell == Cell(is_revealed=True)
+    assert repr(cell) == 'Cell(is_mine=False, is_revealed=True, is_set_flag=False, num_of_mines_around=None)'
+
+
+@pytest.mark.parametrize(
+    'cell, is_gameover, expected',
+    [
+        (Cell(num_of_mines_around=2), False, VisibleCell.HIDDEN),
+        (Cell(is_set_flag=True, num_of_mines_around=2), False, VisibleCell.FLAG),
+        (Cell(is_revealed=True, num_of_mines_around=2), False, 2),
+        (Cell(num_of_mines_around=0), True, 0),
+        (Cell(is_mine=True, is_set_flag=True), True, VisibleCell.MINE),
+    ]
+)
+def test_cell_get_visible(cell, is_gameover, expected):
+    # Act & Assert
+    assert cell.get_visible(is_gameover) == expected
+
+
+def test_response_is_slotted():
+    # Act
+    response = MinesweeperResponse(is_win=False, is_gameover=False, board=[])
+
+    # Assert
+    assert not hasattr(response, '__dict__')
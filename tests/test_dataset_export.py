@@ -0,0 +1,50 @@
+"""Модуль для тестирования выгрузки обучающих данных"""
+
+__author__ = 'Шеряков'
+
+from array import array
+
+from src.dataclasses_ import TrainingSample
+from src.dataset_export import ShardWriter, export_dataset, iter_samples, read_shard
+from src.enums import SampleLabel, VisibleCell
+
+
+def test_iter_samples_labels():
+    # Act
+    samples = list(iter_samples(5, 5, 4, 'single_point', 3, '0:0'))
+
+    # Assert
+    assert samples
+    for sample in samples:
+        visible = array('b', sample.visible)
+        assert len(visible) == len(sample.labels) == 25
+        assert sum(label == SampleLabel.MINE for label in sample.labels) <= 4
+        for value, label in zip(visible, sample.labels):
+            assert (value == VisibleCell.HIDDEN) == (label != SampleLabel.KNOWN)
+
+
+def test_shard_writer_writes_full_shards(tmp_path):
+    # Arrange
+    samples = [TrainingSample(visible=bytes([i] * 4), labels=bytes([1] * 4)) for i in range(5)]
+
+    # Act
+    with ShardWriter(tmp_path, 2, 2, samples_per_shard=2) as writer:
+        writer.write(samples[:3])
+        shards_before_close = len(writer.shards)
+        writer.write(samples[3:])
+
+    # Assert
+    assert shards_before_close == 1
+    assert len(writer.shards) == 3
+    assert writer.samples == 5
+    assert [sample for shard in writer.shards for sample in read_shard(shard)] == samples
+
+
+def test_export_dataset(tmp_path):
+    # Act
+    writer = export_dataset(tmp_path, 5, 5, 4, games=10, games_per_batch=3, samples_per_shard=7, workers=2)
+
+    # Assert
+    samples = [sample for shard in writer.shards for sample in read_shard(shard)]
+    assert len(samples) == writer.samples > 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == [path.name for path in writer.shards]
@@ -0,0 +1,150 @@
+"""Модуль для тестирования модели игры на отображаемых в память файлах"""
+
+__author__ = 'Шеряков'
+
+from random import Random
+
+import pytest
+
+from src.enums import ActionType
+from src.mapped_model import MappedMinesweeperModel, SpillQueue, sequential_sample
+from src.model import MinesweeperModel
+from src.solver import SinglePointPolicy
+
+
+@pytest.mark.parametrize(
+    'population, size',
+    [
+        (10, 0),
+        (10, 1),
+        (10, 10),
+        (1000, 123),
+        (1000, 10),
+        (10 ** 12, 1000),
+    ]
+)
+def test_sequential_sample(population, size):
+    # Act
+    sample = list(sequential_sample(population, size, Random(0)))
+
+    # Assert
+    assert len(sample) == size
+    assert sample == sorted(set(sample))
+    assert all(0 <= position < population for position in sample)
+
+
+def test_sequential_sample_is_uniform():
+    # Arrange
+    rng = Random(1)
+    buckets = [0] * 10
+
+    # Act
+    for _ in range(5000):
+        for position in sequential_sample(1000, 10, rng):
+            buckets[position // 100] += 1
+
+    # Assert
+    assert all(abs(count - 5000) < 500 for count in buckets)
+
+
+def test_spill_queue(tmp_path):
+    # Arrange
+    spill_queue = SpillQueue(tmp_path, limit=3)
+
+    # Act
+    for index in range(5):
+        spill_queue.push(1, index)
+    spill_queue.push(0, 100)
+    band, indexes = spill_queue.pop_band()
+    other_bands, other_indexes, part_sizes = [], [], []
+    while spill_queue:
+        other_band, part = spill_queue.pop_band()
+        other_bands.append(other_band)
+        other_indexes.extend(part)
+        part_sizes.append(len(part))
+
+    # Assert
+    assert (band, list(indexes)) == (0, [100])
+    assert set(other_bands) == {1} and len(other_bands) > 1
+    assert sorted(other_indexes) == [0, 1, 2, 3, 4]
+    assert max(part_sizes) <= spill_queue.limit
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_set_num_of_mines_around(tmp_path):
+    # Arrange
+    with MappedMinesweeperModel(3, 3, 2, tmp_path, band_rows=1) as model:
+        model._mines.set(1, 0)
+        model._mines.set(0, 2)
+        model._is_first_click = False
+
+        # Act
+        model._set_num_of_mines_around()
+
+        # Assert
+        assert [[model._get_num_of_mines(row, col) for col in range(3)] for row in range(3)] == [
+            [1, 2, 0],
+            [0, 2, 1],
+            [1, 1, 0],
+        ]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_same_game_as_list_model(tmp_path, seed):
+    # Arrange
+    rows, cols, mines = 12, 17, 30
+    rng = Random(seed)
+    first_row, first_col = rng.randrange(rows), rng.randrange(cols)
+
+    mapped_model = MappedMinesweeperModel(rows, cols, mines, tmp_path, band_rows=2, seed=seed)
+    mapped_model.spill_limit = 4
+    mapped_response = mapped_model(first_row, first_col, ActionType.OPEN)
+
+    model = MinesweeperModel(rows, cols, mines)
+    model._is_first_click = False
+    for row in range(rows):
+        for col in range(cols):
+            model._board[row][col].is_mine = mapped_model._mines.get(row, col) == 1
+    model._set_num_of_mines_around()
+    response = model(first_row, first_col, ActionType.OPEN)
+
+    policy = SinglePointPolicy()
+
+    # Act, Assert
+    while True:
+        assert mapped_model.get_visible_board() == model.get_visible_board()
+        assert (mapped_response.is_win, mapped_response.is_gameover) == (response.is_win, response.is_gameover)
+        if response.is_gameover:
+            break
+
+        row, col, action_type = policy(model.get_visible_board(), rng)[0]
+        response = model(row, col, action_type)
+        mapped_response = mapped_model(row, col, action_type)
+
+    assert sum(mapped_model._mines.get(row, col) for row in range(rows) for col in range(cols)) == mines
+    assert mapped_model._mines.get(first_row, first_col) == 0
+    assert mapped_response.board[first_row][first_col] == model._board[first_row][first_col]
+    mapped_model.close()
+
+
+def test_close_removes_own_temporary_directory(tmp_path):
+    # Arrange
+    model = MappedMinesweeperModel(4, 4, 2)
+    directory = model._directory
+    own_model = MappedMinesweeperModel(4, 4, 2, tmp_path)
+
+    # Act
+    model.close()
+    own_model.close()
+
+    # Assert
+    assert not directory.exists()
+    assert (tmp_path / 'mines.bits').exists()
+
+
+@pytest.mark.parametrize('cols, exp_band_rows', [(1000, 4194), (1 << 23, 1)])
+def test_band_rows_from_band_cells(tmp_path, cols, exp_band_rows):
+    # Act
+    with MappedMinesweeperModel(2, cols, 1, tmp_path) as model:
+        # Assert
+        assert model.band_rows == exp_band_rows
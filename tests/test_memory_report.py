@@ -0,0 +1,50 @@
+"""Модуль для тестирования отчёта о памяти"""
+
+__author__ = 'Шеряков'
+
+from pathlib import Path
+
+import pytest
+
+from src.memory_report import PHASES, _parse_size, getrusage, measure_board, report_memory
+
+
+@pytest.mark.parametrize('backend', ['list', 'mapped'])
+def test_measure_board_phases(backend):
+    # Act
+    report = measure_board(backend, 20, 30, 60, top=3)
+
+    # Assert
+    assert (report.backend, report.rows, report.cols, report.mines) == (backend, 20, 30, 60)
+    assert [phase.phase for phase in report.phases] == list(PHASES)
+    for phase in report.phases:
+        assert phase.traced_peak_bytes >= phase.traced_bytes
+        assert phase.bytes_per_cell == phase.traced_bytes / 600
+        assert phase.peak_rss_bytes > 0 if getrusage is not None else phase.peak_rss_bytes is None
+        assert len(phase.top_allocations) <= 3
+
+
+def test_list_backend_allocates_cells_on_construction():
+    # Act
+    report = measure_board('list', 50, 50, 100)
+
+    # Assert
+    construction = report.phases[0]
+    assert construction.bytes_per_cell > 8
+    assert any(
+        Path(place.rpartition(':')[0]).parts[-2:] == ('src', 'model.py') for place, _, _ in construction.top_allocations
+    )
+
+
+def test_report_memory_in_process():
+    # Act
+    reports = list(report_memory(['list'], [(10, 10), (20, 20)], density=0.1, isolate=False))
+
+    # Assert
+    assert [(report.rows, report.mines) for report in reports] == [(10, 10), (20, 40)]
+
+
+@pytest.mark.parametrize('value, expected', [('100', (100, 100)), ('30x16', (30, 16))])
+def test_parse_size(value, expected):
+    # Act & Assert
+    assert _parse_size(value) == expected
@@ -6,6 +6,8 @@ import pytest
 
 from src.model import MinesweeperModel
 from src.dataclasses_ import Cell
+from src.enums import ActionType, VisibleCell
+from src.topology import TorusTopology
 
 
 @pytest.mark.parametrize(
@@ -27,9 +29,9 @@ def test_check_game_result(c_row, c_col, lose, reveal):
     assert model._is_gameover == lose
     assert model._is_win == False
 
-    for list_of_cell in model._board:
-        for cell in list_of_cell:
-            assert cell.is_revealed == reveal
+    for row in range(3):
+        for col in range(3):
+            assert model.is_cell_revealed(row, col) == reveal
 
 
 def test_check_game_result_lose():
@@ -45,20 +47,19 @@ def test_check_game_result_lose():
     assert model._is_gameover == True
     assert model._is_win == False
 
-    for list_of_cell in model._board:
-        for cell in list_of_cell:
-            assert cell.is_revealed == True
+    for row in range(3):
+        for col in range(3):
+            assert model.is_cell_revealed(row, col) == True
 
 
 def test_check_game_result_win():
     # Arrange
     model = MinesweeperModel(3, 3, 1)
-    for list_of_cell in model._board:
-        for cell in list_of_cell:
-            cell.is_revealed = True
-
     model._board[0][0].is_mine = True
-    model._board[0][0].is_revealed = False
+    for row in range(3):
+        for col in range(3):
+            if (row, col) != (0, 0):
+                model._reveal_cell(row, col)
 
     # Act
     model._check_game_result(1, 1)
@@ -67,9 +68,9 @@ def test_check_game_result_win():
     assert model._is_gameover == True
     assert model._is_win == True
 
-    for list_of_cell in model._board:
-        for cell in list_of_cell:
-            assert cell.is_revealed == True
+    for row in range(3):
+        for col in range(3):
+            assert model.is_cell_revealed(row, col) == True
 
 
 @pytest.mark.parametrize(
@@ -82,13 +83,11 @@ def test_check_game_result_win():
 def test_check_win(closed, exp_result):
     # Arrange
     model = MinesweeperModel(3, 3, 1)
-    for list_of_cell in model._board:
-        for cell in list_of_cell:
-            cell.is_revealed = True
-
     model._board[0][0].is_mine = True
-    for i in range(closed):
-        model._board[0][i].is_revealed = False
+    for row in range(3):
+        for col in range(3):
+            if row > 0 or col >= closed:
+                model._reveal_cell(row, col)
 
     # Act
     result = model._check_win()
@@ -131,9 +130,9 @@ def test_reveal_all_cells():
     model._reveal_all_cells()
 
     # Assert
-    for list_of_cell in model._board:
-        for cell in list_of_cell:
-            assert cell.is_revealed == True
+    for row in range(3):
+        for col in range(3):
+            assert model.is_cell_revealed(row, col) == True
 
 
 @pytest.mark.parametrize(
@@ -232,8 +231,8 @@ def test_reveal_neighbours_impl(reveal_mines, not_revealed):
 
     for i, list_of_mines in enumerate(model._board):
         for j, cell in enumerate(list_of_mines):
-            stack.add((i, j))
-    stack.remove((1, 1))
+            stack.add(i * 3 + j)
+    stack.remove(1 * 3 + 1)
 
     # Act
     model._reveal_neighbours_impl(stack, reveal_mines)
@@ -256,7 +255,7 @@ def test_reveal_cell():
     cell = model._board[1][1]
 
     # Act
-    model._reveal_cell(cell)
+    model._reveal_cell(1, 1)
 
     # Assert
     assert cell.is_revealed == True
@@ -407,3 +406,300 @@ def test_determine_area_of_neighbors(row, col, exp_min_r, exp_max_r, exp_min_c,
     assert max_row == exp_max_r
     assert min_col == exp_min_c
     assert max_col == exp_max_c
+
+
+def test_state_hash_reveal_and_mark():
+    # Arrange
+    model = MinesweeperModel(3, 3, 1)
+    model._is_first_click = False
+    initial_hash = model.state_hash
+
+    # Act
+    model._reveal_cell(1, 1)
+    revealed_hash = model.state_hash
+    model._mark_cell(0, 0)
+    marked_hash = model.state_hash
+    model._mark_cell(0, 0)
+
+    # Assert
+    assert initial_hash == 0
+    assert len({initial_hash, revealed_hash, marked_hash}) == 3
+    assert model.state_hash == revealed_hash
+
+
+def test_state_hash_independent_of_order():
+    # Arrange
+    first_model = MinesweeperModel(3, 3, 1)
+    second_model = MinesweeperModel(3, 3, 1)
+
+    # Act
+    first_model._reveal_cell(0, 1)
+    first_model._reveal_cell(2, 2)
+    second_model._reveal_cell(2, 2)
+    second_model._reveal_cell(0, 1)
+
+    # Assert
+    assert first_model.state_hash == second_model.state_hash
+
+
+def test_state_hash_after_reveal_all_cells():
+    # Arrange
+    model = MinesweeperModel(2, 2, 1)
+    model._is_first_click = False
+    model._mark_cell(0, 0)
+    model._reveal_cell(1, 1)
+    in_progress_hash = model.state_hash
+
+    other_model = MinesweeperModel(2, 2, 1)
+    other_model._reveal_cell(0, 1)
+    other_size_model = MinesweeperModel(3, 3, 1)
+
+    # Act
+    model._reveal_all_cells()
+    other_model._reveal_all_cells()
+    other_size_model._reveal_all_cells()
+
+    # Assert
+    assert model.state_hash == other_model.state_hash
+    assert model.state_hash != in_progress_hash
+    assert model.state_hash != other_size_model.state_hash
+
+
+def test_pregenerate_layout():
+    # Act
+    layout = MinesweeperModel.pregenerate_layout(4, 5, 6)
+
+    # Assert
+    assert (layout.rows, layout.cols) == (4, 5)
+    assert len(set(layout.mine_positions)) == 6
+    for row, col in layout.mine_positions:
+        assert layout.board[row][col].is_mine == True
+
+
+def test_relocate_mines_from_revealed_cells():
+    # Arrange
+    layout = MinesweeperModel.pregenerate_layout(4, 4, 5)
+    clicked_row, clicked_col = layout.mine_positions[0]
+    model = MinesweeperModel(4, 4, 5, layout=layout)
+
+    expected_model = MinesweeperModel(4, 4, 5)
+
+    # Act
+    model(clicked_row, clicked_col, ActionType.OPEN)
+
+    # Assert
+    assert model._board[clicked_row][clicked_col].is_mine == False
+    assert len(set(model._mine_positions)) == 5
+
+    for row, col in model._mine_positions:
+        expected_model._board[row][col].is_mine = True
+    expected_model._set_num_of_mines_around()
+
+    for row in range(4):
+        for col in range(4):
+            assert model._board[row][col].is_mine == expected_model._board[row][col].is_mine
+            assert (
+                model._board[row][col].num_of_mines_around == expected_model._board[row][col].num_of_mines_around
+            )
+
+
+def test_layout_with_other_size():
+    # Arrange
+    layout = MinesweeperModel.pregenerate_layout(3, 3, 1)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        MinesweeperModel(4, 4, 1, layout=layout)
+
+
+def test_reveal_all_cells_collects_mines_and_wrong_flags():
+    # Arrange
+    model = MinesweeperModel(3, 3, 2)
+    model._is_first_click = False
+    for row, col in [(0, 0), (2, 2)]:
+        model._board[row][col].is_mine = True
+        model._mine_positions.append((row, col))
+
+    model._mark_cell(0, 0)
+    model._mark_cell(1, 1)
+
+    # Act
+    model._reveal_all_cells()
+
+    # Assert
+    assert model._game_over_reveal.mines == [(0, 0), (2, 2)]
+    assert model._game_over_reveal.wrong_flags == [(1, 1)]
+    assert model.get_visible_cell(0, 0) == VisibleCell.MINE
+
+
+def test_click_after_gameover():
+    # Arrange
+    model = MinesweeperModel(3, 3, 1)
+    model._reveal_all_cells()
+
+    # Act
+    response = model(0, 0, ActionType.OPEN)
+
+    # Assert
+    assert response.is_gameover == True
+    assert model._board[0][0].is_revealed == False
+    assert response.game_over_reveal is model._game_over_reveal
+
+
+def test_changed_cells_in_response():
+    # Arrange
+    model = MinesweeperModel(3, 3, 1)
+    model._is_first_click = False
+    model._board[0][0].is_mine = True
+    model._set_num_of_mines_around()
+
+    # Act
+    mark_response = model(0, 0, ActionType.MARK)
+    open_response = model(2, 2, ActionType.OPEN)
+
+    # Assert
+    assert mark_response.changed_cells == [(0, 0)]
+    assert sorted(open_response.changed_cells) == [(r, c) for r in range(3) for c in range(3) if (r, c) != (0, 0)]
+
+
+def test_snapshot_round_trip():
+    # Arrange
+    model = MinesweeperModel(8, 8, 10, seed=3)
+    model(4, 4, ActionType.OPEN)
+    hidden = [(r, c) for r in range(8) for c in range(8) if model.get_visible_cell(r, c) == VisibleCell.HIDDEN]
+    model(*hidden[0], ActionType.MARK)
+
+    # Act
+    restored = MinesweeperModel.from_snapshot(model.to_snapshot())
+
+    # Assert
+    assert restored.get_visible_board() == model.get_visible_board()
+    assert restored.state_hash == model.state_hash
+    assert all(restored.is_mine(r, c) == model.is_mine(r, c) for r in range(8) for c in range(8))
+
+
+def test_snapshot_before_first_click_keeps_seed():
+    # Arrange
+    model = MinesweeperModel(8, 8, 10, seed=5)
+
+    # Act
+    restored = MinesweeperModel.from_snapshot(model.to_snapshot(), seed=5)
+    restored(0, 0, ActionType.OPEN)
+    model(0, 0, ActionType.OPEN)
+
+    # Assert
+    assert restored.get_visible_board() == model.get_visible_board()
+
+
+def test_first_click_with_zero_budget_counts_lazily():
+    # Arrange
+    model = MinesweeperModel(30, 30, 150, seed=7)
+    model.first_click_budget_ms = 0
+    reference = MinesweeperModel(30, 30, 150, seed=7)
+    reference.first_click_budget_ms = None
+
+    # Act
+    model(15, 15, ActionType.OPEN)
+    reference(15, 15, ActionType.OPEN)
+
+    # Assert
+    assert model.is_prepared == False
+    assert reference.is_prepared == True
+    assert model.get_visible_board() == reference.get_visible_board()
+
+
+def test_finish_preparation():
+    # Arrange
+    model = MinesweeperModel(30, 30, 150, seed=7)
+    model.first_click_budget_ms = 0
+    model.count_chunk = 100
+    model(15, 15, ActionType.OPEN)
+
+    # Act
+    is_prepared = model.finish_preparation()
+
+    # Assert
+    assert is_prepared == model.is_prepared == True
+    counts = [[cell.num_of_mines_around for cell in list_of_cells] for list_of_cells in model._board]
+    model._set_num_of_mines_around()
+    assert counts == [[cell.num_of_mines_around for cell in list_of_cells] for list_of_cells in model._board]
+    assert model.throughput['counts'].cells > 0
+
+
+def test_gameover_before_preparation_shows_counts():
+    # Arrange
+    model = MinesweeperModel(30, 30, 150, seed=7)
+    model.first_click_budget_ms = 0
+    reference = MinesweeperModel(30, 30, 150, seed=7)
+    reference.first_click_budget_ms = None
+    model(15, 15, ActionType.OPEN)
+    reference(15, 15, ActionType.OPEN)
+    mine = next((r, c) for r in range(30) for c in range(30) if model.is_mine(r, c))
+
+    # Act
+    response = model(*mine, ActionType.OPEN)
+    reference(*mine, ActionType.OPEN)
+
+    # Assert
+    assert response.is_gameover == True
+    assert model.get_visible_board() == reference.get_visible_board()
+
+
+def test_first_click_throughput():
+    # Arrange
+    model = MinesweeperModel(30, 30, 150, seed=7)
+
+    # Act
+    model(15, 15, ActionType.OPEN)
+
+    # Assert
+    assert set(model.throughput) == {'placement', 'flood_fill', 'counts', 'game_result'}
+    assert model.throughput['placement'].cells == model.mines
+    assert model.throughput['flood_fill'].cells >= 1
+
+
+@pytest.mark.parametrize('budget_ms', [0, 16.0])
+def test_same_game_for_any_first_click_budget(budget_ms):
+    # Arrange
+    actions = [(100, 100, ActionType.OPEN), (165, 58, ActionType.MARK), (165, 58, ActionType.OPEN)]
+    reference = MinesweeperModel(200, 200, 2000, seed=11)
+    reference.first_click_budget_ms = None
+    model = MinesweeperModel(200, 200, 2000, seed=11)
+    model.first_click_budget_ms = budget_ms
+
+    # Act
+    for row, col, action_type in actions:
+        reference(row, col, action_type)
+        model(row, col, action_type)
+
+    # Assert
+    assert model.state_hash == reference.state_hash
+    assert model.get_visible_board() == reference.get_visible_board()
+
+
+def test_snapshot_of_other_topology():
+    # Arrange
+    model = MinesweeperModel(4, 4, 2, topology=TorusTopology(4, 4))
+    model(0, 0, ActionType.OPEN)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        model.to_snapshot()
+
+
+def test_played_cell_stays_hidden_after_gameover():
+    # Arrange
+    model = MinesweeperModel(8, 8, 10, seed=3)
+    model(4, 4, ActionType.OPEN)
+    cells = [(r, c) for r in range(8) for c in range(8)]
+    before = {(r, c): model.get_visible_cell(r, c) for r, c in cells}
+    mine = next((r, c) for r, c in cells if model.is_mine(r, c))
+
+    # Act
+    response = model(*mine, ActionType.OPEN)
+
+    # Assert
+    untouched = [row_col for row_col in cells if row_col not in set(response.changed_cells)]
+    assert response.is_gameover == True
+    assert all(model.get_played_cell(r, c) == before[r, c] for r, c in untouched)
+    assert any(model.get_visible_cell(r, c) != before[r, c] for r, c in untouched)
@@ -0,0 +1,110 @@
+"""Модуль для тестирования планировщика отрисовки"""
+
+__author__ = 'Шеряков'
+
+from src.enums import Tile
+from src.render_scheduler import RenderScheduler
+
+
+class FakeRoot:
+    """Заменяет планирование Tk: запоминает отложенные вызовы"""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def after(self, _delay_ms, callback):
+        return self.after_idle(callback)
+
+    def after_idle(self, callback):
+        after_id = f'after#{len(self.callbacks)}'
+        self.callbacks[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def run(self):
+        while self.callbacks:
+            self.callbacks.pop(next(iter(self.callbacks)))()
+
+
+class FakeCell:
+    """Заменяет gui клетку: считает вызовы configure"""
+
+    def __init__(self):
+        self.configure_calls = []
+
+    def configure(self, **kwargs):
+        self.configure_calls.append(kwargs)
+
+
+def create_scheduler(states):
+    root = FakeRoot()
+    cells = {row_col: FakeCell() for row_col in states}
+    scheduler = RenderScheduler(
+        root, lambda r, c: cells[(r, c)], lambda r, c: states[(r, c)], lambda tile: f'{tile}.png'
+    )
+
+    return root, cells, scheduler
+
+
+def test_mark_dirty_coalesces_updates():
+    # Arrange
+    states = {(0, 0): Tile.ONE, (0, 1): Tile.FLAG}
+    root, cells, scheduler = create_scheduler(states)
+
+    # Act
+    scheduler.mark_dirty([(0, 0)])
+    scheduler.mark_dirty([(0, 0), (0, 1)])
+    root.run()
+
+    # Assert
+    assert cells[(0, 0)].configure_calls == [{'image': '1.png'}]
+    assert cells[(0, 1)].configure_calls == [{'image': 'flag.png'}]
+
+
+def test_flush_skips_unchanged_cells():
+    # Arrange
+    states = {(0, 0): Tile.HIDDEN, (0, 1): Tile.TWO}
+    root, cells, scheduler = create_scheduler(states)
+    scheduler.mark_dirty(states)
+    root.run()
+
+    # Act
+    scheduler.mark_dirty(states)
+    root.run()
+
+    # Assert
+    assert cells[(0, 0)].configure_calls == []
+    assert len(cells[(0, 1)].configure_calls) == 1
+
+
+def test_flush_with_budget_moves_rest_to_next_frame():
+    # Arrange
+    states = {(0, col): Tile.ONE for col in range(1000)}
+    root, cells, scheduler = create_scheduler(states)
+    scheduler.mark_dirty(states)
+
+    # Act
+    scheduler.flush(budget_ms=0)
+
+    # Assert
+    assert sum(len(cell.configure_calls) for cell in cells.values()) == 0
+    assert len(root.callbacks) == 1
+
+    root.run()
+    assert all(len(cell.configure_calls) == 1 for cell in cells.values())
+
+
+def test_reset():
+    # Arrange
+    states = {(0, 0): Tile.ONE}
+    root, cells, scheduler = create_scheduler(states)
+    scheduler.mark_dirty(states)
+
+    # Act
+    scheduler.reset()
+    root.run()
+
+    # Assert
+    assert cells[(0, 0)].configure_calls == []
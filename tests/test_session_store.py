@@ -0,0 +1,134 @@
+"""Модуль для тестирования хранилища сессий"""
+
+__author__ = 'Шеряков'
+
+import pytest
+
+from src.enums import ActionType
+from src.session_store import SessionStore
+
+ACTIONS = [(0, 0, ActionType.OPEN), (7, 7, ActionType.MARK), (3, 5, ActionType.OPEN), (6, 1, ActionType.OPEN)]
+
+
+def play(store, sessions, actions):
+    for index in range(sessions):
+        session_id = f's{index}'
+        if session_id not in store:
+            store.create(session_id, 8, 8, 10, seed=index)
+        for row, col, action_type in actions:
+            store.apply(session_id, row, col, action_type)
+
+    return {f's{index}': store.get(f's{index}').state_hash for index in range(sessions)}
+
+
+@pytest.mark.parametrize('workers', [0, 1, 2])
+def test_recover_replays_log(tmp_path, workers):
+    # Arrange
+    with SessionStore(tmp_path) as store:
+        hashes = play(store, 10, ACTIONS)
+
+    # Act
+    with SessionStore.recover(tmp_path, workers=workers) as recovered:
+        recovered_hashes = {session_id: recovered.get(session_id).state_hash for session_id in hashes}
+
+    # Assert
+    assert recovered_hashes == hashes
+
+
+def test_recover_from_snapshot_and_tail(tmp_path):
+    # Arrange
+    with SessionStore(tmp_path) as store:
+        play(store, 5, ACTIONS[:2])
+        store.checkpoint()
+        hashes = play(store, 5, ACTIONS[2:])
+    files = sorted(path.name for path in tmp_path.iterdir())
+
+    # Act
+    with SessionStore.recover(tmp_path, workers=1) as recovered:
+        recovered_hashes = {session_id: recovered.get(session_id).state_hash for session_id in hashes}
+
+    # Assert
+    assert files == ['events-00000001.log', 'snapshot-00000001.jsonl']
+    assert recovered_hashes == hashes
+
+
+def test_automatic_checkpoint_and_delete(tmp_path):
+    # Arrange
+    with SessionStore(tmp_path, snapshot_every=7) as store:
+        hashes = play(store, 4, ACTIONS)
+        store.delete('s0')
+    del hashes['s0']
+
+    # Act
+    with SessionStore.recover(tmp_path, workers=1) as recovered:
+        recovered_hashes = {session_id: recovered.get(session_id).state_hash for session_id in hashes}
+
+    # Assert
+    assert len(recovered) == 3
+    assert recovered_hashes == hashes
+
+
+def test_recover_ignores_torn_last_record(tmp_path):
+    # Arrange
+    with SessionStore(tmp_path) as store:
+        hashes = play(store, 2, ACTIONS)
+    with (tmp_path / 'events-00000000.log').open('a') as file:
+        file.write('{"id":"s0","act')
+
+    # Act
+    with SessionStore.recover(tmp_path, workers=1) as recovered:
+        recovered_hashes = {session_id: recovered.get(session_id).state_hash for session_id in hashes}
+
+    # Assert
+    assert recovered_hashes == hashes
+
+
+def test_create_existing_session(tmp_path):
+    # Arrange
+    with SessionStore(tmp_path) as store:
+        store.create('s0', 8, 8, 10)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            store.create('s0', 8, 8, 10)
+
+
+@pytest.mark.parametrize(
+    'row, col, action_type',
+    [
+        (99, 99, ActionType.OPEN),
+        (-1, 0, ActionType.MARK),
+        (0, 0, 'jump'),
+    ]
+)
+def test_invalid_action_keeps_store_recoverable(tmp_path, row, col, action_type):
+    # Arrange
+    with SessionStore(tmp_path) as store:
+        hashes = play(store, 2, ACTIONS)
+
+        # Act
+        with pytest.raises(ValueError):
+            store.apply('s0', row, col, action_type)
+
+    # Assert
+    for workers in (0, 2):
+        with SessionStore.recover(tmp_path, workers=workers) as recovered:
+            assert {session_id: recovered.get(session_id).state_hash for session_id in hashes} == hashes
+
+
+def test_recover_is_lazy_and_removes_stale_temporary_snapshot(tmp_path):
+    # Arrange
+    with SessionStore(tmp_path) as store:
+        hashes = play(store, 3, ACTIONS)
+        store.checkpoint()
+    (tmp_path / 'snapshot-00000005.tmp').write_text('{"id":"s0","crea')
+
+    # Act
+    with SessionStore.recover(tmp_path) as recovered:
+        models_after_recover = len(recovered._models)
+        recovered_hashes = {session_id: recovered.get(session_id).state_hash for session_id in hashes}
+
+    # Assert
+    assert models_after_recover == 0
+    assert recovered_hashes == hashes
+    assert not list(tmp_path.glob('*.tmp'))
@@ -0,0 +1,87 @@
+"""Модуль для тестирования политик игры"""
+
+__author__ = 'Шеряков'
+
+from random import Random
+
+import pytest
+
+from src.enums import ActionType, VisibleCell
+from src.model import MinesweeperModel
+from src.solver import RandomPolicy, SinglePointPolicy, get_neighbours, play_game
+
+H = VisibleCell.HIDDEN
+F = VisibleCell.FLAG
+
+
+def test_single_point_policy_marks_mines():
+    # Arrange
+    visible_board = [
+        [1, H],
+        [1, 1],
+    ]
+
+    # Act
+    moves = SinglePointPolicy()(visible_board, Random(0))
+
+    # Assert
+    assert moves == [(0, 1, ActionType.MARK)]
+
+
+def test_single_point_policy_opens_safe_cells():
+    # Arrange
+    visible_board = [
+        [1, F, H],
+        [1, 1, H],
+        [0, 1, H],
+    ]
+
+    # Act
+    moves = SinglePointPolicy()(visible_board, Random(0))
+
+    # Assert
+    assert sorted(moves) == [(0, 2, ActionType.OPEN), (1, 2, ActionType.OPEN), (2, 2, ActionType.OPEN)]
+
+
+def test_random_policy_opens_hidden_cell():
+    # Arrange
+    visible_board = [
+        [0, 0],
+        [0, H],
+    ]
+
+    # Act
+    moves = RandomPolicy()(visible_board, Random(0))
+
+    # Assert
+    assert moves == [(1, 1, ActionType.OPEN)]
+
+
+@pytest.mark.parametrize(
+    'row, col, exp_len',
+    [
+        (0, 0, 3),
+        (0, 1, 5),
+        (1, 1, 8),
+    ]
+)
+def test_get_neighbours(row, col, exp_len):
+    # Act
+    neighbours = get_neighbours(3, 3, row, col)
+
+    # Assert
+    assert len(neighbours) == exp_len
+    assert (row, col) not in neighbours
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_play_game(seed):
+    # Arrange
+    model = MinesweeperModel(8, 8, 10, seed=seed)
+
+    # Act
+    is_win = play_game(model, SinglePointPolicy(), Random(seed))
+
+    # Assert
+    assert model._is_gameover == True
+    assert model._is_win == is_win
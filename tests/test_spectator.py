@@ -0,0 +1,137 @@
+"""Модуль для тестирования трансляции зрителям"""
+
+__author__ = 'Шеряков'
+
+from random import Random
+
+from src.enums import ActionType, FrameType, OverflowPolicy, VisibleCell
+from src.model import MinesweeperModel
+from src.solver import SinglePointPolicy
+from src.spectator import SpectatorHub, apply_frame, decode_frame, encode_delta
+
+
+def play(hub, on_step=lambda: None):
+    rng = Random(0)
+    policy = SinglePointPolicy()
+    while not hub.model.is_gameover:
+        for row, col, action_type in policy(hub.model.get_visible_board(), rng):
+            if hub.model.get_visible_cell(row, col) == -1 and hub(row, col, action_type).is_gameover:
+                break
+        on_step()
+
+
+def spectator_board(model):
+    board = model.get_played_board()
+    for row, col in model.game_over_reveal.mines:
+        board[row][col] = VisibleCell.MINE
+    for row, col in model.game_over_reveal.wrong_flags:
+        board[row][col] = VisibleCell.WRONG_FLAG
+    return board
+
+
+def test_encode_delta_round_trip():
+    # Arrange
+    model = MinesweeperModel(3, 4, 1)
+    model._is_first_click = False
+    model._board[0][0].is_mine = True
+    model._set_num_of_mines_around()
+    response = model(2, 3, ActionType.OPEN)
+
+    # Act
+    frame = decode_frame(encode_delta(model, 7, response.changed_cells))
+
+    # Assert
+    assert frame.frame_type == FrameType.DELTA
+    assert frame.sequence == 7
+    assert (frame.rows, frame.cols) == (3, 4)
+    assert frame.is_win and frame.is_gameover
+    assert sorted(frame.cells) == sorted((row * 4 + col, model.get_visible_cell(row, col))
+                                         for row, col in response.changed_cells)
+
+
+def test_subscribers_follow_the_game():
+    # Arrange
+    hub = SpectatorHub(MinesweeperModel(9, 9, 10, seed=1))
+    early = hub.subscribe()
+    boards = {early: None}
+
+    def consume():
+        for subscriber in boards:
+            for frame in subscriber.drain():
+                boards[subscriber] = apply_frame(boards[subscriber], frame)
+
+    hub(4, 4, ActionType.OPEN)
+    late = hub.subscribe()
+    boards[late] = None
+
+    # Act
+    play(hub, consume)
+    consume()
+
+    # Assert
+    assert boards[early] == boards[late] == spectator_board(hub.model)
+
+
+def test_slow_subscriber_gets_snapshot():
+    # Arrange
+    hub = SpectatorHub(MinesweeperModel(9, 9, 10, seed=2), queue_size=2, overflow=OverflowPolicy.RESYNC)
+    slow = hub.subscribe()
+
+    # Act
+    play(hub)
+    board = None
+    for frame in slow.drain():
+        board = apply_frame(board, frame)
+
+    # Assert
+    assert hub.sequence > 2
+    assert slow.resyncs > 0
+    assert board == spectator_board(hub.model)
+
+
+def test_slow_subscriber_dropped():
+    # Arrange
+    hub = SpectatorHub(MinesweeperModel(9, 9, 10, seed=2), queue_size=1, overflow=OverflowPolicy.DROP)
+    slow = hub.subscribe()
+
+    # Act
+    hub(4, 4, ActionType.OPEN)
+
+    # Assert
+    assert slow.is_closed
+    assert len(hub) == 0
+
+
+def test_gameover_frame_is_delta_with_mines_and_wrong_flags():
+    # Arrange
+    hub = SpectatorHub(MinesweeperModel(9, 9, 10, seed=1))
+    hub(4, 4, ActionType.OPEN)
+    hidden = [(r, c) for r in range(9) for c in range(9) if hub.model.get_visible_cell(r, c) == VisibleCell.HIDDEN]
+    wrong_flag = next((r, c) for r, c in hidden if not hub.model.is_mine(r, c))
+    mine = next((r, c) for r, c in hidden if hub.model.is_mine(r, c))
+    hub(*wrong_flag, ActionType.MARK)
+    subscriber = hub.subscribe()
+
+    # Act
+    response = hub(*mine, ActionType.OPEN)
+    frame = decode_frame(subscriber.drain()[-1])
+
+    # Assert
+    cells = dict(frame.cells)
+    assert frame.frame_type == FrameType.DELTA
+    assert frame.is_gameover and not frame.is_win
+    assert cells[wrong_flag[0] * 9 + wrong_flag[1]] == VisibleCell.WRONG_FLAG
+    assert all(cells[r * 9 + c] == VisibleCell.MINE for r, c in response.game_over_reveal.mines)
+    assert len(cells) == len(set(response.changed_cells) | set(response.game_over_reveal.mines) | {wrong_flag})
+
+
+def test_frame_header_fits_wide_board():
+    # Arrange
+    model = MinesweeperModel(1, 70_000, 1, seed=0)
+    response = model(0, 0, ActionType.OPEN)
+
+    # Act
+    frame = decode_frame(encode_delta(model, 1, response.changed_cells))
+
+    # Assert
+    assert (frame.rows, frame.cols) == (1, 70_000)
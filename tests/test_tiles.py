@@ -0,0 +1,37 @@
+"""Модуль для тестирования изображений клеток"""
+
+__author__ = 'Шеряков'
+
+import pytest
+
+from src.enums import Tile
+from src.tiles import TILE_SIZE, ZOOM_LEVELS, get_tile_pixels
+
+
+@pytest.mark.parametrize('zoom', ZOOM_LEVELS)
+def test_tile_size(zoom):
+    # Act
+    pixels = get_tile_pixels(Tile.FLAG, zoom)
+
+    # Assert
+    assert len(pixels) == TILE_SIZE * zoom
+    assert all(len(row) == TILE_SIZE * zoom for row in pixels)
+
+
+def test_zoom_scales_pixels():
+    # Act
+    small = get_tile_pixels(Tile.THREE, 1)
+    large = get_tile_pixels(Tile.THREE, 2)
+
+    # Assert
+    assert all(large[2 * y][2 * x] == large[2 * y + 1][2 * x + 1] == small[y][x]
+               for y in range(TILE_SIZE) for x in range(TILE_SIZE))
+
+
+def test_tiles_are_distinct_and_cached():
+    # Act
+    tiles = [get_tile_pixels(tile, 1) for tile in Tile]
+
+    # Assert
+    assert len(set(tiles)) == len(Tile)
+    assert get_tile_pixels(Tile.MINE, 2) is get_tile_pixels(Tile.MINE, 2)
@@ -0,0 +1,101 @@
+"""Модуль для тестирования топологий поля"""
+
+__author__ = 'Шеряков'
+
+import json
+
+import pytest
+
+from src.enums import ActionType
+from src.model import MinesweeperModel
+from src.topology import GraphTopology, HexTopology, RectangleTopology, TorusTopology
+
+
+@pytest.mark.parametrize(
+    'row, col, exp_len',
+    [
+        (0, 0, 3),
+        (0, 2, 5),
+        (2, 2, 8),
+    ]
+)
+def test_rectangle_topology(row, col, exp_len):
+    # Act
+    neighbours = RectangleTopology(5, 5).neighbours(row, col)
+
+    # Assert
+    assert len(neighbours) == exp_len
+    assert (row, col) not in neighbours
+
+
+def test_torus_topology():
+    # Act
+    neighbours = TorusTopology(5, 5).neighbours(0, 0)
+
+    # Assert
+    assert sorted(neighbours) == [(0, 1), (0, 4), (1, 0), (1, 1), (1, 4), (4, 0), (4, 1), (4, 4)]
+
+
+@pytest.mark.parametrize(
+    'row, col, exp_neighbours',
+    [
+        (2, 2, [(1, 1), (1, 2), (2, 1), (2, 3), (3, 1), (3, 2)]),
+        (1, 2, [(0, 2), (0, 3), (1, 1), (1, 3), (2, 2), (2, 3)]),
+        (0, 0, [(0, 1), (1, 0)]),
+    ]
+)
+def test_hex_topology(row, col, exp_neighbours):
+    # Act
+    neighbours = HexTopology(5, 5).neighbours(row, col)
+
+    # Assert
+    assert sorted(neighbours) == exp_neighbours
+
+
+def test_graph_topology_from_file(tmp_path):
+    # Arrange
+    path = tmp_path / 'graph.json'
+    path.write_text(json.dumps({'rows': 1, 'cols': 3, 'adjacency': [[1], [0, 2], [1]]}))
+
+    # Act
+    topology = GraphTopology.from_file(path)
+
+    # Assert
+    assert topology.neighbours(0, 1) == ((0, 0), (0, 2))
+
+
+@pytest.mark.parametrize(
+    'adjacency',
+    [
+        [[5], [0], []],            # Индекс вне поля
+        [[1], [], [1]],            # Ребро только в одну сторону
+        [[0, 1], [0], []],         # Петля
+        [[1, 1], [0, 0], []],      # Повторяющийся сосед
+    ]
+)
+def test_graph_topology_with_wrong_adjacency(adjacency):
+    # Act, Assert
+    with pytest.raises(ValueError):
+        GraphTopology(1, 3, adjacency)
+
+
+def test_model_with_torus_topology():
+    # Arrange
+    model = MinesweeperModel(4, 4, 1, topology=TorusTopology(4, 4))
+    model._is_first_click = False
+    model._board[0][0].is_mine = True
+    model._set_num_of_mines_around()
+
+    # Act
+    model(2, 2, ActionType.OPEN)
+
+    # Assert
+    assert model._board[3][3].num_of_mines_around == 1
+    assert model._board[0][3].num_of_mines_around == 1
+    assert model.is_win == True
+
+
+def test_model_with_other_size_topology():
+    # Act, Assert
+    with pytest.raises(ValueError):
+        MinesweeperModel(4, 4, 1, topology=HexTopology(3, 3))
@@ -0,0 +1,47 @@
+"""Модуль для тестирования оценки вероятности победы"""
+
+__author__ = 'Шеряков'
+
+import pytest
+
+from src.win_rate import estimate_win_rate, play_batch, wilson_interval
+
+
+@pytest.mark.parametrize(
+    'wins, games',
+    [
+        (0, 10),
+        (5, 10),
+        (10, 10),
+    ]
+)
+def test_wilson_interval(wins, games):
+    # Act
+    low, high = wilson_interval(wins, games)
+
+    # Assert
+    assert 0.0 <= low <= wins / games <= high <= 1.0
+
+
+def test_play_batch_is_reproducible():
+    # Act
+    first_wins = play_batch(5, 5, 3, 'single_point', '0:0', 10)
+    second_wins = play_batch(5, 5, 3, 'single_point', '0:0', 10)
+
+    # Assert
+    assert first_wins == second_wins
+
+
+def test_estimate_win_rate_uses_cache(tmp_path):
+    # Arrange
+    params = dict(precision=0.2, max_games=40, batch_size=10, workers=2, cache_dir=tmp_path)
+
+    # Act
+    estimates = list(estimate_win_rate(5, 5, 3, 'single_point', **params))
+    cached_estimates = list(estimate_win_rate(5, 5, 3, 'single_point', **params))
+
+    # Assert
+    assert estimates[-1].games <= 40
+    assert estimates[-1].half_width <= 0.2 or estimates[-1].games == 40
+    assert [estimate.games for estimate in estimates] == sorted(estimate.games for estimate in estimates)
+    assert cached_estimates == [estimates[-1]]